@@ -0,0 +1,115 @@
+# Benchmark of the headless search command.
+#
+# Runs `streaming-tui search QUERY --json` in a fresh process against a fake
+# TMDB served locally, which answers every request after REQUEST_LATENCY
+# seconds. Reports the wall time from starting the process until the first
+# JSON line and until the process exits, on a cold run with an empty cache
+# and a warm run where the details are cached.
+#
+# Run with: python -m benchmarks.bench_cli_search
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+QUERY = "batman"
+
+RESULTS = 10
+
+REQUEST_LATENCY = 0.1
+
+
+class FakeTMDB(BaseHTTPRequestHandler):
+    """Answers TMDB searches and movie details with made-up titles."""
+
+    def do_GET(self) -> None:
+        time.sleep(REQUEST_LATENCY)
+        path = self.path.split("?")[0]
+        if path == "/search/multi":
+            body = {
+                "results": [
+                    {"id": i, "media_type": "movie", "title": f"Batman {i}"}
+                    for i in range(1, RESULTS + 1)
+                ]
+            }
+        else:
+            movie_id = int(path.rsplit("/", 1)[1])
+            body = {
+                "id": movie_id,
+                "title": f"Batman {movie_id}",
+                "release_date": "2022-03-04",
+                "watch/providers": {
+                    "results": {
+                        "DK": {
+                            "link": "https://example.com",
+                            "flatrate": [
+                                {"provider_id": 8, "provider_name": "Netflix"}
+                            ],
+                        }
+                    }
+                },
+            }
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def run_search(env: dict[str, str]) -> tuple[float, float, int]:
+    """Run the command, timing the first line and exit in ms."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streaming_overview_tui.run", "search", QUERY, "--json"],
+        env=env,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    first = None
+    lines = 0
+    for _ in process.stdout:
+        if first is None:
+            first = time.perf_counter()
+        lines += 1
+    process.wait()
+    end = time.perf_counter()
+    return (first - start) * 1000, (end - start) * 1000, lines
+
+
+def run() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeTMDB)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Searching {QUERY!r}, {RESULTS} results,", end=" ")
+    print(f"{REQUEST_LATENCY * 1000:.0f} ms per TMDB request")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        env = {
+            **os.environ,
+            "TMDB_URL": f"http://127.0.0.1:{server.server_port}",
+            "TMDB_BEARER_TOKEN": "benchmark",
+            "XDG_CONFIG_HOME": str(root / "config"),
+            "XDG_DATA_HOME": str(root / "data"),
+            "XDG_CACHE_HOME": str(root / "cache"),
+        }
+        for label in ("cold", "warm"):
+            first, total, lines = run_search(env)
+            print(
+                f"  {label}: first result {first:4.0f} ms, "
+                f"{lines} results and exit {total:4.0f} ms"
+            )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    run()
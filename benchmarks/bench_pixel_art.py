@@ -0,0 +1,86 @@
+# Micro-benchmark for the half-block poster converter.
+#
+# Compares the vectorised converter against the original per-cell loop on a
+# poster-like test image, reporting time per call, allocated memory blocks and
+# the number of styled spans in the output.
+#
+# Run with: python -m benchmarks.bench_pixel_art
+import timeit
+import tracemalloc
+
+import numpy as np
+from PIL import Image
+from rich.style import Style
+from rich.text import Text
+
+from streaming_overview_tui.tui_layer.widgets.pixel_art import image_to_half_blocks
+
+# Output sizes in characters (width, height)
+SIZES = [(12, 18), (40, 60), (120, 80)]
+
+REPEATS = 5
+
+
+def per_cell_half_blocks(image: Image.Image, width: int, height: int) -> Text:
+    """Original converter: one Style and one append per cell."""
+    resized = image.resize((width, height * 2), Image.Resampling.NEAREST)
+    if resized.mode != "RGB":
+        resized = resized.convert("RGB")
+
+    pixels = resized.load()
+    text = Text()
+    for char_row in range(height):
+        if char_row > 0:
+            text.append("\n")
+        for col in range(width):
+            top_color = pixels[col, char_row * 2]
+            bottom_color = pixels[col, char_row * 2 + 1]
+            bg_hex = "#{:02x}{:02x}{:02x}".format(*top_color)
+            fg_hex = "#{:02x}{:02x}{:02x}".format(*bottom_color)
+            text.append("▄", style=Style(color=fg_hex, bgcolor=bg_hex))
+    return text
+
+
+def make_poster(width: int = 500, height: int = 750) -> Image.Image:
+    """Poster-like test image: flat color blocks, with noise in the lower half."""
+    rng = np.random.default_rng(0)
+    blocks = rng.integers(0, 256, size=(15, 10, 3), dtype=np.uint8)
+    image = np.kron(blocks, np.ones((height // 15, width // 10, 1), dtype=np.uint8))
+    noise = rng.integers(0, 4, size=image.shape, dtype=np.uint8)
+    noise[: height // 2] = 0
+    return Image.fromarray(image | noise)
+
+
+def measure(converter, image: Image.Image, width: int, height: int) -> dict:
+    """Time a converter and count the memory blocks it allocates."""
+    seconds = min(
+        timeit.repeat(lambda: converter(image, width, height), number=1, repeat=REPEATS)
+    )
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    text = converter(image, width, height)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    return {"ms": seconds * 1000, "blocks": blocks, "spans": len(text.spans)}
+
+
+def main() -> None:
+    image = make_poster()
+    print(f"{'size':>8} {'converter':>10} {'ms':>9} {'blocks':>8} {'spans':>7}")
+    for width, height in SIZES:
+        for name, converter in (
+            ("per-cell", per_cell_half_blocks),
+            ("numpy", image_to_half_blocks),
+        ):
+            result = measure(converter, image, width, height)
+            print(
+                f"{width:>3}x{height:<4} {name:>10} {result['ms']:>9.2f} "
+                f"{result['blocks']:>8} {result['spans']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Terminal output per poster for each drawing backend.
+#
+# Half-blocks write an escape-coded cell for every color change, every time
+# the poster is painted. Kitty graphics send the image itself once, and later
+# repaints only place it.
+# Reports bytes written for the first paint of a poster and for each repaint
+# after it, at two display sizes. Each backend encodes the poster at the TMDB
+# size the widget downloads for it: w92 for half-blocks, and for kitty the
+# size covering the poster's cells at DEFAULT_CELL_PIXELS.
+#
+# Run with: python -m benchmarks.bench_poster_bytes
+import io
+import re
+
+from rich.console import Console
+from rich.segment import Segment
+
+from benchmarks.bench_pixel_art import make_poster
+from streaming_overview_tui.tui_layer.widgets.pixel_art import color_grid_to_strips
+from streaming_overview_tui.tui_layer.widgets.pixel_art import decode_image
+from streaming_overview_tui.tui_layer.widgets.pixel_art import image_to_color_grid
+from streaming_overview_tui.tui_layer.widgets.poster_widget import (
+    poster_download_url,
+)
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import (
+    DEFAULT_CELL_PIXELS,
+)
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import encode_kitty
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import kitty_place
+
+# Repaints counted in the total, e.g. while moving through results
+REPAINTS = 10
+
+# Display sizes in cells (columns, rows)
+SIZES = [(12, 18), (40, 60)]
+
+POSTER_URL = "https://image.tmdb.org/t/p/w500/poster.jpg"
+
+
+def downloaded(poster, url: str):
+    """Resize the poster to the width TMDB serves at a download URL."""
+    width = int(re.search(r"/w(\d+)/", url).group(1))
+    return poster.resize((width, width * 3 // 2))
+
+
+def half_block_bytes(image, columns: int, rows: int) -> int:
+    """Bytes of ANSI output for one paint of the half-block strips."""
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG")
+    # Decoded like the widget does, at the lowest resolution covering the cells
+    decoded = decode_image(buffer.getvalue(), columns, rows)
+    strips = color_grid_to_strips(image_to_color_grid(decoded, columns, rows))
+    console = Console(
+        width=columns, file=io.StringIO(), color_system="truecolor", record=False
+    )
+    segments = []
+    for strip in strips:
+        segments.extend(strip)
+        segments.append(Segment.line())
+    return len(console._render_buffer(segments).encode("utf-8"))
+
+
+def main() -> None:
+    poster = make_poster()
+    print(
+        f"{'size':>8} {'backend':>12} {'first':>9} {'repaint':>9} "
+        f"{f'{REPAINTS} paints':>10} {'vs half':>8}"
+    )
+    for columns, rows in SIZES:
+        half_url = poster_download_url(POSTER_URL)
+        kitty_url = poster_download_url(POSTER_URL, columns, rows, DEFAULT_CELL_PIXELS)
+        half = half_block_bytes(downloaded(poster, half_url), columns, rows)
+        kitty_image = downloaded(poster, kitty_url).convert("RGB")
+        kitty = len(encode_kitty(kitty_image, columns, rows, image_id=1))
+        results = [
+            ("half-blocks", half, half),
+            ("kitty", kitty, len(kitty_place(1, columns, rows))),
+        ]
+        half_total = half * REPAINTS
+        for name, first, repaint in results:
+            total = first + repaint * (REPAINTS - 1)
+            print(
+                f"{columns:>3}x{rows:<4} {name:>12} {first:>9} {repaint:>9} "
+                f"{total:>10} {total / half_total:>7.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
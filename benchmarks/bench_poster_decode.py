@@ -0,0 +1,65 @@
+# Benchmark for poster download size and decode time.
+#
+# Encodes a synthetic poster at each TMDB poster width as JPEG and compares
+# the bytes to download and the time to decode and convert it to the 12x18
+# half-block grid: the old path (w500, full decode) against the negotiated
+# size with draft-mode decoding.
+#
+# Run with: python -m benchmarks.bench_poster_decode
+import timeit
+from io import BytesIO
+
+from PIL import Image
+
+from benchmarks.bench_pixel_art import make_poster
+from streaming_overview_tui.data_layer.tmdb_images import pick_poster_size
+from streaming_overview_tui.tui_layer.widgets.pixel_art import decode_image
+from streaming_overview_tui.tui_layer.widgets.pixel_art import image_to_color_grid
+
+# Rendered poster size in characters
+WIDTH = 12
+HEIGHT = 18
+
+REPEATS = 20
+
+
+def encode_jpeg(width: int) -> bytes:
+    """Encode the test poster as a TMDB-like JPEG of the given width."""
+    image = make_poster().resize((width, round(width * 1.5)))
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+
+def full_decode(data: bytes) -> None:
+    image = Image.open(BytesIO(data))
+    image_to_color_grid(image, WIDTH, HEIGHT)
+
+
+def draft_decode(data: bytes) -> None:
+    image_to_color_grid(decode_image(data, WIDTH, HEIGHT), WIDTH, HEIGHT)
+
+
+def measure(decode, data: bytes) -> float:
+    """Best time per decode and convert in milliseconds."""
+    runs = timeit.repeat(lambda: decode(data), number=REPEATS, repeat=3)
+    return min(runs) / REPEATS * 1000
+
+
+def main() -> None:
+    size = pick_poster_size(WIDTH, HEIGHT * 2)
+    old = encode_jpeg(500)
+    new = encode_jpeg(int(size[1:]))
+
+    rows = [
+        ("w500, full decode", old, full_decode),
+        ("w500, draft decode", old, draft_decode),
+        (f"{size}, draft decode", new, draft_decode),
+    ]
+    print(f"{'path':>24} {'bytes':>8} {'ms':>7}")
+    for name, data, decode in rows:
+        print(f"{name:>24} {len(data):>8} {measure(decode, data):>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Benchmark of the cost of repainting a poster.
+#
+# A widget that returns Rich Text from render() has its content wrapped and
+# split into segments again on every refresh. A widget with a line API builds
+# its strips once per image and a refresh only looks them up. Reports the
+# one-off build cost and the per-refresh cost of both on a 40x60 poster.
+#
+# Run with: python -m benchmarks.bench_poster_refresh
+import io
+import timeit
+
+from rich.console import Console
+from textual.strip import Strip
+
+from benchmarks.bench_pixel_art import make_poster
+from streaming_overview_tui.tui_layer.widgets.pixel_art import color_grid_to_strips
+from streaming_overview_tui.tui_layer.widgets.pixel_art import color_grid_to_text
+from streaming_overview_tui.tui_layer.widgets.pixel_art import image_to_color_grid
+
+WIDTH = 40
+HEIGHT = 60
+
+REFRESHES = 200
+
+
+def refresh_text(console: Console, text) -> list[Strip]:
+    """What Textual does with render() output on each refresh."""
+    options = console.options.update_dimensions(WIDTH, HEIGHT)
+    lines = console.render_lines(text, options, pad=True)
+    return [Strip(line, WIDTH) for line in lines]
+
+
+def refresh_strips(strips: list[Strip]) -> list[Strip]:
+    """What a line-API widget does on each refresh."""
+    return [strips[y] for y in range(HEIGHT)]
+
+
+def main() -> None:
+    grid = image_to_color_grid(make_poster(), WIDTH, HEIGHT)
+    console = Console(
+        width=WIDTH, file=io.StringIO(), color_system="truecolor", legacy_windows=False
+    )
+
+    text = color_grid_to_text(grid)
+    strips = color_grid_to_strips(grid)
+
+    build_text = min(timeit.repeat(lambda: color_grid_to_text(grid), number=1))
+    build_strips = min(timeit.repeat(lambda: color_grid_to_strips(grid), number=1))
+    per_text = timeit.timeit(lambda: refresh_text(console, text), number=REFRESHES)
+    per_strips = timeit.timeit(lambda: refresh_strips(strips), number=REFRESHES)
+
+    print(f"poster {WIDTH}x{HEIGHT} cells, {REFRESHES} refreshes")
+    print(f"{'path':>8} {'build ms':>9} {'refresh us':>11}")
+    print(f"{'text':>8} {build_text * 1000:>9.2f} {per_text / REFRESHES * 1e6:>11.1f}")
+    print(
+        f"{'strips':>8} {build_strips * 1000:>9.2f} "
+        f"{per_strips / REFRESHES * 1e6:>11.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Benchmark of the results list with many rows.
+#
+# Mounts a ResultsList with 10k results in a headless app, then reports how
+# long it takes to show the results and the mean CPU time per key press while
+# paging and stepping through them. CPU time leaves out the test pilot's idle
+# waits between presses.
+#
+# Run with: python -m benchmarks.bench_results_list
+import asyncio
+import time
+
+from textual.app import App
+from textual.app import ComposeResult
+
+from streaming_overview_tui.search_engine.models import ContentItem
+from streaming_overview_tui.search_engine.models import SearchResult
+from streaming_overview_tui.tui_layer.widgets.results_list import ResultsList
+
+ROWS = 10_000
+
+KEY_PRESSES = 200
+
+
+class ResultsListApp(App):
+    def compose(self) -> ComposeResult:
+        yield ResultsList()
+
+
+def make_results(count: int) -> SearchResult:
+    items = [
+        ContentItem(
+            tmdb_id=i,
+            title=f"Movie {i}",
+            year=2000 + i % 25,
+            content_type="movie",
+            poster_url=None,
+            services=[],
+        )
+        for i in range(count)
+    ]
+    return SearchResult(
+        available=items[: count // 10], other=items[count // 10 :], error=None
+    )
+
+
+async def run() -> None:
+    results = make_results(ROWS)
+    async with ResultsListApp().run_test(size=(100, 40)) as pilot:
+        widget = pilot.app.query_one(ResultsList)
+        widget.focus()
+
+        start = time.perf_counter()
+        widget.results = results
+        await pilot.pause()
+        show_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{ROWS} rows, shown in {show_ms:.1f} ms")
+        for key in ("down", "pagedown"):
+            start = time.process_time()
+            for _ in range(KEY_PRESSES):
+                await pilot.press(key)
+            per_key = (time.process_time() - start) / KEY_PRESSES * 1000
+            print(f"{key:>9}: {per_key:.2f} ms CPU per key press")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
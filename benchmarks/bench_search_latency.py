@@ -0,0 +1,100 @@
+# Benchmark of time to first result while typing a search.
+#
+# Types "batman" into the main screen of a headless app at each of
+# TYPING_GAPS seconds per key, against a fake TMDB that answers searches after
+# SEARCH_LATENCY seconds. Reports the time from the last keystroke until
+# the first results are shown and until the final results are shown, with
+# and without speculative searches while typing.
+#
+# Run with: python -m benchmarks.bench_search_latency
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from textual.app import App
+from textual.app import ComposeResult
+
+from streaming_overview_tui.data_layer.models import TMDBSearchResult
+from streaming_overview_tui.search_engine.speculative import SpeculativeSearch
+from streaming_overview_tui.tui_layer.main_screen import MainScreen
+from streaming_overview_tui.tui_layer.widgets import ResultsList
+
+QUERY = "batman"
+
+TYPING_GAPS = (0.05, 0.12)
+
+SEARCH_LATENCY = 0.25
+
+TITLES = ["Batman", "The Batman", "Batman Begins", "Bad Boys", "Barbie", "Babe"]
+
+
+class FakeRepository:
+    """TMDB search with fixed latency and details served from cache."""
+
+    is_offline = False
+
+    async def search(self, query: str) -> list[TMDBSearchResult]:
+        await asyncio.sleep(SEARCH_LATENCY)
+        return [
+            TMDBSearchResult(
+                id=index,
+                title=title,
+                year=2000,
+                content_type="movie",
+                poster_path=None,
+                rating=None,
+            )
+            for index, title in enumerate(TITLES)
+            if query.lower() in title.lower()
+        ]
+
+    async def get_movie(self, movie_id: int) -> SimpleNamespace:
+        return SimpleNamespace(providers=[], overview="", rating=7.0)
+
+
+class SearchApp(App):
+    def compose(self) -> ComposeResult:
+        yield MainScreen()
+
+
+async def type_query(gap: float) -> tuple[float, float]:
+    """Type the query and time the first and final results, in ms."""
+    async with SearchApp().run_test() as pilot:
+        widget = pilot.app.query_one(ResultsList)
+        for char in QUERY:
+            await pilot.press(char)
+            await asyncio.sleep(gap)
+        last_key = time.perf_counter()
+
+        while not widget.results:
+            await asyncio.sleep(0.005)
+        first = time.perf_counter()
+        await pilot.app.workers.wait_for_complete()
+        final = time.perf_counter()
+        return (first - last_key) * 1000, (final - last_key) * 1000
+
+
+async def run() -> None:
+    with (
+        patch(
+            "streaming_overview_tui.search_engine.search.ContentRepository",
+            FakeRepository,
+        ),
+        patch(
+            "streaming_overview_tui.search_engine.speculative.ContentRepository",
+            FakeRepository,
+        ),
+    ):
+        for gap in TYPING_GAPS:
+            print(f"Typing {QUERY!r}, {gap * 1000:.0f} ms per key,", end=" ")
+            print(f"{SEARCH_LATENCY * 1000:.0f} ms search latency")
+            first, final = await type_query(gap)
+            print(f"  speculative: first result {first:.0f} ms, final {final:.0f} ms")
+            with patch.object(SpeculativeSearch, "update", lambda self, query: None):
+                first, final = await type_query(gap)
+            print(f"  off:         first result {first:.0f} ms, final {final:.0f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
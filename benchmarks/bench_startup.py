@@ -0,0 +1,109 @@
+# Benchmark of cold-start time to first frame.
+#
+# Starts the app headless in a fresh process with empty data and cache
+# directories and a saved config, so the database has to be created. Reports
+# the time from starting the process until the first frame is on screen and
+# until the database is ready, against FIRST_FRAME_TARGET_MS. The blocking
+# run prepares the database before the first frame, as startup used to.
+# The time to finish imports is reported too, as most of the wait is there.
+#
+# Run with: python -m benchmarks.bench_startup
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Cold-start time to first frame the app should stay under
+FIRST_FRAME_TARGET_MS = 800
+
+REPEATS = 5
+
+CHILD = """
+import os
+import sys
+
+from streaming_overview_tui.data_layer.scheduler import work_scheduler
+from streaming_overview_tui.tui_layer.stream_app import StreamApp
+
+BLOCKING = sys.argv[1] == "blocking"
+
+
+def report(event):
+    # Textual captures sys.stdout while running
+    os.write(1, f"{event}\\n".encode())
+
+
+report("imported")
+
+
+class TimedApp(StreamApp):
+    def on_mount(self):
+        if BLOCKING:
+            self._warm_up_storage()
+        super().on_mount()
+
+    async def on_ready(self):
+        super().on_ready()
+        report("frame")
+        await work_scheduler.join()
+        report("storage")
+        self.exit()
+
+
+TimedApp().run(headless=True)
+"""
+
+
+def start_once(mode: str) -> dict[str, float]:
+    """Start the app in a new process and time each startup event, in ms."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        config_dir = root / "config" / "streaming-overview-tui"
+        config_dir.mkdir(parents=True)
+        (config_dir / "stream_config.json").write_text(
+            json.dumps({"region": "DK", "subscriptions": ["Netflix"]})
+        )
+        env = {
+            **os.environ,
+            "XDG_CONFIG_HOME": str(root / "config"),
+            "XDG_DATA_HOME": str(root / "data"),
+            "XDG_CACHE_HOME": str(root / "cache"),
+        }
+
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-c", CHILD, mode],
+            env=env,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        times = {}
+        for line in process.stdout:
+            times[line.strip()] = (time.perf_counter() - start) * 1000
+        process.wait()
+        return times
+
+
+def run() -> None:
+    print(f"Cold start, median of {REPEATS} runs")
+    print(f"Target: first frame within {FIRST_FRAME_TARGET_MS} ms")
+    for mode in ("background", "blocking"):
+        runs = [start_once(mode) for _ in range(REPEATS)]
+        imported, frame, storage = (
+            statistics.median(r[event] for r in runs)
+            for event in ("imported", "frame", "storage")
+        )
+        verdict = "ok" if frame <= FIRST_FRAME_TARGET_MS else "over target"
+        print(
+            f"  {mode:<10}: imports {imported:4.0f} ms, "
+            f"first frame {frame:4.0f} ms ({verdict}), "
+            f"database ready {storage:4.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -3,9 +3,6 @@ from enum import Enum
 from pathlib import Path
 
 from platformdirs import user_config_dir
-from pydantic import Field
-from pydantic_settings import BaseSettings
-from pydantic_settings import SettingsConfigDict
 
 APP_NAME = "streaming-overview-tui"
 CONFIG_DIR = Path(user_config_dir(APP_NAME))
@@ -46,17 +43,22 @@ class UserConfig:
         )
 
 
-class AppSettings(BaseSettings):
-    """Application settings from environment variables."""
+class LazyAppSettings:
+    """Stands in for AppSettings until a setting is first read.
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    Importing pydantic-settings and reading .env is deferred, so commands
+    and modules that never read a setting do not pay for it.
+    """
 
-    tmdb_bearer_token: str | None = Field(default=None)
-    tmdb_url: str = Field(default="https://api.themoviedb.org/3")
+    def __init__(self):
+        self._settings = None  # AppSettings once loaded
+
+    def __getattr__(self, name: str):
+        if self._settings is None:
+            from streaming_overview_tui.config_layer.settings import AppSettings
+
+            self._settings = AppSettings()
+        return getattr(self._settings, name)
 
 
 def config_exists() -> bool:
@@ -86,5 +88,5 @@ def get_available_services() -> list[str]:
     return [service.value for service in StreamingService]
 
 
-# Global instance
-app_settings = AppSettings()
+# Global instance, loaded on first use
+app_settings = LazyAppSettings()
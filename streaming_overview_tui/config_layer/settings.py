@@ -0,0 +1,22 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+from pydantic_settings import SettingsConfigDict
+
+
+class AppSettings(BaseSettings):
+    """Application settings from environment variables."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    tmdb_bearer_token: str | None = Field(default=None)
+    tmdb_url: str = Field(default="https://api.themoviedb.org/3")
+    # Max TMDB requests the idle-time cache warmer may send per idle period
+    cache_warm_budget: int = Field(default=20)
+    # Worker processes for poster decoding, 0 decodes in a background thread
+    poster_decode_processes: int = Field(default=0)
+    # Poster drawing: "auto", "half-blocks" or "kitty"
+    poster_graphics: str = Field(default="auto")
@@ -1,15 +1,25 @@
-from streaming_overview_tui.data_layer.models import CachedMovie
-from streaming_overview_tui.data_layer.models import CachedShow
-from streaming_overview_tui.data_layer.models import Movie
-from streaming_overview_tui.data_layer.models import Show
-from streaming_overview_tui.data_layer.models import StreamingAvailability
-from streaming_overview_tui.data_layer.models import StreamingProvider
-from streaming_overview_tui.data_layer.models import TMDBSearchResult
-from streaming_overview_tui.data_layer.repository import ContentRepository
+import importlib
+
+# Module of each public name. They are imported on first use, so importing
+# a submodule such as the scheduler does not load SQLModel and httpx.
+_EXPORTS = {
+    "CachedMovie": "streaming_overview_tui.data_layer.models",
+    "CachedShow": "streaming_overview_tui.data_layer.models",
+    "CircuitBreaker": "streaming_overview_tui.data_layer.circuit_breaker",
+    "CircuitOpenError": "streaming_overview_tui.data_layer.circuit_breaker",
+    "ContentRepository": "streaming_overview_tui.data_layer.repository",
+    "Movie": "streaming_overview_tui.data_layer.models",
+    "TMDBSearchResult": "streaming_overview_tui.data_layer.models",
+    "Show": "streaming_overview_tui.data_layer.models",
+    "StreamingAvailability": "streaming_overview_tui.data_layer.models",
+    "StreamingProvider": "streaming_overview_tui.data_layer.models",
+}
 
 __all__ = [
     "CachedMovie",
     "CachedShow",
+    "CircuitBreaker",
+    "CircuitOpenError",
     "ContentRepository",
     "Movie",
     "TMDBSearchResult",
@@ -17,3 +27,13 @@ __all__ = [
     "StreamingAvailability",
     "StreamingProvider",
 ]
+
+
+def __getattr__(name: str):
+    """Import a public name from its module on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+import httpx
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import col
+from sqlmodel import select
+
+from streaming_overview_tui.config_layer import app_settings
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitOpenError
+from streaming_overview_tui.data_layer.database import get_session
+from streaming_overview_tui.data_layer.models import CachedMovie
+from streaming_overview_tui.data_layer.models import CachedShow
+from streaming_overview_tui.data_layer.repository import CACHE_TTL_DAYS
+from streaming_overview_tui.data_layer.repository import ContentRepository
+
+# Entries expiring within this many days are warmed
+WARM_WINDOW_DAYS = 3
+
+# Recently searched titles are warmed once their cache is this old
+RECENT_REFRESH_AGE = timedelta(days=1)
+
+# Number of recently searched titles remembered
+RECENT_TITLES_LIMIT = 100
+
+
+class CacheWarmer:
+    """Refreshes cache entries before they expire, within a request budget.
+
+    Recently searched titles come first, then entries nearest expiry.
+    """
+
+    def __init__(
+        self,
+        repository: ContentRepository | None = None,
+        budget: int | None = None,
+    ):
+        self._repository = repository
+        self.budget = app_settings.cache_warm_budget if budget is None else budget
+        # (content_type, content_id) -> None, most recent last
+        self._recent: OrderedDict[tuple[str, int], None] = OrderedDict()
+
+    def note_recent(self, content_type: str, content_id: int) -> None:
+        """Remember a title from a recent search."""
+        key = (content_type, content_id)
+        self._recent[key] = None
+        self._recent.move_to_end(key)
+        while len(self._recent) > RECENT_TITLES_LIMIT:
+            self._recent.popitem(last=False)
+
+    def candidates(self, limit: int) -> list[tuple[str, int]]:
+        """Get entries to refresh, most urgent first."""
+        now = datetime.now(timezone.utc)
+        expiring_before = now - timedelta(days=CACHE_TTL_DAYS - WARM_WINDOW_DAYS)
+        recent_before = now - RECENT_REFRESH_AGE
+
+        stale_recent: set[tuple[str, int]] = set()
+        expiring: list[tuple[datetime, tuple[str, int]]] = []
+        with get_session() as session:
+            for content_type, model in (("movie", CachedMovie), ("show", CachedShow)):
+                recent_ids = [i for t, i in self._recent if t == content_type]
+                rows = session.exec(
+                    select(model.id).where(
+                        col(model.id).in_(recent_ids),
+                        model.cached_at < recent_before,
+                    )
+                ).all()
+                stale_recent.update((content_type, i) for i in rows)
+
+                rows = session.exec(
+                    select(model.id, model.cached_at)
+                    .where(model.cached_at < expiring_before)
+                    .order_by(model.cached_at)
+                    .limit(limit)
+                ).all()
+                expiring.extend((cached_at, (content_type, i)) for i, cached_at in rows)
+
+        candidates = [key for key in reversed(self._recent) if key in stale_recent]
+        for _, key in sorted(expiring):
+            if key not in stale_recent:
+                candidates.append(key)
+        return candidates[:limit]
+
+    async def run(self, should_stop: Callable[[], bool] = lambda: False) -> int:
+        """Refresh candidates until the budget is spent or should_stop is True.
+
+        Returns:
+            Number of entries refreshed
+        """
+        if self._repository is None:
+            self._repository = ContentRepository()
+
+        refreshed = 0
+        for content_type, content_id in self.candidates(self.budget):
+            if should_stop() or self._repository.is_offline:
+                break
+            try:
+                await self._repository.refresh(content_type, content_id)
+            except (httpx.HTTPError, CircuitOpenError, SQLAlchemyError):
+                continue  # Try again next idle period
+            refreshed += 1
+        return refreshed
@@ -0,0 +1,214 @@
+import gzip
+import json
+from collections.abc import Callable
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.exc import OperationalError
+
+from streaming_overview_tui.data_layer.database import get_engine
+from streaming_overview_tui.data_layer.database import init_db
+from streaming_overview_tui.data_layer.models import CatalogTitle
+from streaming_overview_tui.data_layer.models import TMDBSearchResult
+
+# Rows written per transaction during import
+IMPORT_BATCH_SIZE = 50_000
+
+# Default number of hits returned from the local search index
+INDEX_SEARCH_LIMIT = 20
+
+# Title field per content type in the TMDB export files
+_EXPORT_TITLE_FIELDS = {
+    "movie": "original_title",
+    "show": "original_name",
+}
+
+
+def detect_content_type(path: Path) -> str:
+    """Detect content type from a TMDB export file name.
+
+    TMDB names its exports e.g. movie_ids_05_15_2024.json.gz and
+    tv_series_ids_05_15_2024.json.gz.
+
+    Raises:
+        ValueError: If the file name does not identify the content type
+    """
+    name = path.name.lower()
+    if name.startswith("movie"):
+        return "movie"
+    if name.startswith("tv"):
+        return "show"
+    raise ValueError(f"Cannot detect content type from file name: {path.name}")
+
+
+def iter_export_rows(path: Path, content_type: str) -> Iterator[dict]:
+    """Stream rows from a TMDB export file, one JSON object per line.
+
+    Gzipped files are decompressed on the fly. Malformed lines and
+    entries without a title are skipped.
+    """
+    title_field = _EXPORT_TITLE_FIELDS[content_type]
+    opener = gzip.open if path.suffix == ".gz" else open
+
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                tmdb_id = int(entry["id"])
+            except (ValueError, KeyError, TypeError):
+                continue
+
+            title = entry.get(title_field)
+            if not title:
+                continue
+
+            yield {
+                "content_type": content_type,
+                "id": tmdb_id,
+                "title": title,
+                "popularity": float(entry.get("popularity") or 0.0),
+            }
+
+
+def import_catalog(
+    path: Path,
+    content_type: str | None = None,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    on_progress: Callable[[int], None] | None = None,
+) -> int:
+    """Bulk import a TMDB export file into the catalog and rebuild the index.
+
+    The file is streamed and written in batches, one transaction per batch,
+    so memory stays bounded regardless of file size. Existing titles are
+    updated in place.
+
+    Args:
+        path: Path to a (gzipped) JSON-lines TMDB ID export
+        content_type: "movie" or "show", detected from file name if None
+        batch_size: Rows per transaction
+        on_progress: Called with the running row count after each batch
+
+    Returns:
+        Number of rows imported
+    """
+    if content_type is None:
+        content_type = detect_content_type(path)
+
+    init_db()
+    engine = get_engine()
+
+    statement = insert(CatalogTitle)
+    statement = statement.on_conflict_do_update(
+        index_elements=["content_type", "id"],
+        set_={
+            "title": statement.excluded.title,
+            "popularity": statement.excluded.popularity,
+        },
+    )
+
+    rows = iter_export_rows(path, content_type)
+    total = 0
+    while batch := list(islice(rows, batch_size)):
+        with engine.begin() as connection:
+            connection.execute(statement, batch)
+        total += len(batch)
+        if on_progress is not None:
+            on_progress(total)
+
+    build_search_index()
+    return total
+
+
+def build_search_index() -> None:
+    """Rebuild the full-text search index over catalog titles.
+
+    The index is an FTS5 table backed by catalog_titles, so the rebuild
+    runs inside SQLite without loading rows into Python.
+    """
+    engine = get_engine()
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS catalog_index USING fts5("
+                "title, content='catalog_titles', content_rowid='rowid', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            )
+        )
+        connection.execute(
+            text("INSERT INTO catalog_index(catalog_index) VALUES('rebuild')")
+        )
+
+
+def load_search_index() -> None:
+    """Read the search index once, so the first search does not wait on disk.
+
+    Blocks, so run it off the event loop. Does nothing if no catalog has
+    been imported yet.
+    """
+    engine = get_engine()
+    try:
+        with engine.connect() as connection:
+            connection.execute(
+                text(
+                    "SELECT rowid FROM catalog_index "
+                    "WHERE catalog_index MATCH 'a*' LIMIT 1"
+                )
+            ).all()
+    except OperationalError:
+        # Index not built yet
+        pass
+
+
+def _build_match_query(query: str) -> str | None:
+    """Turn user input into an FTS5 prefix query.
+
+    For example 'dark kni' becomes '"dark"* "kni"*'.
+    """
+    tokens = [token.replace('"', "") for token in query.split()]
+    tokens = [token for token in tokens if token]
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def search_catalog(
+    query: str, limit: int = INDEX_SEARCH_LIMIT
+) -> list[TMDBSearchResult]:
+    """Search the local catalog index, most popular titles first.
+
+    Returns an empty list if no catalog has been imported yet.
+    """
+    match_query = _build_match_query(query)
+    if match_query is None:
+        return []
+
+    engine = get_engine()
+    try:
+        with engine.connect() as connection:
+            rows = connection.execute(
+                text(
+                    "SELECT c.id, c.title, c.content_type FROM catalog_index "
+                    "JOIN catalog_titles AS c ON c.rowid = catalog_index.rowid "
+                    "WHERE catalog_index MATCH :query "
+                    "ORDER BY c.popularity DESC LIMIT :limit"
+                ),
+                {"query": match_query, "limit": limit},
+            ).all()
+    except OperationalError:
+        # Index not built yet
+        return []
+
+    return [
+        TMDBSearchResult(
+            id=row.id,
+            title=row.title,
+            year=None,
+            content_type=row.content_type,
+            poster_path=None,
+            rating=None,
+        )
+        for row in rows
+    ]
@@ -0,0 +1,96 @@
+import time
+from collections.abc import Callable
+from enum import Enum
+
+# Consecutive failures before the circuit opens
+FAILURE_THRESHOLD = 3
+# Seconds to wait before letting a half-open probe through
+RECOVERY_TIMEOUT_SECONDS = 30.0
+
+
+class CircuitState(str, Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """Circuit breaker guarding calls to an unreliable remote service.
+
+    Closed: requests pass through, consecutive failures are counted.
+    Open: requests are rejected immediately until the recovery timeout passes.
+    Half-open: a single probe request is let through. Success closes the
+    circuit again, failure re-opens it for another recovery timeout.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        recovery_timeout: float = RECOVERY_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open once the timeout passes."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self._clock() - self._opened_at >= self.recovery_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    @property
+    def is_offline(self) -> bool:
+        """True while the remote service is considered unreachable."""
+        return self.state != CircuitState.CLOSED
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent right now.
+
+        In half-open state only one probe is allowed at a time.
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if needed."""
+        self._failures += 1
+        self._probe_in_flight = False
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            # A failed probe restarts the recovery timeout
+            self._opened_at = self._clock()
+
+    def release_probe(self) -> None:
+        """Give up a half-open probe without recording an outcome."""
+        self._probe_in_flight = False
+
+    def reset(self) -> None:
+        """Return to the closed state, forgetting all failures."""
+        self.record_success()
+
+
+# Shared by all TMDB clients so the state survives across repositories
+tmdb_circuit_breaker = CircuitBreaker()
@@ -1,6 +1,8 @@
+import threading
 from pathlib import Path
 
 from platformdirs import user_data_dir
+from sqlalchemy import text
 from sqlmodel import create_engine
 from sqlmodel import Session
 from sqlmodel import SQLModel
@@ -12,6 +14,10 @@ DATABASE_FILE = DATA_DIR / "cache.db"
 # Create engine lazily
 _engine = None
 
+# Engine whose tables have been created, so init_db only runs once per engine
+_initialized_engine = None
+_init_lock = threading.Lock()
+
 
 def get_engine():
     """Get or create the database engine."""
@@ -23,15 +29,47 @@ def get_engine():
 
 
 def init_db() -> None:
-    """Initialize the database, creating tables if needed."""
+    """Initialize the database, creating tables if needed.
+
+    Only the first call for an engine does any work, so it is cheap to call
+    before every use. Safe to call from several threads at once.
+    """
+    global _initialized_engine
+    engine = get_engine()
+    if _initialized_engine is engine:
+        return
+
     from streaming_overview_tui.data_layer.models import CachedMovie  # noqa: F401
     from streaming_overview_tui.data_layer.models import CachedShow  # noqa: F401
+    from streaming_overview_tui.data_layer.models import CatalogTitle  # noqa: F401
+    from streaming_overview_tui.data_layer.models import (
+        NegativeCacheEntry,  # noqa: F401
+    )
+    from streaming_overview_tui.data_layer.models import (
+        PosterThumbnail,  # noqa: F401
+    )
+    from streaming_overview_tui.data_layer.models import SessionState  # noqa: F401
     from streaming_overview_tui.data_layer.models import (
         StreamingAvailability,  # noqa: F401
     )
+    from streaming_overview_tui.data_layer.models import SyncState  # noqa: F401
 
-    engine = get_engine()
-    SQLModel.metadata.create_all(engine)
+    with _init_lock:
+        if _initialized_engine is engine:
+            return
+        SQLModel.metadata.create_all(engine)
+        _initialized_engine = engine
+
+
+def warm_up_db() -> None:
+    """Initialize the database and open a connection ahead of first use.
+
+    Blocks, so run it off the event loop. The connection stays in the
+    engine's pool for the first query to reuse.
+    """
+    init_db()
+    with get_engine().connect() as connection:
+        connection.execute(text("SELECT 1"))
 
 
 def get_session() -> Session:
@@ -48,6 +48,59 @@ class StreamingAvailability(SQLModel, table=True):
     cached_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+class CatalogTitle(SQLModel, table=True):
+    """Title imported from a TMDB daily ID export, used for local search."""
+
+    __tablename__ = "catalog_titles"
+
+    content_type: str = Field(primary_key=True)  # "movie" or "show"
+    id: int = Field(primary_key=True)  # TMDB movie or show ID
+    title: str  # Original title from the export
+    popularity: float = Field(default=0.0, index=True)
+
+
+class NegativeCacheEntry(SQLModel, table=True):
+    """Known-bad lookup that is not retried until it expires."""
+
+    __tablename__ = "negative_cache"
+
+    kind: str = Field(primary_key=True)  # "movie", "show" or "query"
+    key: str = Field(primary_key=True)  # Content ID or normalized query
+    cached_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class SyncState(SQLModel, table=True):
+    """Watermark of the last successful sync job, keyed by job name."""
+
+    __tablename__ = "sync_state"
+
+    name: str = Field(primary_key=True)  # e.g. "changes"
+    synced_at: datetime
+
+
+class SessionState(SQLModel, table=True):
+    """Search on screen when the app was last closed, keyed by screen name."""
+
+    __tablename__ = "session_state"
+
+    name: str = Field(primary_key=True)  # e.g. "main"
+    query: str
+    results: str  # JSON list of [content_type, id] pairs in display order
+    selected: str | None = None  # JSON [content_type, id] of the highlight
+    saved_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class PosterThumbnail(SQLModel, table=True):
+    """Tiny half-block color grid of a poster, painted while the poster loads."""
+
+    __tablename__ = "poster_thumbnails"
+
+    poster_path: str = Field(primary_key=True)  # Relative path for TMDB image CDN
+    width: int  # In cells
+    height: int  # In cells
+    pixels: bytes  # uint8 grid of shape (height, width, 2, 3)
+
+
 # Lightweight types for search results and API responses
 
 
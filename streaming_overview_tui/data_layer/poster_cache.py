@@ -0,0 +1,292 @@
+import hashlib
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+from platformdirs import user_cache_dir
+from sqlalchemy.exc import SQLAlchemyError
+
+from streaming_overview_tui.data_layer.database import get_session
+from streaming_overview_tui.data_layer.models import PosterThumbnail
+
+APP_NAME = "streaming-overview-tui"
+POSTER_CACHE_DIR = Path(user_cache_dir(APP_NAME)) / "posters"
+
+# Total size of the on-disk poster cache before old entries are evicted
+DISK_CACHE_MAX_BYTES = 20 * 1024 * 1024
+
+# Total size of decoded thumbnails kept in memory
+MEMORY_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Largest thumbnail kept in memory, the w92 TMDB poster size
+THUMBNAIL_SIZE = (92, 138)
+
+# Total size of full posters kept in memory for terminal graphics
+GRAPHICS_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Largest poster kept in memory for terminal graphics, the w780 TMDB poster size
+GRAPHICS_IMAGE_SIZE = (780, 1170)
+
+# Size in cells of the placeholder thumbnail stored in the database
+PLACEHOLDER_THUMBNAIL_CELLS = (3, 4)
+
+# File header: magic, grid width and height in cells
+_MAGIC = b"SPG1"
+_HEADER = struct.Struct("<4sHH")
+
+
+class CacheStats:
+    """Counters for a poster cache."""
+
+    def __init__(
+        self, hits: int, misses: int, evictions: int, entries: int, size_bytes: int
+    ):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.entries = entries
+        self.size_bytes = size_bytes
+
+
+class PosterMemoryCache:
+    """Thread-safe LRU cache of decoded poster thumbnails with a byte budget.
+
+    Images are stored as RGB thumbnails no larger than THUMBNAIL_SIZE, so
+    the budget holds many posters regardless of the downloaded size.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = MEMORY_CACHE_MAX_BYTES,
+        thumbnail_size: tuple[int, int] = THUMBNAIL_SIZE,
+    ):
+        self.max_bytes = max_bytes
+        self.thumbnail_size = thumbnail_size
+        self._images: OrderedDict[Hashable, Image.Image] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Image.Image | None:
+        """Get a cached thumbnail, marking it as recently used."""
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                self._misses += 1
+                return None
+            self._images.move_to_end(key)
+            self._hits += 1
+            return image
+
+    def put(self, key: Hashable, image: Image.Image) -> None:
+        """Store a thumbnail of an image, evicting old entries to fit the budget."""
+        thumbnail = image.convert("RGB")  # Always a copy
+        thumbnail.thumbnail(self.thumbnail_size)
+        size = _image_bytes(thumbnail)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._images.pop(key, None)
+            if old is not None:
+                self._size_bytes -= _image_bytes(old)
+
+            self._images[key] = thumbnail
+            self._size_bytes += size
+
+            while self._size_bytes > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._size_bytes -= _image_bytes(evicted)
+                self._evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._images
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._images)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the hit, miss and eviction counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._images),
+                size_bytes=self._size_bytes,
+            )
+
+
+def _image_bytes(image: Image.Image) -> int:
+    """Approximate memory used by an image's pixel data."""
+    width, height = image.size
+    return width * height * len(image.getbands())
+
+
+class DiskPosterCache:
+    """Size-capped LRU cache of rendered posters on disk.
+
+    Stores half-block color grids, so a poster seen before renders without
+    downloading or decoding the image. Each entry is a small file named by
+    the hash of (tmdb_id, poster_path, width, height), holding a header and
+    the zlib-compressed grid. Recency is tracked by file modification time.
+    """
+
+    def __init__(
+        self,
+        directory: Path = POSTER_CACHE_DIR,
+        max_bytes: int = DISK_CACHE_MAX_BYTES,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None  # Scanned on first write
+
+    def _path(self, tmdb_id: int, poster_path: str, width: int, height: int) -> Path:
+        """Get the file path for a cache key."""
+        key = f"{tmdb_id}:{poster_path}:{width}x{height}".encode()
+        return self.directory / f"{hashlib.sha256(key).hexdigest()}.bin"
+
+    def get(
+        self, tmdb_id: int, poster_path: str, width: int, height: int
+    ) -> np.ndarray | None:
+        """Get a cached color grid, or None on a miss or unreadable entry."""
+        path = self._path(tmdb_id, poster_path, width, height)
+        try:
+            data = path.read_bytes()
+            magic, grid_width, grid_height = _HEADER.unpack_from(data)
+            if magic != _MAGIC or (grid_width, grid_height) != (width, height):
+                return None
+            pixels = zlib.decompress(data[_HEADER.size :])
+            grid = np.frombuffer(pixels, dtype=np.uint8).reshape(height, width, 2, 3)
+            os.utime(path)  # Mark as recently used
+        except (OSError, ValueError, struct.error, zlib.error):
+            return None
+        return grid
+
+    def contains(self, tmdb_id: int, poster_path: str, width: int, height: int) -> bool:
+        """Check for an entry without reading it or marking it as used."""
+        return self._path(tmdb_id, poster_path, width, height).is_file()
+
+    def put(
+        self,
+        tmdb_id: int,
+        poster_path: str,
+        width: int,
+        height: int,
+        grid: np.ndarray,
+    ) -> None:
+        """Store a color grid, evicting least recently used entries if needed."""
+        path = self._path(tmdb_id, poster_path, width, height)
+        data = _HEADER.pack(_MAGIC, width, height) + zlib.compress(
+            np.ascontiguousarray(grid, dtype=np.uint8).tobytes()
+        )
+
+        with self._lock:
+            try:
+                self._write(path, data)
+            except OSError:
+                return  # The cache is best effort
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _write(self, path: Path, data: bytes) -> None:
+        """Write an entry atomically and update the total size."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self._total_bytes is None:
+            self._total_bytes = sum(f.stat().st_size for f in self._entries())
+
+        try:
+            self._total_bytes -= path.stat().st_size
+        except FileNotFoundError:
+            pass
+
+        # Readers never see a partially written file
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        self._total_bytes += len(data)
+
+    def clear(self) -> None:
+        """Remove all cached posters."""
+        with self._lock:
+            for entry in self._entries():
+                entry.unlink(missing_ok=True)
+            self._total_bytes = 0
+
+    def _entries(self) -> list[Path]:
+        """List cache files."""
+        if not self.directory.exists():
+            return []
+        return list(self.directory.glob("*.bin"))
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under the size cap."""
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+        self._total_bytes = total
+
+
+class PosterThumbnailStore:
+    """Tiny color grids of every poster seen, stored in the SQLite cache.
+
+    A few cells per poster are enough to paint an approximate poster on
+    the first frame, before the full poster is downloaded or rendered.
+    """
+
+    def get(self, poster_path: str) -> np.ndarray | None:
+        """Get a thumbnail grid, or None if the poster was never seen."""
+        try:
+            with get_session() as session:
+                thumbnail = session.get(PosterThumbnail, poster_path)
+        except SQLAlchemyError:
+            return None
+        if thumbnail is None:
+            return None
+
+        shape = (thumbnail.height, thumbnail.width, 2, 3)
+        try:
+            return np.frombuffer(thumbnail.pixels, dtype=np.uint8).reshape(shape)
+        except ValueError:
+            return None
+
+    def put(self, poster_path: str, grid: np.ndarray) -> None:
+        """Store a thumbnail grid, replacing any earlier one."""
+        height, width = grid.shape[:2]
+        thumbnail = PosterThumbnail(
+            poster_path=poster_path,
+            width=width,
+            height=height,
+            pixels=np.ascontiguousarray(grid, dtype=np.uint8).tobytes(),
+        )
+        try:
+            with get_session() as session:
+                session.merge(thumbnail)
+                session.commit()
+        except SQLAlchemyError:
+            pass  # The thumbnail is only a placeholder
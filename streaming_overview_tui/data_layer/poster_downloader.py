@@ -0,0 +1,204 @@
+import heapq
+import itertools
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Collection
+from concurrent.futures import Future
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Max poster downloads running at the same time
+MAX_CONCURRENT_DOWNLOADS = 4
+
+# Priority of the poster on screen, neighbours use their distance from it
+HIGHLIGHT_PRIORITY = 0
+
+# Recently downloaded images kept so a prefetched poster is not fetched again
+RECENT_DOWNLOADS_LIMIT = 32
+
+
+class _Request:
+    """A queued or running download."""
+
+    def __init__(self, url: str, priority: int, seq: int):
+        self.url = url
+        self.priority = priority
+        self.seq = seq  # Identifies the current heap entry
+        self.future: Future[bytes] = Future()
+        self.started = False
+
+
+class PosterDownloader:
+    """Downloads poster images on a shared, pooled HTTP client.
+
+    Requests are served most urgent first (lowest priority value) by a
+    fixed number of worker threads. Requests for a URL that is already
+    queued or downloading share one download. Queued and running
+    downloads can be cancelled, e.g. when the search results change.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_DOWNLOADS,
+        client: httpx.Client | None = None,
+    ):
+        self.max_concurrent = max_concurrent
+        self._client = client
+        self._requests: dict[str, _Request] = {}
+        self._queue: list[tuple[int, int, str]] = []  # (priority, seq, url)
+        self._recent: OrderedDict[str, bytes] = OrderedDict()
+        self._seq = itertools.count()
+        self._condition = threading.Condition()
+        self._threads: list[threading.Thread] = []
+
+    def submit(self, url: str, priority: int = HIGHLIGHT_PRIORITY) -> Future[bytes]:
+        """Queue a download, or join the one already queued for the URL.
+
+        Args:
+            url: Image URL
+            priority: Lower values are downloaded first
+
+        Returns:
+            Future resolving to the image bytes. It is cancelled if the
+            request is cancelled before the download finishes.
+        """
+        with self._condition:
+            data = self._recent.get(url)
+            if data is not None:
+                self._recent.move_to_end(url)
+                future: Future[bytes] = Future()
+                future.set_result(data)
+                return future
+
+            request = self._requests.get(url)
+            if request is None:
+                request = _Request(url, priority, next(self._seq))
+                self._requests[url] = request
+                heapq.heappush(self._queue, (priority, request.seq, url))
+                self._start_workers()
+                self._condition.notify()
+            elif priority < request.priority:
+                self._requeue(request, priority)
+            return request.future
+
+    def fetch(self, url: str, priority: int = HIGHLIGHT_PRIORITY) -> bytes:
+        """Download an image, blocking until it arrives.
+
+        Raises:
+            concurrent.futures.CancelledError: If the request was cancelled
+            httpx.HTTPError: If the download failed
+        """
+        return self.submit(url, priority).result()
+
+    def prioritize(self, priorities: dict[str, int]) -> None:
+        """Re-rank queued downloads and drop queued ones that are not listed.
+
+        Downloads already running are left to finish.
+        """
+        with self._condition:
+            for url, request in list(self._requests.items()):
+                if request.started:
+                    continue
+                if url not in priorities:
+                    self._cancel(request)
+                elif priorities[url] != request.priority:
+                    self._requeue(request, priorities[url])
+
+    def cancel(self, keep: Collection[str] = ()) -> None:
+        """Cancel queued and running downloads for URLs not in keep."""
+        with self._condition:
+            for url, request in list(self._requests.items()):
+                if url not in keep:
+                    self._cancel(request)
+
+    def _requeue(self, request: _Request, priority: int) -> None:
+        """Move a queued request to a new priority. The old entry goes stale."""
+        request.priority = priority
+        request.seq = next(self._seq)
+        heapq.heappush(self._queue, (priority, request.seq, request.url))
+
+    def _cancel(self, request: _Request) -> None:
+        """Cancel a request. A running download stops at its next chunk."""
+        request.future.cancel()
+        del self._requests[request.url]
+
+    def _start_workers(self) -> None:
+        """Start worker threads on first use."""
+        if self._client is None:
+            limits = httpx.Limits(max_connections=self.max_concurrent)
+            self._client = httpx.Client(limits=limits)
+        while len(self._threads) < self.max_concurrent:
+            thread = threading.Thread(
+                target=self._work, name="poster-downloader", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _next_request(self) -> _Request:
+        """Block until a queued request is available and mark it started."""
+        with self._condition:
+            while True:
+                while not self._queue:
+                    self._condition.wait()
+                _, seq, url = heapq.heappop(self._queue)
+                request = self._requests.get(url)
+                # Skip entries of cancelled, started or re-ranked requests
+                if request is None or request.started or request.seq != seq:
+                    continue
+                request.started = True
+                return request
+
+    def _work(self) -> None:
+        """Worker thread loop."""
+        while True:
+            request = self._next_request()
+            try:
+                data = self._download(request)
+            except httpx.HTTPError as e:
+                self._finish(request, error=e)
+            except Exception as e:
+                # Passed on to the caller too, the worker thread must keep going
+                logger.exception("Poster download of %s failed", request.url)
+                self._finish(request, error=e)
+            else:
+                self._finish(request, data=data)
+
+    def _download(self, request: _Request) -> bytes | None:
+        """Stream an image, returning None if the request is cancelled."""
+        chunks = []
+        with self._client.stream("GET", request.url) as response:
+            response.raise_for_status()
+            for chunk in response.iter_bytes():
+                if request.future.cancelled():
+                    return None
+                chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _finish(
+        self,
+        request: _Request,
+        data: bytes | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """Resolve a request's future and forget the request."""
+        with self._condition:
+            if self._requests.get(request.url) is request:
+                del self._requests[request.url]
+            if request.future.cancelled():
+                return
+
+            if error is not None:
+                request.future.set_exception(error)
+                return
+
+            self._recent[request.url] = data
+            while len(self._recent) > RECENT_DOWNLOADS_LIMIT:
+                self._recent.popitem(last=False)
+            request.future.set_result(data)
+
+
+# Shared by all poster widgets so downloads are pooled and de-duplicated
+poster_downloader = PosterDownloader()
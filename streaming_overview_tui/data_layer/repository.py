@@ -2,14 +2,18 @@ from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
 
+import httpx
 from sqlmodel import select
 
 from streaming_overview_tui.config_layer import load_user_config
+from streaming_overview_tui.data_layer.catalog_import import search_catalog
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitOpenError
 from streaming_overview_tui.data_layer.database import get_session
 from streaming_overview_tui.data_layer.database import init_db
 from streaming_overview_tui.data_layer.models import CachedMovie
 from streaming_overview_tui.data_layer.models import CachedShow
 from streaming_overview_tui.data_layer.models import Movie
+from streaming_overview_tui.data_layer.models import NegativeCacheEntry
 from streaming_overview_tui.data_layer.models import Show
 from streaming_overview_tui.data_layer.models import StreamingAvailability
 from streaming_overview_tui.data_layer.models import StreamingProvider
@@ -19,6 +23,18 @@ from streaming_overview_tui.data_layer.tmdb_client import TMDBClient
 # Cache TTL in days
 CACHE_TTL_DAYS = 30
 
+# Negative cache TTLs for details TMDB does not know and queries without results
+NEGATIVE_DETAIL_TTL = timedelta(days=1)
+EMPTY_QUERY_TTL = timedelta(hours=1)
+
+# Max results served from the local cache while offline
+OFFLINE_SEARCH_LIMIT = 20
+
+
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards so they match literally, with backslash as escape."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 class ContentRepository:
     """Repository for movies and TV shows with caching."""
@@ -27,11 +43,46 @@ class ContentRepository:
         self._client = TMDBClient()
         init_db()
 
+    @property
+    def is_offline(self) -> bool:
+        """True while TMDB is unreachable and searches use the local cache."""
+        return self._client.is_offline
+
     def _is_cache_fresh(self, cached_at: datetime) -> bool:
         """Check if cached data is still fresh."""
         expiry = cached_at + timedelta(days=CACHE_TTL_DAYS)
         return datetime.now(timezone.utc) < expiry
 
+    def _is_negative_cached(self, kind: str, key: str, ttl: timedelta) -> bool:
+        """Check if a lookup is known to come back empty."""
+        with get_session() as session:
+            entry = session.get(NegativeCacheEntry, (kind, key))
+            if entry is None:
+                return False
+            return datetime.now(timezone.utc) < entry.cached_at + ttl
+
+    def _cache_negative(self, kind: str, key: str) -> None:
+        """Remember that a lookup came back empty."""
+        now = datetime.now(timezone.utc)
+        with get_session() as session:
+            entry = session.get(NegativeCacheEntry, (kind, key))
+            if entry:
+                entry.cached_at = now
+            else:
+                session.add(NegativeCacheEntry(kind=kind, key=key, cached_at=now))
+            session.commit()
+
+    def _is_not_found(self, error: Exception) -> bool:
+        """Check if an API error means TMDB does not know the content."""
+        return (
+            isinstance(error, httpx.HTTPStatusError)
+            and error.response.status_code == 404
+        )
+
+    def _normalize_query(self, query: str) -> str:
+        """Normalize a query for use as negative cache key."""
+        return " ".join(query.lower().split())
+
     def _extract_year(self, date_str: str | None) -> int | None:
         """Extract year from TMDB date string (YYYY-MM-DD)."""
         if not date_str:
@@ -67,10 +118,19 @@ class ContentRepository:
     async def search(self, query: str) -> list[TMDBSearchResult]:
         """Search for movies and TV shows.
 
-        Returns cached results if fresh, otherwise fetches from TMDB.
+        Always fetches from TMDB, as search results change frequently.
+        Queries that recently returned nothing are not sent again.
+        While the TMDB circuit is open, searches the local cache instead.
         """
-        # Always fetch from API for search (search results change frequently)
-        data = await self._client.search_multi(query)
+        query_key = self._normalize_query(query)
+        if self._is_negative_cached("query", query_key, EMPTY_QUERY_TTL):
+            return []
+
+        try:
+            data = await self._client.search_multi(query)
+        except CircuitOpenError:
+            return self._search_cache(query)
+
         results = []
 
         for item in data.get("results", []):
@@ -101,12 +161,73 @@ class ContentRepository:
                     )
                 )
 
+        if not results:
+            self._cache_negative("query", query_key)
+
+        return results
+
+    def _search_cache(self, query: str) -> list[TMDBSearchResult]:
+        """Search cached movies and shows by title, best rated first.
+
+        Fills up with hits from the imported catalog index, if any.
+        """
+        pattern = f"%{_escape_like(query)}%"
+        results = []
+
+        with get_session() as session:
+            movies = session.exec(
+                select(CachedMovie)
+                .where(CachedMovie.title.like(pattern, escape="\\"))
+                .order_by(CachedMovie.rating.desc())
+                .limit(OFFLINE_SEARCH_LIMIT)
+            ).all()
+            shows = session.exec(
+                select(CachedShow)
+                .where(CachedShow.title.like(pattern, escape="\\"))
+                .order_by(CachedShow.rating.desc())
+                .limit(OFFLINE_SEARCH_LIMIT)
+            ).all()
+
+            for movie in movies:
+                results.append(
+                    TMDBSearchResult(
+                        id=movie.id,
+                        title=movie.title,
+                        year=movie.release_year,
+                        content_type="movie",
+                        poster_path=movie.poster_path,
+                        rating=movie.rating,
+                    )
+                )
+            for show in shows:
+                results.append(
+                    TMDBSearchResult(
+                        id=show.id,
+                        title=show.title,
+                        year=show.first_air_year,
+                        content_type="show",
+                        poster_path=show.poster_path,
+                        rating=show.rating,
+                    )
+                )
+
+        results.sort(key=lambda r: r.rating or 0.0, reverse=True)
+        results = results[:OFFLINE_SEARCH_LIMIT]
+
+        seen = {(r.content_type, r.id) for r in results}
+        for hit in search_catalog(query, limit=OFFLINE_SEARCH_LIMIT):
+            if len(results) >= OFFLINE_SEARCH_LIMIT:
+                break
+            if (hit.content_type, hit.id) not in seen:
+                results.append(hit)
+
         return results
 
     async def get_movie(self, movie_id: int) -> Movie | None:
         """Get movie details with streaming availability.
 
         Returns cached data if fresh, otherwise fetches from TMDB.
+        Returns None if TMDB does not know the movie.
         """
         region = load_user_config().region
 
@@ -125,10 +246,17 @@ class ContentRepository:
                     providers=providers,
                 )
 
+        # Known to be missing on TMDB
+        if self._is_negative_cached("movie", str(movie_id), NEGATIVE_DETAIL_TTL):
+            return None
+
         # Fetch from API
         try:
             data = await self._client.get_movie(movie_id)
-        except Exception:
+        except Exception as e:
+            if self._is_not_found(e):
+                self._cache_negative("movie", str(movie_id))
+                return None
             # On API failure, return stale cache if available
             with get_session() as session:
                 cached = session.get(CachedMovie, movie_id)
@@ -154,6 +282,7 @@ class ContentRepository:
         """Get TV show details with streaming availability.
 
         Returns cached data if fresh, otherwise fetches from TMDB.
+        Returns None if TMDB does not know the show.
         """
         region = load_user_config().region
 
@@ -172,10 +301,17 @@ class ContentRepository:
                     providers=providers,
                 )
 
+        # Known to be missing on TMDB
+        if self._is_negative_cached("show", str(show_id), NEGATIVE_DETAIL_TTL):
+            return None
+
         # Fetch from API
         try:
             data = await self._client.get_show(show_id)
-        except Exception:
+        except Exception as e:
+            if self._is_not_found(e):
+                self._cache_negative("show", str(show_id))
+                return None
             # On API failure, return stale cache if available
             with get_session() as session:
                 cached = session.get(CachedShow, show_id)
@@ -197,6 +333,43 @@ class ContentRepository:
         show = self._cache_show(data, providers, region)
         return show
 
+    def get_cached(self, content_type: str, content_id: int) -> Movie | Show | None:
+        """Get movie or show details from the cache only, however old.
+
+        Never contacts TMDB, so it returns at once even while offline.
+
+        Args:
+            content_type: "movie" or "show"
+            content_id: TMDB ID
+        """
+        region = load_user_config().region
+        with get_session() as session:
+            if content_type == "movie":
+                movie = session.get(CachedMovie, content_id)
+                if movie is None:
+                    return None
+                return Movie(
+                    id=movie.id,
+                    title=movie.title,
+                    release_year=movie.release_year,
+                    overview=movie.overview,
+                    rating=movie.rating,
+                    poster_path=movie.poster_path,
+                    providers=self._get_cached_providers("movie", content_id, region),
+                )
+            show = session.get(CachedShow, content_id)
+            if show is None:
+                return None
+            return Show(
+                id=show.id,
+                title=show.title,
+                first_air_year=show.first_air_year,
+                overview=show.overview,
+                rating=show.rating,
+                poster_path=show.poster_path,
+                providers=self._get_cached_providers("show", content_id, region),
+            )
+
     async def refresh(self, content_type: str, content_id: int) -> None:
         """Force refresh from API, bypassing cache."""
         if content_type == "movie":
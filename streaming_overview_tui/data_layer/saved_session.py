@@ -0,0 +1,69 @@
+import json
+
+from streaming_overview_tui.data_layer.database import get_session
+from streaming_overview_tui.data_layer.database import init_db
+from streaming_overview_tui.data_layer.models import SessionState
+
+# Name the main screen saves its session under
+MAIN_SESSION = "main"
+
+# Content type and TMDB ID of a search result
+ContentKey = tuple[str, int]
+
+
+class SavedSession:
+    """Search saved when the app was last closed."""
+
+    def __init__(
+        self, query: str, results: list[ContentKey], selected: ContentKey | None
+    ):
+        self.query = query
+        self.results = results  # In display order
+        self.selected = selected  # Highlighted result, if any
+
+
+def save_session(
+    query: str,
+    results: list[ContentKey],
+    selected: ContentKey | None,
+    name: str = MAIN_SESSION,
+) -> None:
+    """Save the search on screen, replacing the one saved before.
+
+    A search without results is not worth restoring, so it clears the
+    saved session instead.
+    """
+    init_db()
+    with get_session() as session:
+        state = session.get(SessionState, name)
+        if not query or not results:
+            if state is not None:
+                session.delete(state)
+                session.commit()
+            return
+
+        if state is None:
+            state = SessionState(name=name, query=query, results="")
+        state.query = query
+        state.results = json.dumps(results)
+        state.selected = json.dumps(selected) if selected is not None else None
+        session.add(state)
+        session.commit()
+
+
+def load_session(name: str = MAIN_SESSION) -> SavedSession | None:
+    """Load the saved search, if there is one."""
+    init_db()
+    with get_session() as session:
+        state = session.get(SessionState, name)
+        if state is None:
+            return None
+        selected = json.loads(state.selected) if state.selected else None
+        return SavedSession(
+            query=state.query,
+            results=[
+                (content_type, tmdb_id)
+                for content_type, tmdb_id in json.loads(state.results)
+            ],
+            selected=tuple(selected) if selected is not None else None,
+        )
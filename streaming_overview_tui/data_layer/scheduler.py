@@ -0,0 +1,232 @@
+import asyncio
+import logging
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    """Classes of background work, most urgent first."""
+
+    INTERACTIVE = 0  # The user is waiting on it, e.g. a search
+    VISIBLE = 1  # Fills in what is on screen, e.g. the highlighted poster
+    PREFETCH = 2  # Probably needed soon, e.g. posters next to the highlight
+    MAINTENANCE = 3  # Nobody is waiting on it, e.g. cache writes and warming
+
+
+# Operations of each class allowed to run at the same time
+DEFAULT_CONCURRENCY = {
+    Priority.INTERACTIVE: 4,
+    Priority.VISIBLE: 4,
+    Priority.PREFETCH: 2,
+    Priority.MAINTENANCE: 1,
+}
+
+# Class of the job running in the current context, and whether it holds a slot
+_current_priority: ContextVar[Priority | None] = ContextVar(
+    "current_priority", default=None
+)
+_holding_slot: ContextVar[bool] = ContextVar("holding_slot", default=False)
+
+
+class _LoopState:
+    """Scheduler state for one event loop."""
+
+    def __init__(self):
+        self.running = {priority: 0 for priority in Priority}
+        self.waiting: dict[Priority, deque[asyncio.Future[None]]] = {
+            priority: deque() for priority in Priority
+        }
+        self.groups: dict[str, set[asyncio.Task]] = {}
+        self.spawned: set[asyncio.Task] = set()
+
+
+class WorkScheduler:
+    """Runs background work by priority class, with a concurrency limit each.
+
+    A job (a search, a poster fetch, cache warming) declares its class and
+    group with job(). The operations it waits on, such as TMDB requests,
+    downloads and decodes, each take a slot of that class with slot(). A
+    slot is only handed out while no more urgent class has operations
+    waiting, so prefetching and maintenance give way to what the user is
+    looking at. Cancelling a group cancels its jobs, waiting or running.
+
+    State is kept per event loop, so one scheduler can serve the app and
+    tests that each run their own loop.
+    """
+
+    def __init__(self, concurrency: dict[Priority, int] | None = None):
+        self.concurrency = {**DEFAULT_CONCURRENCY, **(concurrency or {})}
+        self._states: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopState
+        ] = weakref.WeakKeyDictionary()
+
+    def _state(self) -> _LoopState:
+        """Get the state for the running loop."""
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = self._states[loop] = _LoopState()
+        return state
+
+    @asynccontextmanager
+    async def job(
+        self, priority: Priority, group: str | None = None
+    ) -> AsyncIterator[None]:
+        """Run the enclosed code as a job of a class and group.
+
+        Slots taken inside default to the job's class. The current task is
+        cancelled if its group is cancelled.
+        """
+        state = self._state()
+        task = asyncio.current_task()
+        if group is not None and task is not None:
+            state.groups.setdefault(group, set()).add(task)
+        token = _current_priority.set(priority)
+        try:
+            yield
+        finally:
+            _current_priority.reset(token)
+            if group is not None and task is not None:
+                tasks = state.groups.get(group)
+                if tasks is not None:
+                    tasks.discard(task)
+                    if not tasks:
+                        del state.groups[group]
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority | None = None) -> AsyncIterator[None]:
+        """Wait for a free slot, then hold it for the enclosed operation.
+
+        Args:
+            priority: Class of the operation, by default that of the
+                current job, or VISIBLE outside any job
+        """
+        if _holding_slot.get():
+            # Nested operations run in the slot already held
+            yield
+            return
+
+        if priority is None:
+            priority = _current_priority.get()
+        if priority is None:
+            priority = Priority.VISIBLE
+        state = self._state()
+        if not self._can_start(state, priority):
+            waiter = asyncio.get_running_loop().create_future()
+            state.waiting[priority].append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Handed a slot just as it was cancelled, pass it on
+                    state.running[priority] -= 1
+                    self._wake(state)
+                else:
+                    if waiter in state.waiting[priority]:
+                        state.waiting[priority].remove(waiter)
+                    # Less urgent classes may have been waiting behind it
+                    self._wake(state)
+                raise
+        else:
+            state.running[priority] += 1
+
+        token = _holding_slot.set(True)
+        try:
+            yield
+        finally:
+            _holding_slot.reset(token)
+            state.running[priority] -= 1
+            self._wake(state)
+
+    async def run(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        priority: Priority | None = None,
+    ) -> T:
+        """Await an operation in a slot."""
+        async with self.slot(priority):
+            return await operation()
+
+    def spawn(
+        self,
+        operation: Callable[[], Awaitable[object]],
+        priority: Priority,
+        group: str | None = None,
+    ) -> asyncio.Task:
+        """Start a job that nobody awaits, e.g. a cache write.
+
+        Errors are logged, since there is no caller to raise them to.
+        """
+        state = self._state()
+
+        async def run_job() -> None:
+            async with self.job(priority, group):
+                try:
+                    await self.run(operation, priority)
+                except Exception:
+                    logger.exception("Background %s job failed", priority.name)
+
+        task = asyncio.create_task(run_job())
+        if group is not None:
+            # Registered now so it can be cancelled before it starts
+            state.groups.setdefault(group, set()).add(task)
+        state.spawned.add(task)
+        task.add_done_callback(state.spawned.discard)
+        return task
+
+    def cancel_group(self, group: str) -> None:
+        """Cancel every job in a group, waiting or running."""
+        try:
+            state = self._state()
+        except RuntimeError:
+            return  # No loop, so nothing is running
+        for task in state.groups.pop(group, ()):
+            task.cancel()
+
+    async def join(self) -> None:
+        """Wait until every spawned job has finished."""
+        state = self._state()
+        while state.spawned:
+            await asyncio.gather(*state.spawned, return_exceptions=True)
+
+    def running(self, priority: Priority) -> int:
+        """Number of operations of a class holding a slot."""
+        return self._state().running[priority]
+
+    def waiting(self, priority: Priority) -> int:
+        """Number of operations of a class waiting for a slot."""
+        return len(self._state().waiting[priority])
+
+    def _can_start(self, state: _LoopState, priority: Priority) -> bool:
+        """Check whether an operation may take a slot of a class now."""
+        if state.running[priority] >= self.concurrency[priority]:
+            return False
+        return not any(state.waiting[p] for p in Priority if p <= priority)
+
+    def _wake(self, state: _LoopState) -> None:
+        """Hand free slots to waiting operations, most urgent class first."""
+        for priority in Priority:
+            queue = state.waiting[priority]
+            while queue and state.running[priority] < self.concurrency[priority]:
+                waiter = queue.popleft()
+                if waiter.done():
+                    continue
+                state.running[priority] += 1
+                waiter.set_result(None)
+            if queue:
+                return  # Less urgent classes wait for this one
+
+
+# Shared by the app, the repository and the poster widgets
+work_scheduler = WorkScheduler()
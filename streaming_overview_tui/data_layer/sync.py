@@ -0,0 +1,169 @@
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+import httpx
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import col
+from sqlmodel import select
+from sqlmodel import update
+
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitOpenError
+from streaming_overview_tui.data_layer.database import get_session
+from streaming_overview_tui.data_layer.database import init_db
+from streaming_overview_tui.data_layer.models import CachedMovie
+from streaming_overview_tui.data_layer.models import CachedShow
+from streaming_overview_tui.data_layer.models import SyncState
+from streaming_overview_tui.data_layer.repository import ContentRepository
+from streaming_overview_tui.data_layer.tmdb_client import TMDBClient
+
+# TMDB's /changes endpoints only cover the last 14 days
+CHANGES_WINDOW_DAYS = 14
+
+# Max titles refreshed at the same time
+SYNC_CONCURRENCY = 8
+
+# IDs per UPDATE statement when extending unchanged entries
+_UPDATE_CHUNK_SIZE = 500
+
+SYNC_STATE_NAME = "changes"
+
+
+class SyncReport:
+    """Outcome of a sync run."""
+
+    def __init__(self, refreshed: int = 0, extended: int = 0, failed: int = 0):
+        self.refreshed = refreshed  # Changed titles fetched again
+        self.extended = extended  # Unchanged titles whose cache was extended
+        self.failed = failed  # Changed titles that could not be fetched
+
+
+async def _fetch_changed_ids(
+    fetch_page: Callable[[date, date, int], Awaitable[dict]],
+    start_date: date,
+    end_date: date,
+) -> set[int]:
+    """Collect IDs from all pages of a /changes feed."""
+    changed: set[int] = set()
+    page = 1
+    while True:
+        data = await fetch_page(start_date, end_date, page)
+        changed.update(item["id"] for item in data.get("results", []) if "id" in item)
+        if page >= data.get("total_pages", 1):
+            return changed
+        page += 1
+
+
+def _load_watermark() -> datetime | None:
+    """Get the time of the last successful sync."""
+    with get_session() as session:
+        state = session.get(SyncState, SYNC_STATE_NAME)
+        return state.synced_at if state else None
+
+
+def _save_watermark(synced_at: datetime) -> None:
+    """Store the time of the last successful sync."""
+    with get_session() as session:
+        state = session.get(SyncState, SYNC_STATE_NAME)
+        if state:
+            state.synced_at = synced_at
+        else:
+            session.add(SyncState(name=SYNC_STATE_NAME, synced_at=synced_at))
+        session.commit()
+
+
+def _cached_ids(
+    model: type[CachedMovie] | type[CachedShow], since: datetime | None = None
+) -> set[int]:
+    """Get IDs of cached entries, optionally only those cached since a time."""
+    with get_session() as session:
+        statement = select(model.id)
+        if since is not None:
+            statement = statement.where(model.cached_at >= since)
+        return set(session.exec(statement).all())
+
+
+def _extend_cache(
+    model: type[CachedMovie] | type[CachedShow], ids: set[int], cached_at: datetime
+) -> None:
+    """Mark cached entries as fresh without fetching them."""
+    id_list = sorted(ids)
+    with get_session() as session:
+        for i in range(0, len(id_list), _UPDATE_CHUNK_SIZE):
+            chunk = id_list[i : i + _UPDATE_CHUNK_SIZE]
+            session.exec(
+                update(model)
+                .where(col(model.id).in_(chunk))
+                .values(cached_at=cached_at)
+            )
+        session.commit()
+
+
+async def sync_changes(
+    repository: ContentRepository | None = None,
+    client: TMDBClient | None = None,
+    concurrency: int = SYNC_CONCURRENCY,
+) -> SyncReport:
+    """Refresh cached titles that changed on TMDB since the last sync.
+
+    Reads /movie/changes and /tv/changes from the last sync watermark,
+    refreshes cached titles that appear in them concurrently, and extends
+    cached_at of all other entries that were fresh at the start of the
+    window. Entries cached before the window (e.g. on the first sync, or
+    after more than 14 days) are left alone and expire as usual.
+
+    The watermark only moves on when every changed title was refreshed, so
+    the next sync reads the same changes again and retries the failed ones.
+
+    Raises:
+        httpx.HTTPError: If a /changes feed cannot be read
+        CircuitOpenError: If TMDB is known to be unreachable
+    """
+    init_db()
+    repository = repository or ContentRepository()
+    client = client or TMDBClient()
+
+    now = datetime.now(timezone.utc)
+    earliest = now - timedelta(days=CHANGES_WINDOW_DAYS)
+    watermark = _load_watermark()
+    window_start = watermark if watermark and watermark > earliest else earliest
+
+    changed_movies, changed_shows = await asyncio.gather(
+        _fetch_changed_ids(client.get_movie_changes, window_start.date(), now.date()),
+        _fetch_changed_ids(client.get_tv_changes, window_start.date(), now.date()),
+    )
+
+    to_refresh = [
+        ("movie", movie_id) for movie_id in changed_movies & _cached_ids(CachedMovie)
+    ] + [("show", show_id) for show_id in changed_shows & _cached_ids(CachedShow)]
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def refresh(content_type: str, content_id: int) -> bool:
+        async with semaphore:
+            try:
+                await repository.refresh(content_type, content_id)
+            except (httpx.HTTPError, CircuitOpenError, SQLAlchemyError):
+                return False
+            return True
+
+    outcomes = await asyncio.gather(*(refresh(*key) for key in to_refresh))
+
+    # Entries cached within the window and absent from the feeds are unchanged
+    unchanged_movies = _cached_ids(CachedMovie, since=window_start) - changed_movies
+    unchanged_shows = _cached_ids(CachedShow, since=window_start) - changed_shows
+    _extend_cache(CachedMovie, unchanged_movies, now)
+    _extend_cache(CachedShow, unchanged_shows, now)
+
+    refreshed = sum(outcomes)
+    if refreshed == len(outcomes):
+        _save_watermark(now)
+    return SyncReport(
+        refreshed=refreshed,
+        extended=len(unchanged_movies) + len(unchanged_shows),
+        failed=len(outcomes) - refreshed,
+    )
@@ -1,14 +1,32 @@
+from datetime import date
+
 import httpx
 
 from streaming_overview_tui.config_layer import app_settings
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitBreaker
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitOpenError
+from streaming_overview_tui.data_layer.circuit_breaker import tmdb_circuit_breaker
+from streaming_overview_tui.data_layer.scheduler import work_scheduler
+from streaming_overview_tui.data_layer.scheduler import WorkScheduler
 
 
 class TMDBClient:
     """HTTP client for TMDB API."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        circuit_breaker: CircuitBreaker | None = None,
+        scheduler: WorkScheduler | None = None,
+    ):
         self.base_url = app_settings.tmdb_url
         self.token = app_settings.tmdb_bearer_token
+        self.circuit_breaker = circuit_breaker or tmdb_circuit_breaker
+        self.scheduler = scheduler or work_scheduler
+
+    @property
+    def is_offline(self) -> bool:
+        """True while the circuit breaker considers TMDB unreachable."""
+        return self.circuit_breaker.is_offline
 
     def _get_headers(self) -> dict[str, str]:
         """Get authorization headers."""
@@ -19,6 +37,50 @@ class TMDBClient:
             "Accept": "application/json",
         }
 
+    async def _get(self, path: str, params: dict) -> dict:
+        """Send a GET request through the circuit breaker.
+
+        The request waits for a scheduler slot of the calling job's class.
+        Network errors and 5xx responses count as failures. Other HTTP
+        errors mean TMDB is reachable, so they count as successes.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and no probe is due
+        """
+        headers = self._get_headers()
+        async with self.scheduler.slot():
+            return await self._send(path, params, headers)
+
+    async def _send(self, path: str, params: dict, headers: dict[str, str]) -> dict:
+        """Send a GET request, recording the outcome with the circuit breaker."""
+        if not self.circuit_breaker.allow_request():
+            raise CircuitOpenError("TMDB API circuit is open")
+
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.get(
+                    f"{self.base_url}{path}",
+                    headers=headers,
+                    params=params,
+                )
+                response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            raise
+        except httpx.TransportError:
+            self.circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            # Cancelled or otherwise inconclusive, let the next probe through
+            self.circuit_breaker.release_probe()
+            raise
+
+        self.circuit_breaker.record_success()
+        return response.json()
+
     async def search_multi(self, query: str) -> dict:
         """Search for movies and TV shows.
 
@@ -28,14 +90,7 @@ class TMDBClient:
         Returns:
             TMDB API response with results
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/search/multi",
-                headers=self._get_headers(),
-                params={"query": query},
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._get("/search/multi", {"query": query})
 
     async def get_movie(self, movie_id: int) -> dict:
         """Get movie details with watch providers.
@@ -46,14 +101,9 @@ class TMDBClient:
         Returns:
             TMDB API response with movie details and watch providers
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/movie/{movie_id}",
-                headers=self._get_headers(),
-                params={"append_to_response": "watch/providers"},
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._get(
+            f"/movie/{movie_id}", {"append_to_response": "watch/providers"}
+        )
 
     async def get_show(self, show_id: int) -> dict:
         """Get TV show details with watch providers.
@@ -64,11 +114,50 @@ class TMDBClient:
         Returns:
             TMDB API response with show details and watch providers
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/tv/{show_id}",
-                headers=self._get_headers(),
-                params={"append_to_response": "watch/providers"},
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._get(
+            f"/tv/{show_id}", {"append_to_response": "watch/providers"}
+        )
+
+    async def get_movie_changes(
+        self, start_date: date, end_date: date, page: int = 1
+    ) -> dict:
+        """Get IDs of movies changed in a date range (at most 14 days).
+
+        Args:
+            start_date: First day of the range
+            end_date: Last day of the range
+            page: Result page, starting at 1
+
+        Returns:
+            TMDB API response with changed IDs and total_pages
+        """
+        return await self._get(
+            "/movie/changes",
+            {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "page": page,
+            },
+        )
+
+    async def get_tv_changes(
+        self, start_date: date, end_date: date, page: int = 1
+    ) -> dict:
+        """Get IDs of TV shows changed in a date range (at most 14 days).
+
+        Args:
+            start_date: First day of the range
+            end_date: Last day of the range
+            page: Result page, starting at 1
+
+        Returns:
+            TMDB API response with changed IDs and total_pages
+        """
+        return await self._get(
+            "/tv/changes",
+            {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "page": page,
+            },
+        )
@@ -0,0 +1,56 @@
+import math
+import re
+
+TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p"
+
+# Poster widths served by the TMDB image CDN, smallest first
+POSTER_SIZES = [92, 154, 185, 342, 500, 780]
+ORIGINAL_SIZE = "original"
+DEFAULT_POSTER_SIZE = "w500"
+
+# TMDB posters are 2:3 (width:height)
+POSTER_ASPECT_RATIO = 1.5
+
+_IMAGE_URL_PATTERN = re.compile(rf"^{re.escape(TMDB_IMAGE_BASE_URL)}/[^/]+(/.+)$")
+
+
+def pick_poster_size(pixel_width: int, pixel_height: int) -> str:
+    """Pick the smallest TMDB poster size covering the target pixel size.
+
+    Args:
+        pixel_width: Target width in pixels
+        pixel_height: Target height in pixels
+
+    Returns:
+        TMDB size name, e.g. "w92"
+    """
+    needed_width = max(pixel_width, math.ceil(pixel_height / POSTER_ASPECT_RATIO))
+    for width in POSTER_SIZES:
+        if width >= needed_width:
+            return f"w{width}"
+    return ORIGINAL_SIZE
+
+
+def build_image_url(image_path: str, size: str = DEFAULT_POSTER_SIZE) -> str:
+    """Build a TMDB image CDN URL from a relative image path."""
+    return f"{TMDB_IMAGE_BASE_URL}/{size}{image_path}"
+
+
+def sized_image_url(url: str, pixel_width: int, pixel_height: int) -> str:
+    """Rewrite a TMDB image URL to the smallest size covering the target.
+
+    URLs not served by the TMDB image CDN are returned unchanged.
+    """
+    match = _IMAGE_URL_PATTERN.match(url)
+    if match is None:
+        return url
+    return build_image_url(match.group(1), pick_poster_size(pixel_width, pixel_height))
+
+
+def image_path_from_url(url: str) -> str:
+    """Get the size-independent image path from a TMDB image URL.
+
+    URLs not served by the TMDB image CDN are returned unchanged.
+    """
+    match = _IMAGE_URL_PATTERN.match(url)
+    return match.group(1) if match else url
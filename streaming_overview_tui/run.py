@@ -1,7 +1,151 @@
-from streaming_overview_tui.tui_layer.stream_app import StreamApp
+import argparse
+import json
+import sys
+from pathlib import Path
 
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(
+        prog="streaming-tui",
+        description="Search movies and TV shows across your streaming services",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    import_parser = subparsers.add_parser(
+        "import-catalog",
+        help="Import a TMDB daily ID export into the local search index",
+    )
+    import_parser.add_argument(
+        "file", type=Path, help="Path to a movie_ids or tv_series_ids export"
+    )
+    import_parser.add_argument(
+        "--type",
+        choices=["movie", "tv"],
+        help="Content type of the export (detected from file name by default)",
+    )
+
+    subparsers.add_parser(
+        "sync", help="Refresh cached titles that changed on TMDB since the last sync"
+    )
+
+    search_parser = subparsers.add_parser(
+        "search", help="Search without the TUI, printing results as they resolve"
+    )
+    search_parser.add_argument("query", help="Title to search for")
+    search_parser.add_argument(
+        "--json", action="store_true", help="Print each result as a line of JSON"
+    )
+
+    return parser
+
+
+def _import_catalog(args: argparse.Namespace) -> None:
+    """Run the import-catalog command."""
+    from streaming_overview_tui.data_layer.catalog_import import import_catalog
+
+    content_type = {"movie": "movie", "tv": "show", None: None}[args.type]
+
+    def report(count: int) -> None:
+        print(f"\rImported {count:,} titles...", end="", flush=True)
+
+    try:
+        total = import_catalog(args.file, content_type=content_type, on_progress=report)
+    except ValueError as e:
+        print(f"{e}. Pass --type movie or --type tv.", file=sys.stderr)
+        raise SystemExit(1) from None
+    except OSError as e:
+        print(f"Cannot read {args.file}: {e.strerror or e}", file=sys.stderr)
+        raise SystemExit(1) from None
+    print(f"\rImported {total:,} titles from {args.file.name} and built search index")
+
+
+def _sync() -> None:
+    """Run the sync command."""
+    import asyncio
+
+    import httpx
+
+    from streaming_overview_tui.data_layer.circuit_breaker import CircuitOpenError
+    from streaming_overview_tui.data_layer.sync import sync_changes
+
+    try:
+        report = asyncio.run(sync_changes())
+    except (httpx.HTTPError, CircuitOpenError) as e:
+        print(f"Could not read changes from TMDB: {e}", file=sys.stderr)
+        raise SystemExit(1) from None
+    print(
+        f"Refreshed {report.refreshed} changed titles, "
+        f"extended {report.extended} unchanged, {report.failed} failed"
+    )
+    if report.failed:
+        print("Failed titles are retried on the next sync")
+
+
+def _search(args: argparse.Namespace) -> None:
+    """Run the search command. Does not import Textual or PIL."""
+    import asyncio
+
+    from streaming_overview_tui.config_layer.config import load_user_config
+    from streaming_overview_tui.config_layer.config import StreamingService
+    from streaming_overview_tui.search_engine.search import search_stream
+    from streaming_overview_tui.search_engine.search import SearchError
+
+    subscriptions = [
+        StreamingService(s)
+        for s in load_user_config().subscriptions
+        if s in [ss.value for ss in StreamingService]
+    ]
+
+    async def run() -> None:
+        async for rank, item in search_stream(args.query, subscriptions):
+            if args.json:
+                line = json.dumps(
+                    {
+                        "rank": rank,
+                        "tmdb_id": item.tmdb_id,
+                        "title": item.title,
+                        "year": item.year,
+                        "content_type": item.content_type,
+                        "services": [service.value for service in item.services],
+                        "watch_urls": {
+                            service.value: url
+                            for service, url in item.watch_urls.items()
+                        },
+                        "rating": item.rating,
+                        "overview": item.overview,
+                        "poster_url": item.poster_url,
+                    }
+                )
+            else:
+                year = f" ({item.year})" if item.year else ""
+                services = ", ".join(service.value for service in item.services)
+                line = f"{item.title}{year}: {services or 'not on your services'}"
+            print(line, flush=True)
+
+    try:
+        asyncio.run(run())
+    except SearchError as e:
+        print(e, file=sys.stderr)
+        raise SystemExit(1) from None
+
+
+def main(argv: list[str] | None = None):
+    args = _build_parser().parse_args(argv)
+
+    if args.command == "import-catalog":
+        _import_catalog(args)
+        return
+    if args.command == "sync":
+        _sync()
+        return
+    if args.command == "search":
+        _search(args)
+        return
+
+    # Textual and the poster stack are only imported for the TUI
+    from streaming_overview_tui.tui_layer.stream_app import StreamApp
+
     app = StreamApp()
     app.run()
 
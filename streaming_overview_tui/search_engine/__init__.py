@@ -1,5 +1,19 @@
 from streaming_overview_tui.search_engine.models import ContentItem
 from streaming_overview_tui.search_engine.models import SearchResult
+from streaming_overview_tui.search_engine.search import refresh_availability
+from streaming_overview_tui.search_engine.search import restore_results
 from streaming_overview_tui.search_engine.search import search
+from streaming_overview_tui.search_engine.search import search_stream
+from streaming_overview_tui.search_engine.search import SearchError
+from streaming_overview_tui.search_engine.speculative import SpeculativeSearch
 
-__all__ = ["ContentItem", "SearchResult", "search"]
+__all__ = [
+    "ContentItem",
+    "SearchError",
+    "SearchResult",
+    "refresh_availability",
+    "restore_results",
+    "search",
+    "search_stream",
+    "SpeculativeSearch",
+]
@@ -27,6 +27,7 @@ class SearchResult:
     available: list[ContentItem]
     other: list[ContentItem]
     error: str | None
+    offline: bool = False  # Served from the local cache while TMDB is unreachable
 
 
 # Mapping from TMDB provider names to StreamingService enum
@@ -1,101 +1,253 @@
+import asyncio
+from collections.abc import AsyncIterator
+
 import httpx
+from sqlalchemy.exc import SQLAlchemyError
 
 from streaming_overview_tui.config_layer.config import StreamingService
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitOpenError
+from streaming_overview_tui.data_layer.models import Movie
+from streaming_overview_tui.data_layer.models import Show
+from streaming_overview_tui.data_layer.models import TMDBSearchResult
 from streaming_overview_tui.data_layer.repository import ContentRepository
+from streaming_overview_tui.data_layer.tmdb_images import build_image_url
 from streaming_overview_tui.search_engine.models import ContentItem
 from streaming_overview_tui.search_engine.models import map_provider_to_service
 from streaming_overview_tui.search_engine.models import SearchResult
 
 MIN_QUERY_LENGTH = 2
-TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w500"
+
+
+class SearchError(Exception):
+    """TMDB search failed. The message is meant for the user."""
 
 
 def _build_poster_url(poster_path: str | None) -> str | None:
     """Build full poster URL from TMDB poster path."""
     if not poster_path:
         return None
-    return f"{TMDB_IMAGE_BASE_URL}{poster_path}"
+    return build_image_url(poster_path)
 
 
 async def search(
     query: str,
     subscribed_services: list[StreamingService],
+    tmdb_results: list[TMDBSearchResult] | None = None,
 ) -> SearchResult:
-    """Search for movies and TV shows, partitioned by streaming availability."""
+    """Search for movies and TV shows, partitioned by streaming availability.
+
+    Args:
+        query: Search query
+        subscribed_services: Services the user subscribes to
+        tmdb_results: TMDB results already fetched for the query, e.g. by a
+            speculative search. They are used instead of searching TMDB.
+    """
     if len(query) < MIN_QUERY_LENGTH:
         return SearchResult(available=[], other=[], error=None)
 
     repository = ContentRepository()
 
     try:
-        tmdb_results = await repository.search(query)
-    except httpx.TimeoutException:
-        return SearchResult(
-            available=[],
-            other=[],
-            error="TMDB API request failed: connection timeout",
-        )
-    except httpx.HTTPStatusError as e:
-        return SearchResult(
-            available=[],
-            other=[],
-            error=f"TMDB API returned error: HTTP {e.response.status_code}",
-        )
-    except Exception:
-        return SearchResult(
-            available=[],
-            other=[],
-            error="TMDB API unavailable - please try again later",
-        )
+        if tmdb_results is None:
+            tmdb_results = await repository.search(query)
+    except Exception as e:
+        return SearchResult(available=[], other=[], error=_describe_error(e))
 
+    offline = bool(repository.is_offline)
     available: list[ContentItem] = []
     other: list[ContentItem] = []
 
     for tmdb_item in tmdb_results:
-        # Fetch full details with streaming providers
-        try:
-            if tmdb_item.content_type == "movie":
-                details = await repository.get_movie(tmdb_item.id)
-                content_type = "movie"
-            else:
-                details = await repository.get_show(tmdb_item.id)
-                content_type = "tv"
-        except Exception:
-            continue  # Skip items that fail to fetch
+        item = await _fetch_item(repository, tmdb_item, subscribed_services)
+        if item is None:
+            continue
+
+        # Partition by availability
+        if item.services:
+            available.append(item)
+        else:
+            other.append(item)
+
+    return SearchResult(available=available, other=other, error=None, offline=offline)
+
+
+async def search_stream(
+    query: str, subscribed_services: list[StreamingService]
+) -> AsyncIterator[tuple[int, ContentItem]]:
+    """Search like search(), yielding each result as soon as it resolves.
+
+    Details of all TMDB results are fetched at once, so results come in the
+    order their details arrive rather than TMDB's.
+
+    Yields:
+        Position of the result in TMDB's order, and the result
+
+    Raises:
+        SearchError: If the TMDB search fails
+    """
+    if len(query) < MIN_QUERY_LENGTH:
+        return
+
+    repository = ContentRepository()
+    try:
+        tmdb_results = await repository.search(query)
+    except Exception as e:
+        raise SearchError(_describe_error(e)) from e
+
+    async def fetch(
+        rank: int, tmdb_item: TMDBSearchResult
+    ) -> tuple[int, ContentItem | None]:
+        return rank, await _fetch_item(repository, tmdb_item, subscribed_services)
+
+    tasks = [
+        asyncio.create_task(fetch(rank, tmdb_item))
+        for rank, tmdb_item in enumerate(tmdb_results)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            rank, item = await next_done
+            if item is not None:
+                yield rank, item
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def restore_results(
+    keys: list[tuple[str, int]], subscribed_services: list[StreamingService]
+) -> SearchResult:
+    """Rebuild earlier search results from the local cache, without TMDB.
+
+    Results keep their order, and are partitioned by the current
+    subscriptions. Results no longer in the cache are left out. Blocks on
+    the database, so call it from a worker thread.
 
+    Args:
+        keys: Content type ("movie" or "tv") and TMDB ID of each result
+        subscribed_services: Services the user subscribes to
+    """
+    repository = ContentRepository()
+    available: list[ContentItem] = []
+    other: list[ContentItem] = []
+    for content_type, tmdb_id in keys:
+        details = repository.get_cached(
+            "movie" if content_type == "movie" else "show", tmdb_id
+        )
         if details is None:
             continue
 
-        # Map providers to subscribed services with URLs
-        matched_services: list[StreamingService] = []
-        watch_urls: dict[StreamingService, str] = {}
-        for provider in details.providers:
-            service = map_provider_to_service(provider.provider_name)
-            if (
-                service
-                and service in subscribed_services
-                and service not in matched_services
-            ):
-                matched_services.append(service)
-                watch_urls[service] = provider.link
-
-        # Build ContentItem
-        item = ContentItem(
-            tmdb_id=tmdb_item.id,
-            title=tmdb_item.title,
-            year=tmdb_item.year,
-            content_type=content_type,
-            poster_url=_build_poster_url(tmdb_item.poster_path),
-            services=matched_services,
-            overview=details.overview,
+        if isinstance(details, Movie):
+            year, cached_type = details.release_year, "movie"
+        else:
+            year, cached_type = details.first_air_year, "show"
+        tmdb_item = TMDBSearchResult(
+            id=details.id,
+            title=details.title,
+            year=year,
+            content_type=cached_type,
+            poster_path=details.poster_path,
             rating=details.rating,
-            watch_urls=watch_urls,
         )
-
-        # Partition by availability
-        if matched_services:
+        item = _build_item(tmdb_item, details, subscribed_services)
+        if item.services:
             available.append(item)
         else:
             other.append(item)
 
     return SearchResult(available=available, other=other, error=None)
+
+
+async def refresh_availability(items: list[ContentItem]) -> None:
+    """Fetch the streaming availability of results from TMDB again.
+
+    Stops at the first failure, since TMDB is then likely unreachable.
+    """
+    repository = ContentRepository()
+    for item in items:
+        content_type = "movie" if item.content_type == "movie" else "show"
+        try:
+            await repository.refresh(content_type, item.tmdb_id)
+        except (httpx.HTTPError, CircuitOpenError, SQLAlchemyError):
+            return
+
+
+def _describe_error(error: Exception) -> str:
+    """Describe a failed TMDB search for the user."""
+    if isinstance(error, httpx.TimeoutException):
+        return "TMDB API request failed: connection timeout"
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"TMDB API returned error: HTTP {error.response.status_code}"
+    return "TMDB API unavailable - please try again later"
+
+
+async def _fetch_item(
+    repository: ContentRepository,
+    tmdb_item: TMDBSearchResult,
+    subscribed_services: list[StreamingService],
+) -> ContentItem | None:
+    """Fetch full details of a TMDB result and match its streaming providers.
+
+    While TMDB is unreachable, results without cached details, such as hits
+    from the catalog index, are kept without details or streaming providers.
+
+    Returns:
+        The result, or None if its details could not be fetched
+    """
+    try:
+        if tmdb_item.content_type == "movie":
+            details = await repository.get_movie(tmdb_item.id)
+        else:
+            details = await repository.get_show(tmdb_item.id)
+    except CircuitOpenError:
+        return _build_item_without_details(tmdb_item)
+    except Exception:
+        return None  # Skip items that fail to fetch
+
+    if details is None:
+        return None
+    return _build_item(tmdb_item, details, subscribed_services)
+
+
+def _build_item_without_details(tmdb_item: TMDBSearchResult) -> ContentItem:
+    """Build a result from the search hit alone, with no streaming providers."""
+    return ContentItem(
+        tmdb_id=tmdb_item.id,
+        title=tmdb_item.title,
+        year=tmdb_item.year,
+        content_type="movie" if tmdb_item.content_type == "movie" else "tv",
+        poster_url=_build_poster_url(tmdb_item.poster_path),
+        services=[],
+        rating=tmdb_item.rating,
+    )
+
+
+def _build_item(
+    tmdb_item: TMDBSearchResult,
+    details: Movie | Show,
+    subscribed_services: list[StreamingService],
+) -> ContentItem:
+    """Build a result from TMDB details, matching its streaming providers."""
+    # Map providers to subscribed services with URLs
+    matched_services: list[StreamingService] = []
+    watch_urls: dict[StreamingService, str] = {}
+    for provider in details.providers:
+        service = map_provider_to_service(provider.provider_name)
+        if (
+            service
+            and service in subscribed_services
+            and service not in matched_services
+        ):
+            matched_services.append(service)
+            watch_urls[service] = provider.link
+
+    return ContentItem(
+        tmdb_id=tmdb_item.id,
+        title=tmdb_item.title,
+        year=tmdb_item.year,
+        content_type="movie" if tmdb_item.content_type == "movie" else "tv",
+        poster_url=_build_poster_url(tmdb_item.poster_path),
+        services=matched_services,
+        overview=details.overview,
+        rating=details.rating,
+        watch_urls=watch_urls,
+    )
@@ -0,0 +1,116 @@
+import asyncio
+from collections.abc import Callable
+
+import httpx
+from sqlalchemy.exc import SQLAlchemyError
+
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitOpenError
+from streaming_overview_tui.data_layer.models import TMDBSearchResult
+from streaming_overview_tui.data_layer.repository import ContentRepository
+from streaming_overview_tui.data_layer.scheduler import Priority
+from streaming_overview_tui.data_layer.scheduler import work_scheduler
+from streaming_overview_tui.search_engine.search import MIN_QUERY_LENGTH
+
+
+class SpeculativeSearch:
+    """Searches TMDB for the query being typed, before the debounce fires.
+
+    At most one speculative request runs at a time, as a PREFETCH job so
+    it gives way to the real search. A new one starts once the previous
+    one has returned and the query has grown, or at once if the user edits
+    the query so the running one no longer applies.
+
+    When the search finally runs, a speculation for the same query saves
+    the TMDB round trip. One for a prefix of it gives provisional results
+    to show while the real search runs.
+    """
+
+    def __init__(
+        self, repository_factory: Callable[[], ContentRepository] | None = None
+    ):
+        self._repository_factory = repository_factory or ContentRepository
+        self._query: str | None = None
+        self._task: asyncio.Task[list[TMDBSearchResult] | None] | None = None
+
+    def update(self, query: str) -> None:
+        """Speculate on the query as typed so far. Call on every keystroke."""
+        if len(query) < MIN_QUERY_LENGTH:
+            self.cancel()
+            return
+
+        if self._task is not None and self._query is not None:
+            if query == self._query:
+                return
+            if query.startswith(self._query) and not self._task.done():
+                return  # Still useful, let it finish
+        self.cancel()
+
+        self._query = query
+        self._task = asyncio.create_task(self._search(query))
+
+    async def take(self, query: str) -> list[TMDBSearchResult] | None:
+        """Get TMDB results speculated for exactly this query.
+
+        Waits for the speculation if it is still running. A speculation
+        for a different query is cancelled unless the query extends it.
+
+        Returns:
+            The results, or None if there are none to reuse
+        """
+        if self._task is None or self._query is None:
+            return None
+        if query == self._query:
+            task = self._task
+            self._task = None
+            self._query = None
+            try:
+                return await task
+            except asyncio.CancelledError:
+                return None
+        if not query.startswith(self._query):
+            self.cancel()
+        return None
+
+    async def provisional_results(self, query: str) -> list[TMDBSearchResult]:
+        """Get results of a speculation on a prefix of the query.
+
+        Waits for the speculation if it is still running. It was sent before
+        the search for the query, so it should return first.
+
+        Only results whose titles contain every word of the query are kept,
+        since TMDB matches the prefix more loosely.
+        """
+        if (
+            self._task is None
+            or self._query is None
+            or not query.startswith(self._query)
+        ):
+            return []
+        try:
+            results = await asyncio.shield(self._task)
+        except asyncio.CancelledError:
+            return []
+        words = query.lower().split()
+        return [
+            result
+            for result in results or []
+            if all(word in result.title.lower() for word in words)
+        ]
+
+    def cancel(self) -> None:
+        """Cancel the running speculation and forget its results."""
+        if self._task is not None:
+            self._task.cancel()
+        self._task = None
+        self._query = None
+
+    async def _search(self, query: str) -> list[TMDBSearchResult] | None:
+        """Search TMDB, returning None if the request fails.
+
+        The search for the final query then runs and reports the error.
+        """
+        try:
+            async with work_scheduler.job(Priority.PREFETCH, group="speculation"):
+                return await self._repository_factory().search(query)
+        except (httpx.HTTPError, CircuitOpenError, SQLAlchemyError):
+            return None
@@ -1,8 +1,12 @@
+import asyncio
+import functools
 import webbrowser
+from typing import ClassVar
 
 from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
+from textual.binding import BindingType
 from textual.containers import Horizontal
 from textual.containers import Vertical
 from textual.screen import Screen
@@ -12,19 +16,49 @@ from textual.widgets import Footer
 from textual.widgets import Header
 from textual.widgets import Input
 from textual.widgets import Static
+from textual.worker import get_current_worker
 
 from streaming_overview_tui.config_layer.config import load_user_config
 from streaming_overview_tui.config_layer.config import StreamingService
+from streaming_overview_tui.config_layer.config import UserConfig
+from streaming_overview_tui.data_layer.cache_warmer import CacheWarmer
+from streaming_overview_tui.data_layer.poster_downloader import HIGHLIGHT_PRIORITY
+from streaming_overview_tui.data_layer.poster_downloader import poster_downloader
+from streaming_overview_tui.data_layer.poster_downloader import PosterDownloader
+from streaming_overview_tui.data_layer.saved_session import load_session
+from streaming_overview_tui.data_layer.saved_session import save_session
+from streaming_overview_tui.data_layer.scheduler import Priority
+from streaming_overview_tui.data_layer.scheduler import work_scheduler
+from streaming_overview_tui.data_layer.tmdb_images import image_path_from_url
+from streaming_overview_tui.search_engine import ContentItem
+from streaming_overview_tui.search_engine import refresh_availability
+from streaming_overview_tui.search_engine import restore_results
 from streaming_overview_tui.search_engine import search
 from streaming_overview_tui.search_engine import SearchResult
+from streaming_overview_tui.search_engine import SpeculativeSearch
+from streaming_overview_tui.tui_layer.search_debouncer import AdaptiveDebouncer
 from streaming_overview_tui.tui_layer.widgets import DetailPanel
+from streaming_overview_tui.tui_layer.widgets import PosterWidget
 from streaming_overview_tui.tui_layer.widgets import ResultsList
+from streaming_overview_tui.tui_layer.widgets.results_list import item_key
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import (
+    GraphicsProtocol,
+)
+
+# Seconds without input before the cache warmer starts
+WARM_IDLE_SECONDS = 5.0
+
+# Posters prefetched above and below the highlighted item
+PREFETCH_RADIUS = 2
+
+# Restored results whose availability is refreshed, from the top
+RESTORE_REFRESH_LIMIT = 10
 
 
 class MainScreen(Screen):
     """Main screen for searching and browsing content."""
 
-    BINDINGS = [
+    BINDINGS: ClassVar[list[BindingType]] = [
         Binding("escape", "focus_search", "Focus search"),
         Binding("q", "quit", "Quit"),
     ]
@@ -65,11 +99,27 @@ class MainScreen(Screen):
     }
     """
 
-    def __init__(self) -> None:
+    def __init__(self, remember_session: bool = False) -> None:
+        """Create the screen.
+
+        Args:
+            remember_session: Save the search on screen when closed, and
+                restore the saved one when opened
+        """
         super().__init__()
+        self._remember_session = remember_session
         self._search_timer: Timer | None = None
+        self._debouncer = AdaptiveDebouncer()
+        self._speculation = SpeculativeSearch()
         self._current_query: str = ""
-        self._user_config = load_user_config()
+        # Read from disk in the background on mount, searches wait for it
+        self._user_config = UserConfig()
+        self._config_loaded = asyncio.Event()
+        self._idle_timer: Timer | None = None
+        self._cache_warmer = CacheWarmer()
+        self._result_items: list[ContentItem] = []
+        self._selected_item: ContentItem | None = None
+        self._prefetch_jobs: dict[str, asyncio.Task] = {}  # By poster URL
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -87,8 +137,80 @@ class MainScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Focus search input on mount."""
+        """Focus search input and load the user config on mount."""
         self.query_one("#search-input", Input).focus()
+        self._load_config()
+        if self._remember_session:
+            self._restore_session()
+        self._schedule_warming()
+
+    @work(group="config")
+    async def _load_config(self) -> None:
+        """Read the user config without blocking the first frame."""
+        try:
+            self._user_config = await asyncio.to_thread(load_user_config)
+        finally:
+            # Search with the defaults rather than not at all
+            self._config_loaded.set()
+
+    def on_unmount(self) -> None:
+        """Stop background jobs started for this screen and save the session."""
+        work_scheduler.cancel_group("poster-prefetch")
+        if self._remember_session:
+            save_session(
+                self._current_query,
+                [item_key(item) for item in self._result_items],
+                item_key(self._selected_item) if self._selected_item else None,
+            )
+
+    @work(group="session")
+    async def _restore_session(self) -> None:
+        """Show the search saved when the app was last closed, from the cache.
+
+        The results are then revalidated against TMDB in the background.
+        """
+        saved = await asyncio.to_thread(load_session)
+        if saved is None:
+            return
+        await self._config_loaded.wait()
+        result = await asyncio.to_thread(
+            restore_results, saved.results, self._subscriptions()
+        )
+        items = result.available + result.other
+        if self._current_query or not items:
+            return  # A new search was started, or nothing left to show
+
+        self._current_query = saved.query
+        search_input = self.query_one("#search-input", Input)
+        with search_input.prevent(Input.Changed):
+            search_input.value = saved.query
+        self._update_results(result)
+        results_list = self.query_one(ResultsList)
+        for item in items:
+            if item_key(item) == saved.selected:
+                results_list.highlighted = results_list.index_of(item)
+                break
+        self._set_status(f"Showing {len(items)} results from last time, updating...")
+        self._revalidate_session(saved.query, items)
+
+    @work(exclusive=True)
+    async def _revalidate_session(self, query: str, items: list[ContentItem]) -> None:
+        """Refresh availability of restored results and search again.
+
+        Exclusive with _do_search, so a new search cancels it. If TMDB cannot
+        give fresh results, the restored ones stay on screen.
+        """
+        async with work_scheduler.job(Priority.PREFETCH, group="session"):
+            await refresh_availability(items[:RESTORE_REFRESH_LIMIT])
+            result = await search(query, self._subscriptions())
+        if query != self._current_query:
+            return
+        if result.error or result.offline or not (result.available or result.other):
+            self._set_status(
+                f"Showing {len(items)} results from last time, could not update them"
+            )
+            return
+        self._update_results(result)
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes with debounce."""
@@ -96,18 +218,24 @@ class MainScreen(Screen):
             return
 
         self._current_query = event.value
+        self._pause_warming()
 
         # Cancel pending search timer
         if self._search_timer is not None:
             self._search_timer.stop()
 
-        # Set new debounce timer (300ms)
+        # Set new debounce timer, adapted to typing speed and search latency
+        delay = self._debouncer.keystroke()
+        # Use the wait to search TMDB for what has been typed so far
+        self._speculation.update(event.value)
         if event.value:
-            self._search_timer = self.set_timer(0.3, self._trigger_search)
+            self._search_timer = self.set_timer(delay, self._trigger_search)
         else:
             # Clear results immediately if input is empty
             self.query_one(ResultsList).results = None
             self.query_one(DetailPanel).item = None
+            self._result_items = []
+            self._selected_item = None
 
     def _trigger_search(self) -> None:
         """Trigger the search after debounce."""
@@ -118,22 +246,52 @@ class MainScreen(Screen):
     @work(exclusive=True)
     async def _do_search(self, query: str) -> None:
         """Perform search in background worker."""
+        async with work_scheduler.job(Priority.INTERACTIVE, group="search"):
+            await self._search(query)
+
+    async def _search(self, query: str) -> None:
+        """Search and show the results."""
         # Update status
         self._set_status("Searching...")
 
         # Get subscribed services
-        subscriptions = [
-            StreamingService(s)
-            for s in self._user_config.subscriptions
-            if s in [ss.value for ss in StreamingService]
-        ]
+        await self._config_loaded.wait()
+        subscriptions = self._subscriptions()
+
+        # Reuse a speculative TMDB search for this query, if one was made
+        tmdb_results = await self._speculation.take(query)
+        if tmdb_results is not None:
+            self._update_results(
+                await search(query, subscriptions, tmdb_results=tmdb_results)
+            )
+            return
 
         # Perform search
-        result = await search(query, subscriptions)
+        self._debouncer.search_started()
+        task = asyncio.create_task(search(query, subscriptions))
+        try:
+            # Show matches from a search for a prefix while this one runs
+            provisional = await self._speculation.provisional_results(query)
+            if provisional:
+                result = await search(query, subscriptions, tmdb_results=provisional)
+                if not task.done():
+                    self._update_results(result)
+            result = await task
+        finally:
+            task.cancel()
+        self._debouncer.search_finished()
 
         # Update UI
         self._update_results(result)
 
+    def _subscriptions(self) -> list[StreamingService]:
+        """Get the services the user subscribes to."""
+        return [
+            StreamingService(s)
+            for s in self._user_config.subscriptions
+            if s in [ss.value for ss in StreamingService]
+        ]
+
     def _set_status(self, message: str) -> None:
         """Update status bar."""
         self.query_one("#status-bar", Static).update(message)
@@ -146,17 +304,144 @@ class MainScreen(Screen):
         total = len(result.available) + len(result.other)
         if result.error:
             self._set_status(result.error)
+        elif result.offline and total == 0:
+            self._set_status(f"Offline - no cached results for '{self._current_query}'")
+        elif result.offline:
+            self._set_status(f"Offline - showing {total} cached results")
         elif total == 0:
             self._set_status(f"No results found for '{self._current_query}'")
         else:
             self._set_status(f"Found {total} results")
 
-        # Clear detail panel
-        self.query_one(DetailPanel).item = None
+        # Clear detail panel. Otherwise the results list announces the item
+        # it highlights, which the panel shows in place of the current one.
+        if total == 0:
+            self.query_one(DetailPanel).item = None
+            self._selected_item = None
+
+        # Drop poster downloads for the previous results, then fetch the
+        # posters at the top so the first highlight shows without loading
+        self._result_items = result.available + result.other
+        work_scheduler.cancel_group("poster-prefetch")
+        self._prefetch_jobs.clear()
+        downloader = self._poster_downloader()
+        poster = self.query_one(PosterWidget)
+        downloader.cancel(
+            keep={
+                poster.download_url(item.poster_url)
+                for item in self._result_items
+                if item.poster_url
+            }
+        )
+        self._prefetch_posters(-1)
+
+        # Warm recently searched titles once the user goes idle
+        for item in result.available + result.other:
+            content_type = "movie" if item.content_type == "movie" else "show"
+            self._cache_warmer.note_recent(content_type, item.tmdb_id)
+        self._schedule_warming()
+
+    def _schedule_warming(self) -> None:
+        """Start the cache warmer once the UI has been idle for a while."""
+        if self._idle_timer is not None:
+            self._idle_timer.stop()
+        self._idle_timer = self.set_timer(WARM_IDLE_SECONDS, self._warm_cache)
+
+    def _pause_warming(self) -> None:
+        """Stop the cache warmer as soon as the user starts typing."""
+        if self._idle_timer is not None:
+            self._idle_timer.stop()
+            self._idle_timer = None
+        self.workers.cancel_group(self, "cache-warmer")
+
+    @work(exclusive=True, group="cache-warmer")
+    async def _warm_cache(self) -> None:
+        """Refresh soon-to-expire cache entries in a background worker."""
+        self._idle_timer = None
+        worker = get_current_worker()
+        async with work_scheduler.job(Priority.MAINTENANCE, group="cache-warmer"):
+            await self._cache_warmer.run(should_stop=lambda: worker.is_cancelled)
 
     def on_results_list_item_selected(self, event: ResultsList.ItemSelected) -> None:
         """Handle item selection from results list."""
         self.query_one(DetailPanel).item = event.item
+        self._selected_item = event.item
+
+        index = self.query_one(ResultsList).index_of(event.item)
+        if index is not None:
+            self._prefetch_posters(index)
+
+    def _poster_downloader(self) -> PosterDownloader:
+        """Get the app's poster downloader."""
+        return getattr(self.app, "poster_downloader", poster_downloader)
+
+    def _prefetch_posters(self, index: int) -> None:
+        """Download posters around a result, nearest first.
+
+        Args:
+            index: Position of the highlighted result, -1 before any highlight
+        """
+        poster = self.query_one(PosterWidget)
+        priorities: dict[str, int] = {}
+        start = max(index - PREFETCH_RADIUS, 0)
+        for i, item in enumerate(
+            self._result_items[start : index + PREFETCH_RADIUS + 1], start
+        ):
+            if item.poster_url and not self._is_poster_cached(item):
+                url = poster.download_url(item.poster_url)
+                priorities[url] = HIGHLIGHT_PRIORITY + abs(i - index)
+
+        downloader = self._poster_downloader()
+        # Queued downloads for items no longer near the highlight are dropped
+        downloader.prioritize(priorities)
+        for url in list(self._prefetch_jobs):
+            if url not in priorities:
+                self._prefetch_jobs.pop(url).cancel()
+
+        for url, priority in sorted(priorities.items(), key=lambda p: p[1]):
+            job = self._prefetch_jobs.get(url)
+            if job is not None and not job.done():
+                continue
+            self._prefetch_jobs[url] = work_scheduler.spawn(
+                functools.partial(self._prefetch_poster, downloader, url, priority),
+                Priority.VISIBLE
+                if priority == HIGHLIGHT_PRIORITY
+                else Priority.PREFETCH,
+                group="poster-prefetch",
+            )
+
+    async def _prefetch_poster(
+        self, downloader: PosterDownloader, url: str, priority: int
+    ) -> None:
+        """Download a poster, leaving the download running if cancelled.
+
+        Another item may need the same download, so cancelling the job only
+        stops waiting for it. The downloader drops downloads no longer needed.
+        """
+        download = asyncio.wrap_future(downloader.submit(url, priority))
+        # Collect the outcome even if nobody waits for it any more
+        download.add_done_callback(lambda f: f.cancelled() or f.exception())
+        await asyncio.shield(download)
+
+    def _is_poster_cached(self, item: ContentItem) -> bool:
+        """Check whether a poster renders without downloading."""
+        poster = self.query_one(PosterWidget)
+        if poster.graphics_protocol == GraphicsProtocol.KITTY:
+            image_cache = getattr(self.app, "poster_image_cache", None)
+            return (
+                image_cache is not None
+                and poster.download_url(item.poster_url) in image_cache
+            )
+
+        cache = getattr(self.app, "poster_cache", None)
+        if cache is not None and item.tmdb_id in cache:
+            return True
+        disk_cache = getattr(self.app, "poster_disk_cache", None)
+        return disk_cache is not None and disk_cache.contains(
+            item.tmdb_id,
+            image_path_from_url(item.poster_url),
+            *poster.cell_size,
+        )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle watch button press."""
@@ -0,0 +1,111 @@
+import logging
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# Debounce used until typing cadence and search latency have been observed
+DEFAULT_DEBOUNCE_SECONDS = 0.3
+# Bounds of the adaptive debounce
+MIN_DEBOUNCE_SECONDS = 0.1
+MAX_DEBOUNCE_SECONDS = 0.8
+# Gap between keystrokes at which the default debounce applies
+REFERENCE_TYPING_GAP_SECONDS = 0.2
+# Longer gaps are pauses, not part of the typing cadence
+TYPING_PAUSE_SECONDS = 1.0
+# Search latency at which the default debounce applies
+REFERENCE_LATENCY_SECONDS = 0.4
+# Weight of the newest sample in the moving averages
+SMOOTHING = 0.3
+
+
+class AdaptiveDebouncer:
+    """Chooses how long to wait after a keystroke before searching.
+
+    Keeps moving averages of the gap between keystrokes and of search
+    latency. Typing faster than REFERENCE_TYPING_GAP_SECONDS means more
+    keystrokes are likely coming, so the search waits longer; slow typing
+    already leaves gaps, so it fires sooner. A fast backend makes a wasted
+    request cheap, so the search fires sooner; a slow one makes it wait.
+
+    A search is counted as wasted when a keystroke arrives while it is
+    still running, since its results are about to be replaced.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._last_keystroke: float | None = None
+        self._typing_gap: float | None = None
+        self._latency: float | None = None
+        self._search_started_at: float | None = None
+        self._search_superseded = False
+        self.searches = 0
+        self.wasted_searches = 0
+
+    @property
+    def delay(self) -> float:
+        """Seconds to wait after the latest keystroke before searching."""
+        delay = DEFAULT_DEBOUNCE_SECONDS
+        if self._typing_gap is not None:
+            delay *= REFERENCE_TYPING_GAP_SECONDS / self._typing_gap
+        if self._latency is not None:
+            delay *= min(max(self._latency / REFERENCE_LATENCY_SECONDS, 0.5), 1.5)
+        return min(max(delay, MIN_DEBOUNCE_SECONDS), MAX_DEBOUNCE_SECONDS)
+
+    def keystroke(self) -> float:
+        """Record a keystroke.
+
+        Returns:
+            Seconds to wait before searching
+        """
+        now = self._clock()
+        if self._last_keystroke is not None:
+            gap = now - self._last_keystroke
+            if gap < TYPING_PAUSE_SECONDS:
+                self._typing_gap = _smooth(self._typing_gap, max(gap, 0.01))
+        self._last_keystroke = now
+
+        if self._search_started_at is not None and not self._search_superseded:
+            self._search_superseded = True
+            self.wasted_searches += 1
+
+        delay = self.delay
+        logger.debug(
+            "Debounce %.3fs (typing gap %s, search latency %s)",
+            delay,
+            _format_seconds(self._typing_gap),
+            _format_seconds(self._latency),
+        )
+        return delay
+
+    def search_started(self) -> None:
+        """Record that a search was sent."""
+        self._search_started_at = self._clock()
+        self._search_superseded = False
+        self.searches += 1
+
+    def search_finished(self) -> None:
+        """Record that the running search returned."""
+        if self._search_started_at is None:
+            return
+        latency = self._clock() - self._search_started_at
+        self._latency = _smooth(self._latency, latency)
+        self._search_started_at = None
+        logger.debug(
+            "Search took %.3fs, %d of %d searches wasted",
+            latency,
+            self.wasted_searches,
+            self.searches,
+        )
+
+
+def _smooth(average: float | None, sample: float) -> float:
+    """Update an exponential moving average."""
+    if average is None:
+        return sample
+    return average + SMOOTHING * (sample - average)
+
+
+def _format_seconds(value: float | None) -> str:
+    """Format an average for the log, which may not be known yet."""
+    return "unknown" if value is None else f"{value:.3f}s"
@@ -1,10 +1,31 @@
-from PIL import Image
+import asyncio
+import functools
+
 from textual.app import App
 
+from streaming_overview_tui.config_layer.config import app_settings
 from streaming_overview_tui.config_layer.config import config_exists
+from streaming_overview_tui.data_layer.catalog_import import load_search_index
+from streaming_overview_tui.data_layer.database import warm_up_db
+from streaming_overview_tui.data_layer.poster_cache import DiskPosterCache
+from streaming_overview_tui.data_layer.poster_cache import (
+    GRAPHICS_CACHE_MAX_BYTES,
+)
+from streaming_overview_tui.data_layer.poster_cache import GRAPHICS_IMAGE_SIZE
+from streaming_overview_tui.data_layer.poster_cache import PosterMemoryCache
+from streaming_overview_tui.data_layer.poster_cache import PosterThumbnailStore
+from streaming_overview_tui.data_layer.scheduler import Priority
+from streaming_overview_tui.data_layer.scheduler import work_scheduler
 from streaming_overview_tui.tui_layer.main_screen import MainScreen
 from streaming_overview_tui.tui_layer.setup_screen import SetupComplete
 from streaming_overview_tui.tui_layer.setup_screen import SetupScreen
+from streaming_overview_tui.tui_layer.widgets.poster_decoder import PosterDecoder
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import (
+    cell_pixel_size,
+)
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import (
+    resolve_graphics_protocol,
+)
 
 
 class StreamApp(App):
@@ -14,16 +35,44 @@ class StreamApp(App):
 
     def __init__(self) -> None:
         super().__init__()
-        self.poster_cache: dict[int, Image.Image] = {}
+        self.poster_cache = PosterMemoryCache()
+        self.poster_disk_cache = DiskPosterCache()
+        self.poster_thumbnails = PosterThumbnailStore()
+        self.poster_decoder = PosterDecoder(app_settings.poster_decode_processes)
+        self.poster_graphics = resolve_graphics_protocol(app_settings.poster_graphics)
+        # Full size posters for kitty graphics, keyed by download URL
+        self.poster_image_cache = PosterMemoryCache(
+            GRAPHICS_CACHE_MAX_BYTES, thumbnail_size=GRAPHICS_IMAGE_SIZE
+        )
+        self.poster_cell_pixels = cell_pixel_size()
 
     def on_mount(self) -> None:
         """Route to appropriate screen based on config existence."""
         if config_exists():
-            self.push_screen(MainScreen())
+            self.push_screen(MainScreen(remember_session=True))
         else:
             self.push_screen(SetupScreen())
 
+    def on_ready(self) -> None:
+        """Prepare the database once the first frame is on screen."""
+        work_scheduler.spawn(
+            functools.partial(asyncio.to_thread, self._warm_up_storage),
+            Priority.MAINTENANCE,
+            group="startup",
+        )
+
+    @staticmethod
+    def _warm_up_storage() -> None:
+        """Create tables and load the search index. Blocks, run it in a thread."""
+        warm_up_db()
+        load_search_index()
+
+    def on_unmount(self) -> None:
+        """Stop startup work and poster decoding processes."""
+        work_scheduler.cancel_group("startup")
+        self.poster_decoder.shutdown()
+
     def on_setup_complete(self, message: SetupComplete) -> None:
         """Called when setup is complete. Switch to main screen."""
         self.pop_screen()
-        self.push_screen(MainScreen())
+        self.push_screen(MainScreen(remember_session=True))
@@ -1,3 +1,4 @@
+from textual import events
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.containers import Vertical
@@ -7,9 +8,20 @@ from textual.widgets import Button
 from textual.widgets import Label
 from textual.widgets import Static
 
+from streaming_overview_tui.config_layer.config import StreamingService
 from streaming_overview_tui.search_engine.models import ContentItem
+from streaming_overview_tui.tui_layer.widgets.poster_widget import MAX_POSTER_WIDTH
+from streaming_overview_tui.tui_layer.widgets.poster_widget import POSTER_HEIGHT
+from streaming_overview_tui.tui_layer.widgets.poster_widget import POSTER_WIDTH
 from streaming_overview_tui.tui_layer.widgets.poster_widget import PosterWidget
 
+# Share of the panel width given to the poster
+POSTER_WIDTH_FRACTION = 0.4
+
+# Seconds an item must stay shown before its poster is downloaded, so
+# scrolling through results does not start and cancel a download per item
+POSTER_SETTLE_SECONDS = 0.15
+
 
 class DetailPanel(Widget):
     """Panel showing details of selected content item."""
@@ -71,11 +83,25 @@ class DetailPanel(Widget):
     def compose(self) -> ComposeResult:
         with Horizontal():
             yield PosterWidget(id="poster-container")
-            yield Vertical(id="info-container")
+            with Vertical(id="info-container"):
+                yield Static("Select an item to see details", classes="empty")
+                yield Label(classes="title")
+                yield Label(classes="type")
+                yield Label(classes="rating")
+                yield Static(classes="overview")
 
     def on_mount(self) -> None:
-        """Build initial content when mounted."""
-        self._rebuild_content()
+        """Fill in the content when mounted."""
+        self._update_content()
+
+    def on_resize(self, event: events.Resize) -> None:
+        """Scale the poster with the panel."""
+        width, height = poster_size_for(
+            self.content_size.width, self.content_size.height
+        )
+        poster = self.query_one(PosterWidget)
+        poster.styles.width = width
+        poster.styles.height = height
 
     def render_str(self) -> str:
         """Return string representation for testing."""
@@ -101,56 +127,100 @@ class DetailPanel(Widget):
     def watch_item(self, item: ContentItem | None) -> None:
         """React to item changes."""
         if self.is_mounted:
-            self._rebuild_content()
+            self._update_content()
 
-    def _rebuild_content(self) -> None:
-        """Rebuild the panel content."""
+    def _update_content(self) -> None:
+        """Show the current item in the existing widgets."""
         info_container = self.query_one("#info-container", Vertical)
-        info_container.remove_children()
+        empty = info_container.query_one(".empty", Static)
+        title = info_container.query_one(".title", Label)
+        type_label = info_container.query_one(".type", Label)
+        rating = info_container.query_one(".rating", Label)
+        overview = info_container.query_one(".overview", Static)
 
         poster_widget = self.query_one(PosterWidget)
 
         if self.item is None:
             poster_widget.poster_url = None
             poster_widget.tmdb_id = None
-            info_container.mount(
-                Static("Select an item to see details", classes="empty")
-            )
+            poster_widget.fetch_poster()  # Drops a pending download
+            empty.display = True
+            for widget in (title, type_label, rating, overview):
+                widget.display = False
+            self._update_watch_buttons(info_container, {})
             return
 
-        # Update poster widget
+        # Update poster widget, downloading once the user stops on the item
         poster_widget.poster_url = self.item.poster_url
         poster_widget.tmdb_id = self.item.tmdb_id
-        poster_widget.fetch_poster()
+        poster_widget.fetch_poster(delay=POSTER_SETTLE_SECONDS)
+
+        empty.display = False
 
         # Title and year
         year_str = f" ({self.item.year})" if self.item.year else ""
-        info_container.mount(Label(f"{self.item.title}{year_str}", classes="title"))
+        title.update(f"{self.item.title}{year_str}")
+        title.display = True
 
         # Content type
-        type_str = "Movie" if self.item.content_type == "movie" else "TV Show"
-        info_container.mount(Label(type_str, classes="type"))
+        type_label.update("Movie" if self.item.content_type == "movie" else "TV Show")
+        type_label.display = True
 
         # Rating
         if self.item.rating is not None:
-            info_container.mount(
-                Label(f"Rating: {self.item.rating}/10", classes="rating")
-            )
+            rating.update(f"Rating: {self.item.rating}/10")
+        rating.display = self.item.rating is not None
 
         # Overview
         if self.item.overview:
             # Truncate long overviews
-            overview = self.item.overview
-            if len(overview) > 200:
-                overview = overview[:197] + "..."
-            info_container.mount(Static(overview, classes="overview"))
+            text = self.item.overview
+            if len(text) > 200:
+                text = text[:197] + "..."
+            overview.update(text)
         else:
-            info_container.mount(Static("No description available", classes="overview"))
+            overview.update("No description available")
+        overview.display = True
 
         # Watch buttons
-        for service in self.item.services:
-            if service in self.item.watch_urls:
-                url = self.item.watch_urls[service]
+        self._update_watch_buttons(
+            info_container,
+            {
+                service: self.item.watch_urls[service]
+                for service in self.item.services
+                if service in self.item.watch_urls
+            },
+        )
+
+    def _update_watch_buttons(
+        self, info_container: Vertical, watch_urls: dict[StreamingService, str]
+    ) -> None:
+        """Show a watch button per service, reusing the buttons already mounted.
+
+        Spare buttons are hidden rather than removed.
+        """
+        buttons = list(info_container.query(".watch-button").results(Button))
+        for index, (service, url) in enumerate(watch_urls.items()):
+            if index < len(buttons):
+                btn = buttons[index]
+                btn.label = f"Watch on {service.value}"
+                btn.display = True
+            else:
                 btn = Button(f"Watch on {service.value}", classes="watch-button")
-                btn.url = url  # Store URL on button for handler
                 info_container.mount(btn)
+            btn.url = url  # Store URL on button for handler
+        for btn in buttons[len(watch_urls) :]:
+            btn.display = False
+
+
+def poster_size_for(panel_width: int, panel_height: int) -> tuple[int, int]:
+    """Get the poster size in characters for a panel size.
+
+    The poster takes POSTER_WIDTH_FRACTION of the panel width and keeps the
+    default poster's aspect ratio. It never shrinks below the default size
+    and never outgrows MAX_POSTER_WIDTH or the panel height.
+    """
+    width = min(int(panel_width * POSTER_WIDTH_FRACTION), MAX_POSTER_WIDTH)
+    width = min(width, panel_height * POSTER_WIDTH // POSTER_HEIGHT)
+    width = max(width, POSTER_WIDTH)
+    return width, width * POSTER_HEIGHT // POSTER_WIDTH
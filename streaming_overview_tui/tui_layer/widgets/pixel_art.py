@@ -1,13 +1,43 @@
+from functools import lru_cache
+from io import BytesIO
+
+import numpy as np
 from PIL import Image
+from rich.color import Color
+from rich.color import ColorType
+from rich.color_triplet import ColorTriplet
+from rich.segment import Segment
 from rich.style import Style
+from rich.text import Span
 from rich.text import Text
+from textual.strip import Strip
 
+HALF_BLOCK = "▄"
 
-def image_to_half_blocks(image: Image.Image, width: int, height: int) -> Text:
-    """Convert a PIL Image to Rich Text using half-block characters.
 
-    Each character cell represents 2 vertical pixels using the half-block character.
-    The top pixel is the background color, bottom pixel is foreground color.
+def decode_image(data: bytes, width: int, height: int) -> Image.Image:
+    """Decode image bytes at the lowest resolution that still covers a cell size.
+
+    JPEG images are decoded in draft mode, which lets the decoder scale
+    down by 1/2, 1/4 or 1/8 while decoding instead of after.
+
+    Args:
+        data: Encoded image bytes
+        width: Target width in characters
+        height: Target height in characters (each char = 2 pixels)
+
+    Returns:
+        Decoded PIL Image, at least width x (height * 2) pixels if the
+        source is that large
+    """
+    image = Image.open(BytesIO(data))
+    image.draft("RGB", (width, height * 2))
+    image.load()
+    return image
+
+
+def image_to_color_grid(image: Image.Image, width: int, height: int) -> np.ndarray:
+    """Resize a PIL Image and split it into half-block cell colors.
 
     Args:
         image: PIL Image to convert (will be resized)
@@ -15,7 +45,8 @@ def image_to_half_blocks(image: Image.Image, width: int, height: int) -> Text:
         height: Target height in characters (each char = 2 pixels)
 
     Returns:
-        Rich Text object with styled half-block characters
+        uint8 array of shape (height, width, 2, 3). Index 0 on the third axis
+        is the top pixel (background), index 1 the bottom pixel (foreground).
     """
     # Resize image to target pixel dimensions
     pixel_height = height * 2  # 2 vertical pixels per character
@@ -25,26 +56,162 @@ def image_to_half_blocks(image: Image.Image, width: int, height: int) -> Text:
     if resized.mode != "RGB":
         resized = resized.convert("RGB")
 
-    pixels = resized.load()
-    text = Text()
+    # (2 * height, width, 3) -> (height, 2, width, 3) -> (height, width, 2, 3)
+    pixels = np.asarray(resized, dtype=np.uint8)
+    return pixels.reshape(height, 2, width, 3).transpose(0, 2, 1, 3)
+
+
+def color_grid_to_image(grid: np.ndarray) -> Image.Image:
+    """Turn a half-block color grid back into an image, two pixels per cell.
+
+    Args:
+        grid: uint8 array of shape (height, width, 2, 3)
+
+    Returns:
+        RGB image of width x (height * 2) pixels
+    """
+    height, width = grid.shape[:2]
+    pixels = grid.transpose(0, 2, 1, 3).reshape(height * 2, width, 3)
+    return Image.fromarray(np.ascontiguousarray(pixels), mode="RGB")
+
+
+def color_grid_to_text(grid: np.ndarray) -> Text:
+    """Convert a half-block color grid to Rich Text.
+
+    Runs of horizontally adjacent cells with the same colors share a
+    single span. Styles are cached per color pair across calls.
+
+    Args:
+        grid: uint8 array of shape (height, width, 2, 3)
+
+    Returns:
+        Rich Text object with styled half-block characters
+    """
+    height, width = grid.shape[:2]
+    if height == 0 or width == 0:
+        return Text()
+
+    rows, cols, ends, run_keys = _find_runs(grid)
+
+    # Offsets into the plain text, each row is followed by a newline
+    line_offsets = rows * (width + 1)
+    starts = (line_offsets + cols).tolist()
+    stops = (line_offsets + ends).tolist()
+
+    spans = [
+        Span(start, stop, _key_to_style(key))
+        for start, stop, key in zip(starts, stops, run_keys.tolist())
+    ]
 
-    for char_row in range(height):
-        if char_row > 0:
-            text.append("\n")
+    plain = "\n".join([HALF_BLOCK * width] * height)
+    return Text(plain, spans=spans)
 
-        for col in range(width):
-            # Top pixel (background) and bottom pixel (foreground)
-            top_y = char_row * 2
-            bottom_y = top_y + 1
 
-            top_color = pixels[col, top_y]
-            bottom_color = pixels[col, bottom_y]
+def color_grid_to_strips(grid: np.ndarray) -> list[Strip]:
+    """Convert a half-block color grid to one Strip per row.
 
-            # Convert RGB tuples to hex colors
-            bg_hex = "#{:02x}{:02x}{:02x}".format(*top_color)
-            fg_hex = "#{:02x}{:02x}{:02x}".format(*bottom_color)
+    Strips go straight to Textual's line API, so a widget can build them
+    once per image and repaint without segmenting Rich Text again.
+
+    Args:
+        grid: uint8 array of shape (height, width, 2, 3)
+
+    Returns:
+        List of height strips, each width cells long
+    """
+    height, width = grid.shape[:2]
+    if height == 0 or width == 0:
+        return [Strip.blank(width) for _ in range(height)]
 
-            style = Style(color=fg_hex, bgcolor=bg_hex)
-            text.append("\u2584", style=style)
+    rows, cols, ends, run_keys = _find_runs(grid)
 
-    return text
+    lines: list[list[Segment]] = [[] for _ in range(height)]
+    for row, start, end, key in zip(
+        rows.tolist(), cols.tolist(), ends.tolist(), run_keys.tolist()
+    ):
+        lines[row].append(Segment(HALF_BLOCK * (end - start), _key_to_style(key)))
+    return [Strip(segments, width) for segments in lines]
+
+
+def _find_runs(
+    grid: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Find runs of horizontally adjacent cells with the same colors.
+
+    Returns:
+        Row, start column, end column (exclusive) and packed color key of
+        each run, in row-major order
+    """
+    height, width = grid.shape[:2]
+
+    # Pack each pixel into 24 bits, then each cell's top and bottom into 48 bits
+    channels = grid.astype(np.uint64)
+    rgb = (channels[..., 0] << 16) | (channels[..., 1] << 8) | channels[..., 2]
+    keys = (rgb[..., 0] << 24) | rgb[..., 1]
+
+    # A run starts at column 0 and wherever the key differs from its left neighbor
+    run_starts = np.ones((height, width), dtype=bool)
+    run_starts[:, 1:] = keys[:, 1:] != keys[:, :-1]
+    rows, cols = np.nonzero(run_starts)
+
+    # Each run ends where the next one starts, or at the end of its row
+    ends = np.empty_like(cols)
+    ends[:-1] = cols[1:]
+    row_ends = rows[:-1] != rows[1:]
+    ends[:-1][row_ends] = width
+    ends[-1] = width
+
+    return rows, cols, ends, keys[rows, cols]
+
+
+@lru_cache(maxsize=4096)
+def _rgb_to_color(rgb: int) -> Color:
+    """Build a truecolor Color from a packed 24-bit RGB value."""
+    triplet = ColorTriplet(rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF)
+    return Color(f"#{rgb:06x}", ColorType.TRUECOLOR, triplet=triplet)
+
+
+@lru_cache(maxsize=8192)
+def _key_to_style(key: int) -> Style:
+    """Build the Style for a packed top/bottom color key."""
+    return Style(color=_rgb_to_color(key & 0xFFFFFF), bgcolor=_rgb_to_color(key >> 24))
+
+
+def decode_poster(
+    data: bytes, width: int, height: int, thumbnail_size: tuple[int, int]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Decode image bytes into a thumbnail and a half-block color grid.
+
+    Takes and returns only bytes and arrays, so it can run in another process.
+
+    Args:
+        data: Encoded image bytes
+        width: Target width in characters
+        height: Target height in characters (each char = 2 pixels)
+        thumbnail_size: Max (width, height) of the returned thumbnail
+
+    Returns:
+        RGB thumbnail pixels of shape (h, w, 3) and the color grid
+    """
+    image = decode_image(data, width, height)
+    grid = image_to_color_grid(image, width, height)
+    thumbnail = image.convert("RGB")
+    thumbnail.thumbnail(thumbnail_size)
+    return np.asarray(thumbnail, dtype=np.uint8), grid
+
+
+def image_to_half_blocks(image: Image.Image, width: int, height: int) -> Text:
+    """Convert a PIL Image to Rich Text using half-block characters.
+
+    Each character cell represents 2 vertical pixels using the half-block character.
+    The top pixel is the background color, bottom pixel is foreground color.
+
+    Args:
+        image: PIL Image to convert (will be resized)
+        width: Target width in characters
+        height: Target height in characters (each char = 2 pixels)
+
+    Returns:
+        Rich Text object with styled half-block characters
+    """
+    return color_grid_to_text(image_to_color_grid(image, width, height))
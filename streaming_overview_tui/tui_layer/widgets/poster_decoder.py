@@ -0,0 +1,82 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+from streaming_overview_tui.data_layer.poster_cache import THUMBNAIL_SIZE
+from streaming_overview_tui.tui_layer.widgets.pixel_art import decode_poster
+
+
+class PosterDecoder:
+    """Decodes posters into thumbnails and half-block color grids, or full images.
+
+    With processes > 0, decoding runs in a pool of worker processes, so
+    image work never holds the GIL the UI thread needs. Only the encoded
+    bytes and the resulting arrays cross the process boundary. Otherwise,
+    or if the pool breaks, decoding runs in the calling thread.
+    """
+
+    def __init__(self, processes: int = 0):
+        self.processes = processes
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def decode(
+        self, data: bytes, width: int, height: int
+    ) -> tuple[Image.Image, np.ndarray]:
+        """Decode image bytes. Blocks, so call it from a worker thread.
+
+        Args:
+            data: Encoded image bytes
+            width: Target width in characters
+            height: Target height in characters (each char = 2 pixels)
+
+        Returns:
+            RGB thumbnail and a color grid of shape (height, width, 2, 3)
+        """
+        pool = self._get_pool()
+        if pool is None:
+            thumbnail, grid = decode_poster(data, width, height, THUMBNAIL_SIZE)
+        else:
+            try:
+                thumbnail, grid = pool.submit(
+                    decode_poster, data, width, height, THUMBNAIL_SIZE
+                ).result()
+            except BrokenProcessPool:
+                self.processes = 0  # Keep working without the pool
+                thumbnail, grid = decode_poster(data, width, height, THUMBNAIL_SIZE)
+        return Image.fromarray(thumbnail), grid
+
+    def decode_image(self, data: bytes) -> Image.Image:
+        """Decode image bytes at full size, for terminal graphics.
+
+        Runs in the calling thread even with a pool, as sending the full
+        image back from another process costs about as much as decoding it.
+        Blocks, so call it from a worker thread.
+        """
+        image = Image.open(BytesIO(data))
+        return image.convert("RGB")
+
+    def _get_pool(self) -> ProcessPoolExecutor | None:
+        """Start the process pool on first use."""
+        with self._lock:
+            if self.processes <= 0:
+                return None
+            if self._pool is None:
+                # Forking a process with running threads is unsafe
+                context = multiprocessing.get_context("spawn")
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.processes, mp_context=context
+                )
+            return self._pool
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
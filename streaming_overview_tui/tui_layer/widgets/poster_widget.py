@@ -1,22 +1,87 @@
-from io import BytesIO
+import asyncio
+import functools
+import itertools
+from collections import OrderedDict
+from concurrent.futures import CancelledError
 
-import httpx
+import numpy as np
 from PIL import Image
 from rich.text import Text
+from textual import events
 from textual import work
+from textual.driver import Driver
+from textual.geometry import Region
 from textual.reactive import reactive
+from textual.strip import Strip
+from textual.timer import Timer
 from textual.widget import Widget
-from textual.worker import get_current_worker
 from textual.worker import Worker
 
-from streaming_overview_tui.tui_layer.widgets.pixel_art import image_to_half_blocks
+from streaming_overview_tui.data_layer.poster_cache import (
+    PLACEHOLDER_THUMBNAIL_CELLS,
+)
+from streaming_overview_tui.data_layer.poster_downloader import HIGHLIGHT_PRIORITY
+from streaming_overview_tui.data_layer.poster_downloader import poster_downloader
+from streaming_overview_tui.data_layer.scheduler import Priority
+from streaming_overview_tui.data_layer.scheduler import work_scheduler
+from streaming_overview_tui.data_layer.tmdb_images import image_path_from_url
+from streaming_overview_tui.data_layer.tmdb_images import POSTER_ASPECT_RATIO
+from streaming_overview_tui.data_layer.tmdb_images import sized_image_url
+from streaming_overview_tui.tui_layer.widgets.pixel_art import color_grid_to_image
+from streaming_overview_tui.tui_layer.widgets.pixel_art import color_grid_to_strips
+from streaming_overview_tui.tui_layer.widgets.pixel_art import image_to_color_grid
+from streaming_overview_tui.tui_layer.widgets.poster_decoder import PosterDecoder
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import (
+    DEFAULT_CELL_PIXELS,
+)
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import encode_kitty
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import (
+    GraphicsProtocol,
+)
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import kitty_delete
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import kitty_place
 
-# Poster dimensions in characters
+# Default poster dimensions in characters
 POSTER_WIDTH = 12
 POSTER_HEIGHT = 18
 
-# TMDB image base URL
-TMDB_IMAGE_BASE = "https://image.tmdb.org/t/p/w92"
+# Largest poster drawn, downloads are sized for it so resizing never refetches
+MAX_POSTER_WIDTH = 40
+MAX_POSTER_HEIGHT = 60
+
+# Largest poster width downloaded, TMDB's original files are far larger
+MAX_DOWNLOAD_WIDTH = 780
+
+# Rendered posters kept per (source, width, height)
+RENDER_CACHE_SIZE = 16
+
+# (id(source), width, height) -> (source, strips). Holding the source keeps
+# its id from being reused while the entry exists.
+_render_cache: OrderedDict[
+    tuple[int, int, int], tuple[Image.Image | np.ndarray, list[Strip]]
+] = OrderedDict()
+
+# Kitty image IDs, one per widget
+_kitty_image_ids = itertools.count(1)
+
+
+def poster_download_url(
+    poster_url: str,
+    columns: int = MAX_POSTER_WIDTH,
+    rows: int = MAX_POSTER_HEIGHT,
+    cell_pixels: tuple[int, int] = (1, 2),
+) -> str:
+    """Get the URL of the smallest TMDB size covering a poster.
+
+    Args:
+        poster_url: TMDB poster URL of any size
+        columns: Poster width in cells, the largest poster by default
+        rows: Poster height in cells, the largest poster by default
+        cell_pixels: Pixel size of a cell, 1x2 for half-blocks
+    """
+    width = min(columns * cell_pixels[0], MAX_DOWNLOAD_WIDTH)
+    height = min(rows * cell_pixels[1], int(MAX_DOWNLOAD_WIDTH * POSTER_ASPECT_RATIO))
+    return sized_image_url(poster_url, width, height)
 
 
 PLACEHOLDER = """\
@@ -84,76 +149,399 @@ class PosterWidget(Widget):
         super().__init__(**kwargs)
         self.poster_url = poster_url
         self.tmdb_id = tmdb_id
-        self._rendered_art: Text | None = None
+        self._strips: list[Strip] | None = None  # Built once per image and size
+        # Decoded image, or a color grid when no image is at hand
+        self._source: Image.Image | np.ndarray | None = None
         self._loading = False
         self._fetch_worker: Worker | None = None
+        self._fetch_timer: Timer | None = None  # Delayed start of the download
+        # Poster drawn with the kitty graphics protocol instead of strips
+        self._graphics_image: Image.Image | None = None
+        self._graphics_url: str | None = None  # Download the image came from
+        self._graphics_pending = False
+        self._kitty_image_id = next(_kitty_image_ids)
+        self._kitty_sent = False
+
+    @property
+    def cell_size(self) -> tuple[int, int]:
+        """Current poster size in characters, the default before layout."""
+        width, height = self.size
+        if width == 0 or height == 0:
+            return POSTER_WIDTH, POSTER_HEIGHT
+        return width, height
+
+    @property
+    def graphics_protocol(self) -> GraphicsProtocol:
+        """Protocol used to draw posters, set on the app.
+
+        Half-blocks when there is no terminal to write graphics to, e.g. when
+        the app is served in a browser.
+        """
+        protocol = getattr(self.app, "poster_graphics", GraphicsProtocol.HALF_BLOCKS)
+        if self._terminal_driver() is None:
+            return GraphicsProtocol.HALF_BLOCKS
+        return protocol
+
+    @property
+    def cell_pixels(self) -> tuple[int, int]:
+        """Pixel size of a terminal cell, set on the app."""
+        return getattr(self.app, "poster_cell_pixels", DEFAULT_CELL_PIXELS)
+
+    def download_url(self, poster_url: str) -> str:
+        """Get the URL a poster is downloaded from for this widget.
+
+        Half-block posters are sized for the largest poster, so resizing
+        never downloads again. Kitty posters are sized for the widget's
+        current size in pixels.
+        """
+        if self.graphics_protocol == GraphicsProtocol.KITTY:
+            return poster_download_url(poster_url, *self.cell_size, self.cell_pixels)
+        return poster_download_url(poster_url)
 
     def render(self) -> Text:
-        """Render the poster or placeholder."""
-        if self._rendered_art is not None:
-            return self._rendered_art
+        """Render the placeholder shown while there is no poster."""
         if self._loading:
             return Text(LOADING_PLACEHOLDER, style="dim")
         return Text(PLACEHOLDER, style="dim")
 
+    def render_line(self, y: int) -> Strip:
+        """Render a line of the poster from the cached strips."""
+        if self._strips is None:
+            return super().render_line(y)
+        if y < len(self._strips):
+            return self._strips[y]
+        return Strip.blank(self.size.width)
+
+    def render_lines(self, crop: Region) -> list[Strip]:
+        """Render lines, then draw the graphics poster over them."""
+        lines = super().render_lines(crop)
+        # Painting cells over the region may erase the image, so send it again
+        if self._graphics_image is not None and not self._graphics_pending:
+            self._graphics_pending = True
+            self.call_after_refresh(self._send_graphics)
+        return lines
+
     def render_str(self) -> str:
         """Return string representation for testing."""
+        if self._strips is not None:
+            return "\n".join(strip.text for strip in self._strips)
         return str(self.render())
 
-    def fetch_poster(self) -> None:
-        """Start async fetch of poster image."""
-        if self.poster_url is None or self.tmdb_id is None:
-            return
+    def fetch_poster(self, delay: float = 0.0) -> None:
+        """Start async fetch of poster image.
 
-        # Check cache first
-        cache = getattr(self.app, "poster_cache", {})
-        if self.tmdb_id in cache:
-            self._render_image(cache[self.tmdb_id])
-            return
+        Posters in memory are shown at once, ones in the disk cache once the
+        delay has passed. A download replaces any earlier one still pending
+        or running.
 
+        Args:
+            delay: Seconds to wait before reading the disk cache or
+                downloading. Another call in the meantime replaces the
+                download, so a poster is only fetched once the user stops on
+                an item.
+        """
         # Cancel any existing fetch
+        if self._fetch_timer is not None:
+            self._fetch_timer.stop()
+            self._fetch_timer = None
         if self._fetch_worker is not None:
             self._fetch_worker.cancel()
+            self._fetch_worker = None
+
+        if self.poster_url is None or self.tmdb_id is None:
+            return
+
+        # Check cache first
+        if self.graphics_protocol == GraphicsProtocol.KITTY:
+            # Kitty draws the full image, the thumbnails in poster_cache are
+            # no sharper than half-blocks
+            url = self.download_url(self.poster_url)
+            image_cache = getattr(self.app, "poster_image_cache", None)
+            image = image_cache.get(url) if image_cache is not None else None
+            if image is not None:
+                self._show_graphics(image, url)
+                return
+        else:
+            cache = getattr(self.app, "poster_cache", None)
+            image = cache.get(self.tmdb_id) if cache is not None else None
+            if image is not None:
+                self._show_source(image)
+                return
 
         self._loading = True
+        self._clear_graphics()
+        self._source = None
+        self._strips = None
+        self._show_thumbnail()
         self.refresh()
+        if delay > 0:
+            self._fetch_timer = self.set_timer(delay, self._start_fetch)
+        else:
+            self._start_fetch()
+
+    def _start_fetch(self) -> None:
+        """Start the download worker."""
+        self._fetch_timer = None
         self._fetch_worker = self._do_fetch()
 
-    @work(exclusive=True, thread=True)
-    def _do_fetch(self) -> None:
-        """Fetch poster image in background thread."""
-        worker = get_current_worker()
-        if worker.is_cancelled:
-            return
+    @work(exclusive=True)
+    async def _do_fetch(self) -> None:
+        """Fetch poster image in background worker."""
+        downloader = getattr(self.app, "poster_downloader", poster_downloader)
+        poster_url = self.poster_url
+        tmdb_id = self.tmdb_id
+        width, height = self.cell_size
+        kitty = self.graphics_protocol == GraphicsProtocol.KITTY
+        url = self.download_url(poster_url)
+
+        # Posters rendered in an earlier session need no download or decode.
+        # Read here rather than on each highlight, which may come in quick
+        # succession while scrolling.
+        disk_cache = getattr(self.app, "poster_disk_cache", None)
+        if not kitty and disk_cache is not None and tmdb_id is not None:
+            grid = await asyncio.to_thread(
+                disk_cache.get, tmdb_id, image_path_from_url(poster_url), width, height
+            )
+            if grid is not None:
+                self._render_grid(grid)
+                return
 
         try:
-            with httpx.Client() as client:
-                response = client.get(self.poster_url)
-                response.raise_for_status()
+            async with work_scheduler.job(Priority.VISIBLE, group="poster"):
+                async with work_scheduler.slot():
+                    data = await asyncio.to_thread(
+                        downloader.fetch, url, priority=HIGHLIGHT_PRIORITY
+                    )
+                decoder = getattr(self.app, "poster_decoder", None) or PosterDecoder()
+                async with work_scheduler.slot():
+                    if kitty:
+                        image = await asyncio.to_thread(decoder.decode_image, data)
+                        grid = None
+                    else:
+                        image, grid = await asyncio.to_thread(
+                            decoder.decode, data, width, height
+                        )
+        except CancelledError:
+            return  # Results changed before the download finished
+        except Exception:
+            self._show_placeholder()
+            return
 
-                if worker.is_cancelled:
-                    return
+        # Cache the image
+        if kitty:
+            image_cache = getattr(self.app, "poster_image_cache", None)
+            if image_cache is not None:
+                image_cache.put(url, image)
+        else:
+            cache = getattr(self.app, "poster_cache", None)
+            if cache is not None and tmdb_id is not None:
+                cache.put(tmdb_id, image)
 
-                image = Image.open(BytesIO(response.content))
+        # Writing to disk can wait until nothing more urgent is running
+        work_scheduler.spawn(
+            functools.partial(
+                asyncio.to_thread,
+                self._store_poster,
+                tmdb_id,
+                poster_url,
+                width,
+                height,
+                image,
+                grid,
+            ),
+            Priority.MAINTENANCE,
+            group="poster-cache",
+        )
 
-                # Cache the image
-                cache = getattr(self.app, "poster_cache", None)
-                if cache is not None and self.tmdb_id is not None:
-                    cache[self.tmdb_id] = image
+        if grid is None:
+            self._show_graphics(image, url)
+        else:
+            self._show_source(image, grid)
 
-                self.app.call_from_thread(self._render_image, image)
+    def _store_poster(
+        self,
+        tmdb_id: int | None,
+        poster_url: str,
+        width: int,
+        height: int,
+        image: Image.Image,
+        grid: np.ndarray | None,
+    ) -> None:
+        """Save a downloaded poster to the caches that outlive the session.
 
-        except Exception:
-            self.app.call_from_thread(self._show_placeholder)
+        Posters drawn with kitty graphics have no grid to cache on disk.
+        """
+        # Remember a tiny version to paint while this poster loads next time
+        thumbnails = getattr(self.app, "poster_thumbnails", None)
+        if thumbnails is not None:
+            thumbnails.put(
+                image_path_from_url(poster_url),
+                image_to_color_grid(image, *PLACEHOLDER_THUMBNAIL_CELLS),
+            )
+
+        # Cache the rendered grid across sessions
+        disk_cache = getattr(self.app, "poster_disk_cache", None)
+        if disk_cache is not None and tmdb_id is not None and grid is not None:
+            disk_cache.put(
+                tmdb_id, image_path_from_url(poster_url), width, height, grid
+            )
+
+    def _render_grid(self, grid: np.ndarray) -> None:
+        """Display a half-block color grid."""
+        self._show_source(grid)
 
-    def _render_image(self, image: Image.Image) -> None:
-        """Convert image to pixel art and display."""
-        self._rendered_art = image_to_half_blocks(image, POSTER_WIDTH, POSTER_HEIGHT)
+    def _show_source(
+        self, source: Image.Image | np.ndarray, grid: np.ndarray | None = None
+    ) -> None:
+        """Display an image or grid, keeping it to redraw at other sizes.
+
+        Args:
+            source: Decoded image or color grid
+            grid: Color grid of source already converted, if any
+        """
+        self._clear_graphics()
+        self._source = source
+        self._strips = self._build_strips(source, grid)
         self._loading = False
         self.refresh()
 
+    def _build_strips(
+        self, source: Image.Image | np.ndarray, grid: np.ndarray | None = None
+    ) -> list[Strip]:
+        """Get strips for a source at the current size, from the render cache."""
+        width, height = self.cell_size
+        key = (id(source), width, height)
+        cached = _render_cache.get(key)
+        if cached is not None:
+            _render_cache.move_to_end(key)
+            return cached[1]
+
+        if grid is None or grid.shape[:2] != (height, width):
+            if isinstance(source, Image.Image):
+                grid = image_to_color_grid(source, width, height)
+            elif source.shape[:2] == (height, width):
+                grid = source
+            else:
+                # Without a decoded image, scale the grid itself
+                image = color_grid_to_image(source).resize(
+                    (width, height * 2), Image.Resampling.BILINEAR
+                )
+                grid = image_to_color_grid(image, width, height)
+
+        strips = color_grid_to_strips(grid)
+        _render_cache[key] = (source, strips)
+        while len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+        return strips
+
+    def on_resize(self, event: events.Resize) -> None:
+        """Redraw the poster at the new size from the image already decoded."""
+        if self._graphics_image is not None:
+            # A different size may need a larger download to stay sharp
+            if (
+                self.poster_url is not None
+                and self.download_url(self.poster_url) != self._graphics_url
+            ):
+                self.fetch_poster()
+                return
+            width, height = self.cell_size
+            self._strips = [Strip.blank(width)] * height
+        elif self._source is not None:
+            self._strips = self._build_strips(self._source)
+        self.refresh()
+
     def _show_placeholder(self) -> None:
         """Show placeholder on fetch failure."""
-        self._rendered_art = None
+        self._clear_graphics()
+        self._source = None
+        self._strips = None
+        self._loading = False
+        self.refresh()
+
+    @work(exclusive=True, group="poster-thumbnail")
+    async def _show_thumbnail(self) -> None:
+        """Paint a blurry poster from the stored thumbnail while loading.
+
+        The thumbnail is read from the database in a thread, so moving
+        through results never waits on it.
+        """
+        thumbnails = getattr(self.app, "poster_thumbnails", None)
+        if thumbnails is None:
+            return
+        poster_url = self.poster_url
+        thumbnail = await asyncio.to_thread(
+            thumbnails.get, image_path_from_url(poster_url)
+        )
+        # The poster may have loaded or changed in the meantime
+        if thumbnail is None or not self._loading or self.poster_url != poster_url:
+            return
+
+        # Scaled up like any grid without an image, but still loading
+        self._source = thumbnail
+        self._strips = self._build_strips(thumbnail)
+        self.refresh()
+
+    def _show_graphics(self, image: Image.Image, url: str) -> None:
+        """Display an image with the kitty graphics protocol.
+
+        The widget paints blank cells and the image is written over them
+        after each repaint.
+
+        Args:
+            image: Full size image
+            url: Download the image came from
+        """
+        self._clear_graphics()
+        self._source = None
+        self._graphics_image = image
+        self._graphics_url = url
+        width, height = self.cell_size
+        self._strips = [Strip.blank(width)] * height
         self._loading = False
         self.refresh()
+
+    def _send_graphics(self) -> None:
+        """Write the graphics poster at the widget's position on screen."""
+        self._graphics_pending = False
+        region = self.region
+        if self._graphics_image is None or not region:
+            return
+
+        # The terminal keeps the image, later repaints only place it
+        if self._kitty_sent:
+            payload = kitty_place(self._kitty_image_id, *region.size)
+        else:
+            payload = encode_kitty(
+                self._graphics_image, *region.size, self._kitty_image_id
+            )
+            self._kitty_sent = True
+
+        # Save the cursor, move to the widget's top-left cell, restore after
+        self._write_terminal(f"\x1b7\x1b[{region.y + 1};{region.x + 1}H{payload}\x1b8")
+
+    def _clear_graphics(self) -> None:
+        """Forget the graphics poster and remove it from kitty terminals."""
+        if self._kitty_sent:
+            self._write_terminal(kitty_delete(self._kitty_image_id))
+            self._kitty_sent = False
+        self._graphics_image = None
+        self._graphics_url = None
+
+    def on_hide(self) -> None:
+        """Kitty images stay on screen until removed, so hide them too."""
+        if self._kitty_sent:
+            self._write_terminal(kitty_delete(self._kitty_image_id, keep_data=True))
+
+    def _terminal_driver(self) -> Driver | None:
+        """Get the driver writing to a real terminal, if there is one."""
+        if self.app.is_web:
+            return None
+        # Textual has no public way to write raw escape sequences
+        return getattr(self.app, "_driver", None)
+
+    def _write_terminal(self, data: str) -> None:
+        """Write escape sequences straight to the terminal."""
+        driver = self._terminal_driver()
+        if driver is not None:
+            driver.write(data)
+            driver.flush()
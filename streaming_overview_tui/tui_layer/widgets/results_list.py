@@ -1,54 +1,107 @@
-from textual.app import ComposeResult
-from textual.containers import VerticalScroll
+from typing import ClassVar
+
+from rich.segment import Segment
+from rich.style import Style
+from textual import events
+from textual.binding import Binding
+from textual.binding import BindingType
+from textual.geometry import Region
+from textual.geometry import Size
 from textual.message import Message
 from textual.reactive import reactive
-from textual.widget import Widget
-from textual.widgets import Label
-from textual.widgets import ListItem
-from textual.widgets import ListView
-from textual.widgets import Static
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
 
 from streaming_overview_tui.search_engine.models import ContentItem
 from streaming_overview_tui.search_engine.models import SearchResult
 
+AVAILABLE_HEADER = "AVAILABLE ON YOUR SERVICES"
+OTHER_HEADER = "OTHER RESULTS"
+
+
+# Identifies an item across result updates. TMDB ids are only unique per type.
+ItemKey = tuple[str, int]
+
+
+def item_key(item: ContentItem) -> ItemKey:
+    """Key an item by content type and TMDB id."""
+    return (item.content_type, item.tmdb_id)
+
+
+class _Row:
+    """One line of the list: blank, section header, placeholder or item."""
+
+    def __init__(
+        self, kind: str, text: str = "", item_index: int | None = None
+    ) -> None:
+        self.kind = kind  # "blank", "header", "placeholder" or "item"
+        self.text = text
+        self.item_index = item_index  # Position in ResultsList.items
+        self.key: tuple = (kind, text)  # Item rows are keyed by item_key
 
-class ResultsList(Widget):
-    """List of search results in two sections."""
+
+class ResultsList(ScrollView, can_focus=True):
+    """List of search results in two sections.
+
+    Rows are drawn with the line API, so only the rows in the viewport are
+    rendered, however many results there are. New results are reconciled
+    with the old ones by item key: rendered rows are reused, and the
+    highlighted item keeps its place on screen if it is still listed.
+    """
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("down", "cursor_down", "Down", show=False),
+        Binding("end", "last", "Last", show=False),
+        Binding("enter", "select", "Select", show=False),
+        Binding("home", "first", "First", show=False),
+        Binding("pagedown", "page_down", "Page Down", show=False),
+        Binding("pageup", "page_up", "Page Up", show=False),
+        Binding("up", "cursor_up", "Up", show=False),
+    ]
+
+    COMPONENT_CLASSES: ClassVar[set[str]] = {
+        "results-list--header",
+        "results-list--highlight",
+        "results-list--placeholder",
+        "results-list--services",
+    }
 
     DEFAULT_CSS = """
     ResultsList {
         width: 100%;
         height: 100%;
-    }
+        overflow-x: hidden;
 
-    ResultsList .section-header {
-        text-style: bold;
-        color: $primary;
-        padding: 0 1;
-        margin-top: 1;
-    }
+        & > .results-list--header {
+            text-style: bold;
+            color: $primary;
+        }
 
-    ResultsList .result-item {
-        padding: 0 1;
-    }
+        & > .results-list--services {
+            color: $success;
+        }
 
-    ResultsList .services {
-        color: $success;
-    }
+        & > .results-list--placeholder {
+            color: $text-muted;
+            text-style: italic;
+        }
 
-    ResultsList .placeholder {
-        color: $text-muted;
-        text-style: italic;
-        padding: 1;
-    }
+        & > .results-list--highlight {
+            color: $block-cursor-blurred-foreground;
+            background: $block-cursor-blurred-background;
+            text-style: $block-cursor-blurred-text-style;
+        }
 
-    ResultsList ListView {
-        height: auto;
-        max-height: 100%;
+        &:focus > .results-list--highlight {
+            color: $block-cursor-foreground;
+            background: $block-cursor-background;
+            text-style: $block-cursor-text-style;
+        }
     }
     """
 
     results: reactive[SearchResult | None] = reactive(None)
+    highlighted: reactive[int | None] = reactive(None)
 
     class ItemSelected(Message):
         """Message sent when an item is selected."""
@@ -59,11 +112,25 @@ class ResultsList(Widget):
 
     def __init__(self, results: SearchResult | None = None, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.results = results
         self._items: list[ContentItem] = []
+        self._rows: list[_Row] = []
+        self._item_rows: list[int] = []  # Row of each item
+        self._index_by_key: dict[ItemKey, int] = {}
+        self._announce_pending = False
+        # Rendered rows by (row key, highlighted), with the item drawn
+        self._line_cache: dict[
+            tuple[tuple, bool], tuple[ContentItem | None, Strip]
+        ] = {}
+        self.results = results
+
+    @property
+    def items(self) -> list[ContentItem]:
+        """Items in display order, available first."""
+        return self._items
 
-    def compose(self) -> ComposeResult:
-        yield VerticalScroll(id="results-container")
+    def index_of(self, item: ContentItem) -> int | None:
+        """Position of an item in items, or None if it is not listed."""
+        return self._index_by_key.get(item_key(item))
 
     def render_str(self) -> str:
         """Return string representation for testing."""
@@ -77,105 +144,237 @@ class ResultsList(Widget):
 
         parts = []
         if self.results.available:
-            parts.append("AVAILABLE ON YOUR SERVICES")
+            parts.append(AVAILABLE_HEADER)
             for item in self.results.available:
                 services_str = ", ".join(s.value for s in item.services)
                 parts.append(f"{item.title} ({item.year}) - {services_str}")
 
         if self.results.other:
-            parts.append("OTHER RESULTS")
+            parts.append(OTHER_HEADER)
             for item in self.results.other:
                 parts.append(f"{item.title} ({item.year})")
 
         return "\n".join(parts)
 
-    def on_mount(self) -> None:
-        """Build initial content when mounted."""
-        self._rebuild_list()
-
     def watch_results(self, results: SearchResult | None) -> None:
-        """React to results changes."""
-        if self.is_mounted:
-            self._rebuild_list()
-
-    def _rebuild_list(self) -> None:
-        """Rebuild the results list."""
-        container = self.query_one("#results-container", VerticalScroll)
-        container.remove_children()
+        """Reconcile the rows with the new results.
+
+        If the highlighted item is still listed it stays highlighted, at the
+        same height in the viewport. Otherwise the first item is highlighted.
+        The highlighted item is announced either way.
+        """
+        kept_key = None
+        kept_offset = 0
+        if self.highlighted is not None and self.highlighted < len(self._items):
+            kept_key = item_key(self._items[self.highlighted])
+            kept_offset = self._item_rows[self.highlighted] - self.scroll_offset.y
+
+        self._rebuild_rows()
+
+        index = self._index_by_key.get(kept_key)
+        if index is None:
+            self.scroll_to(y=0, animate=False, immediate=True)
+            index = 0 if self._items else None
+        else:
+            self.scroll_to(
+                y=self._item_rows[index] - kept_offset, animate=False, immediate=True
+            )
+
+        if index is not None and index == self.highlighted:
+            # Same position, so the watcher will not run
+            self._schedule_announce()
+        else:
+            self.highlighted = index
+
+    def _rebuild_rows(self) -> None:
+        """Lay out the rows for the current results."""
         self._items = []
+        self._rows = []
+        self._item_rows = []
+        self._index_by_key = {}
 
         if self.results is None:
-            container.mount(Static("Start typing to search...", classes="placeholder"))
-            return
+            self._rows = [
+                _Row("blank"),
+                _Row("placeholder", "Start typing to search..."),
+            ]
+        elif not self.results.available and not self.results.other:
+            message = self.results.error or "No results found"
+            self._rows = [_Row("blank"), _Row("placeholder", message)]
+        else:
+            self._add_section(AVAILABLE_HEADER, self.results.available)
+            self._add_section(OTHER_HEADER, self.results.other)
 
-        if not self.results.available and not self.results.other:
-            if self.results.error:
-                container.mount(Static(self.results.error, classes="placeholder"))
-            else:
-                container.mount(Static("No results found", classes="placeholder"))
+        # Keep rendered rows that are still listed
+        keys = {row.key for row in self._rows}
+        for cache_key in list(self._line_cache):
+            if cache_key[0] not in keys:
+                del self._line_cache[cache_key]
+
+        self.virtual_size = Size(self.size.width, len(self._rows))
+        self.refresh()
+
+    def _add_section(self, header: str, items: list[ContentItem]) -> None:
+        """Add a header and item rows for a non-empty section."""
+        if not items:
             return
+        self._rows.append(_Row("blank"))
+        self._rows.append(_Row("header", header))
+        for item in items:
+            row = _Row("item", item_index=len(self._items))
+            row.key = item_key(item)
+            self._index_by_key[row.key] = len(self._items)
+            self._item_rows.append(len(self._rows))
+            self._rows.append(row)
+            self._items.append(item)
 
-        # Build available section
-        if self.results.available:
-            container.mount(
-                Label("AVAILABLE ON YOUR SERVICES", classes="section-header")
+    def on_focus(self) -> None:
+        """The highlight is drawn differently with focus."""
+        self._line_cache.clear()
+        self.refresh()
+
+    def on_blur(self) -> None:
+        """The highlight is drawn differently without focus."""
+        self._line_cache.clear()
+        self.refresh()
+
+    def on_resize(self, event: events.Resize) -> None:
+        """Match the virtual width to the new size."""
+        self._line_cache.clear()
+        self.virtual_size = Size(self.size.width, len(self._rows))
+
+    def render_line(self, y: int) -> Strip:
+        """Render one row of the viewport."""
+        row_index = self.scroll_offset.y + y
+        if row_index >= len(self._rows):
+            return Strip.blank(self.size.width, self.rich_style)
+
+        row = self._rows[row_index]
+        item = None if row.item_index is None else self._items[row.item_index]
+        is_highlighted = item is not None and row.item_index == self.highlighted
+        key = (row.key, is_highlighted)
+        cached = self._line_cache.get(key)
+        # An item with the same key may have new details, e.g. services
+        if cached is not None and cached[0] == item:
+            return cached[1]
+        strip = self._render_row(row, is_highlighted)
+        self._line_cache[key] = (item, strip)
+        return strip
+
+    def _render_row(self, row: _Row, is_highlighted: bool) -> Strip:
+        """Build the strip for a row, padded to the widget width."""
+        base = self.rich_style
+        if row.kind == "header":
+            style = base + self.get_component_rich_style("results-list--header")
+            segments = [Segment(f" {row.text}", style)]
+        elif row.kind == "placeholder":
+            style = base + self.get_component_rich_style("results-list--placeholder")
+            segments = [Segment(f" {row.text}", style)]
+        elif row.kind == "item":
+            segments = self._item_segments(self._items[row.item_index], base)
+        else:
+            segments = []
+
+        if is_highlighted:
+            highlight = self.get_component_rich_style("results-list--highlight")
+            segments = list(Segment.apply_style(segments, post_style=highlight))
+            base = base + highlight
+
+        width = self.size.width
+        return Strip(segments).crop(0, width).extend_cell_length(width, base)
+
+    def _item_segments(self, item: ContentItem, base: Style) -> list[Segment]:
+        """Segments for an item: title and year, then services if any."""
+        year_str = f" ({item.year})" if item.year else ""
+        segments = [Segment(f" {item.title}{year_str}", base)]
+        if item.services:
+            services_style = base + self.get_component_rich_style(
+                "results-list--services"
             )
-            available_items: list[ListItem] = []
-            for item in self.results.available:
-                self._items.append(item)
-                services_str = ", ".join(s.value for s in item.services)
-                year_str = f" ({item.year})" if item.year else ""
-                available_items.append(
-                    ListItem(
-                        Label(f"{item.title}{year_str} - {services_str}"),
-                        id=f"item-{item.tmdb_id}",
-                    )
-                )
-            container.mount(ListView(*available_items, id="available-list"))
-
-        # Build other section
-        if self.results.other:
-            container.mount(Label("OTHER RESULTS", classes="section-header"))
-            other_items: list[ListItem] = []
-            for item in self.results.other:
-                self._items.append(item)
-                year_str = f" ({item.year})" if item.year else ""
-                other_items.append(
-                    ListItem(
-                        Label(f"{item.title}{year_str}"),
-                        id=f"item-{item.tmdb_id}",
-                    )
-                )
-            container.mount(ListView(*other_items, id="other-list"))
-
-    def _get_item_from_list_event(self, list_view: ListView) -> ContentItem | None:
-        """Get ContentItem from a ListView event by matching item ID."""
-        if list_view.index is None:
-            return None
-        # Get the highlighted ListItem
-        highlighted = list_view.highlighted_child
-        if highlighted is None:
+            services_str = ", ".join(s.value for s in item.services)
+            segments.append(Segment(" - ", base))
+            segments.append(Segment(services_str, services_style))
+        return segments
+
+    def watch_highlighted(self, old: int | None, new: int | None) -> None:
+        """Repaint the affected rows and announce the highlighted item."""
+        for index in (old, new):
+            if index is not None and index < len(self._item_rows):
+                self.refresh_line(self._item_rows[index])
+        if new is None or new >= len(self._items):
+            return
+        self._scroll_to_item(new)
+        self._schedule_announce()
+
+    def _schedule_announce(self) -> None:
+        """Announce the highlighted item after the next refresh.
+
+        Highlight changes within a frame, e.g. from a held arrow key, are
+        announced once, for the item highlighted last.
+        """
+        if not self._announce_pending:
+            self._announce_pending = True
+            self.call_after_refresh(self._announce_highlight)
+
+    def _announce_highlight(self) -> None:
+        """Post ItemSelected for the highlighted item."""
+        self._announce_pending = False
+        if self.highlighted is not None:
+            self.post_message(self.ItemSelected(self._items[self.highlighted]))
+
+    def _scroll_to_item(self, index: int) -> None:
+        """Scroll so the item is visible."""
+        row = self._item_rows[index]
+        self.scroll_to_region(
+            Region(0, row, self.size.width, 1), animate=False, immediate=True
+        )
+
+    def validate_highlighted(self, value: int | None) -> int | None:
+        """Clamp the highlight to the items."""
+        if value is None or not self._items:
             return None
-        # Extract tmdb_id from item ID (format: "item-{tmdb_id}")
-        item_id = highlighted.id
-        if item_id and item_id.startswith("item-"):
-            try:
-                tmdb_id = int(item_id[5:])
-                for item in self._items:
-                    if item.tmdb_id == tmdb_id:
-                        return item
-            except ValueError:
-                pass
-        return None
-
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
-        """Handle item selection."""
-        item = self._get_item_from_list_event(event.list_view)
-        if item:
-            self.post_message(self.ItemSelected(item))
-
-    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
-        """Handle item highlight (for keyboard navigation)."""
-        item = self._get_item_from_list_event(event.list_view)
-        if item:
-            self.post_message(self.ItemSelected(item))
+        return max(0, min(value, len(self._items) - 1))
+
+    def action_cursor_down(self) -> None:
+        """Highlight the next item."""
+        if self.highlighted is not None:
+            self.highlighted += 1
+
+    def action_cursor_up(self) -> None:
+        """Highlight the previous item."""
+        if self.highlighted is not None:
+            self.highlighted -= 1
+
+    def action_first(self) -> None:
+        """Highlight the first item."""
+        if self._items:
+            self.highlighted = 0
+
+    def action_last(self) -> None:
+        """Highlight the last item."""
+        if self._items:
+            self.highlighted = len(self._items) - 1
+
+    def action_page_down(self) -> None:
+        """Move the highlight down by a page."""
+        if self.highlighted is not None:
+            self.highlighted += max(self.scrollable_content_region.height - 1, 1)
+
+    def action_page_up(self) -> None:
+        """Move the highlight up by a page."""
+        if self.highlighted is not None:
+            self.highlighted -= max(self.scrollable_content_region.height - 1, 1)
+
+    def action_select(self) -> None:
+        """Select the highlighted item."""
+        if self.highlighted is not None:
+            self.post_message(self.ItemSelected(self._items[self.highlighted]))
+
+    def on_click(self, event: events.Click) -> None:
+        """Highlight and select the clicked item."""
+        row_index = self.scroll_offset.y + event.y
+        if 0 <= row_index < len(self._rows):
+            item_index = self._rows[row_index].item_index
+            if item_index is not None:
+                self.highlighted = item_index
+                self.action_select()
@@ -0,0 +1,142 @@
+import base64
+import os
+import struct
+import sys
+from collections.abc import Mapping
+from enum import Enum
+from io import BytesIO
+
+from PIL import Image
+
+# Base64 bytes per kitty graphics escape sequence, the protocol's limit
+KITTY_CHUNK_SIZE = 4096
+
+# Pixel size of a terminal cell, when the terminal does not report it
+DEFAULT_CELL_PIXELS = (10, 20)
+
+# TERM_PROGRAM values of terminals that support the kitty graphics protocol
+KITTY_PROGRAMS = ("WezTerm", "ghostty")
+
+
+class GraphicsProtocol(str, Enum):
+    """How posters are drawn in the terminal."""
+
+    HALF_BLOCKS = "half-blocks"
+    KITTY = "kitty"
+
+
+def detect_graphics_protocol(
+    environ: Mapping[str, str] | None = None,
+) -> GraphicsProtocol:
+    """Detect the best image protocol from the terminal's environment variables.
+
+    Falls back to half-blocks inside tmux or screen, which do not pass
+    graphics through reliably, and in terminals without kitty graphics.
+    Protocols that resend the whole image on every repaint, like iTerm2
+    inline images and sixel, write more than half-blocks and are not used.
+    """
+    environ = os.environ if environ is None else environ
+    if environ.get("TMUX") or environ.get("STY"):
+        return GraphicsProtocol.HALF_BLOCKS
+
+    term = environ.get("TERM", "").lower()
+    program = environ.get("TERM_PROGRAM", "")
+    if environ.get("KITTY_WINDOW_ID") or "kitty" in term or program in KITTY_PROGRAMS:
+        return GraphicsProtocol.KITTY
+    return GraphicsProtocol.HALF_BLOCKS
+
+
+def cell_pixel_size(fd: int | None = None) -> tuple[int, int]:
+    """Get the pixel size of a terminal cell from the terminal's window size.
+
+    Args:
+        fd: File descriptor of the terminal, stdout by default
+
+    Returns:
+        Cell (width, height) in pixels, DEFAULT_CELL_PIXELS if the terminal
+        does not report its size in pixels
+    """
+    try:
+        # Not available on Windows
+        import fcntl
+        import termios
+
+        if fd is None:
+            fd = sys.__stdout__.fileno()
+        rows, columns, width, height = struct.unpack(
+            "HHHH", fcntl.ioctl(fd, termios.TIOCGWINSZ, bytes(8))
+        )
+    except (AttributeError, ImportError, OSError, ValueError):
+        return DEFAULT_CELL_PIXELS
+    if not (rows and columns and width and height):
+        return DEFAULT_CELL_PIXELS
+    return width // columns, height // rows
+
+
+def resolve_graphics_protocol(setting: str) -> GraphicsProtocol:
+    """Turn the poster_graphics setting into a protocol.
+
+    Args:
+        setting: "auto" to detect, or a GraphicsProtocol value
+
+    Returns:
+        The protocol, half-blocks if the setting is not recognised
+    """
+    if setting == "auto":
+        return detect_graphics_protocol()
+    try:
+        return GraphicsProtocol(setting)
+    except ValueError:
+        return GraphicsProtocol.HALF_BLOCKS
+
+
+def _png_bytes(image: Image.Image) -> bytes:
+    """Encode an image as compressed PNG."""
+    buffer = BytesIO()
+    image.convert("RGB").save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def encode_kitty(image: Image.Image, columns: int, rows: int, image_id: int) -> str:
+    """Transmit an image and display it with the kitty graphics protocol.
+
+    The image is sent as PNG, split into chunks. The terminal keeps it, so
+    later repaints only need kitty_place.
+
+    Args:
+        image: Image to send
+        columns: Width to draw at, in cells
+        rows: Height to draw at, in cells
+        image_id: ID to refer to the image by later
+
+    Returns:
+        Escape sequences to write at the top-left cell of the image
+    """
+    data = base64.standard_b64encode(_png_bytes(image)).decode("ascii")
+    chunks = [
+        data[i : i + KITTY_CHUNK_SIZE] for i in range(0, len(data), KITTY_CHUNK_SIZE)
+    ]
+
+    parts = []
+    for index, chunk in enumerate(chunks):
+        more = int(index < len(chunks) - 1)
+        if index == 0:
+            # q=2 suppresses responses, C=1 leaves the cursor in place
+            control = (
+                f"a=T,f=100,i={image_id},p=1,c={columns},r={rows},C=1,q=2,m={more}"
+            )
+        else:
+            control = f"m={more}"
+        parts.append(f"\x1b_G{control};{chunk}\x1b\\")
+    return "".join(parts)
+
+
+def kitty_place(image_id: int, columns: int, rows: int) -> str:
+    """Display an image already sent with encode_kitty, replacing its placement."""
+    return f"\x1b_Ga=p,i={image_id},p=1,c={columns},r={rows},C=1,q=2\x1b\\"
+
+
+def kitty_delete(image_id: int, keep_data: bool = False) -> str:
+    """Remove an image from the screen, and from terminal memory unless keep_data."""
+    target = "i" if keep_data else "I"
+    return f"\x1b_Ga=d,d={target},i={image_id},q=2\x1b\\"
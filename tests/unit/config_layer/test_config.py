@@ -0,0 +1,25 @@
+import subprocess
+import sys
+
+from streaming_overview_tui.config_layer.config import LazyAppSettings
+
+
+class TestLazyAppSettings:
+    def test_reads_environment_on_first_use(self, monkeypatch):
+        settings = LazyAppSettings()
+        monkeypatch.setenv("TMDB_URL", "http://tmdb.test")
+
+        assert settings.tmdb_url == "http://tmdb.test"
+        assert settings.cache_warm_budget == 20
+
+    def test_import_does_not_load_pydantic_settings(self):
+        code = (
+            "import sys\n"
+            "from streaming_overview_tui.config_layer import app_settings\n"
+            "print('pydantic_settings' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
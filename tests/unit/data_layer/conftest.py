@@ -0,0 +1,28 @@
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+import pytest
+from sqlmodel import create_engine
+
+from streaming_overview_tui.data_layer import database
+
+
+def days_ago(days: float) -> datetime:
+    return datetime.now(timezone.utc) - timedelta(days=days)
+
+
+@pytest.fixture
+def empty_engine(tmp_path, monkeypatch):
+    """SQLite database in tmp_path used in place of the cache, without tables."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+    monkeypatch.setattr(database, "_engine", engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def engine(empty_engine):
+    """SQLite database in tmp_path used in place of the cache, with its tables."""
+    database.init_db()
+    return empty_engine
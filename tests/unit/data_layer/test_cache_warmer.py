@@ -0,0 +1,109 @@
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from sqlmodel import Session
+
+from streaming_overview_tui.data_layer.cache_warmer import CacheWarmer
+from streaming_overview_tui.data_layer.models import CachedMovie
+from streaming_overview_tui.data_layer.models import CachedShow
+from streaming_overview_tui.data_layer.repository import CACHE_TTL_DAYS
+from tests.unit.data_layer.conftest import days_ago
+
+
+@pytest.fixture
+def repository():
+    repository = MagicMock()
+    repository.refresh = AsyncMock()
+    repository.is_offline = False
+    return repository
+
+
+class TestCacheWarmerCandidates:
+    def test_orders_expiring_entries_by_age(self, engine):
+        with Session(engine) as session:
+            session.add(CachedMovie(id=1, title="Fresh", cached_at=days_ago(1)))
+            session.add(CachedMovie(id=2, title="Old", cached_at=days_ago(28)))
+            session.add(CachedShow(id=3, title="Oldest", cached_at=days_ago(29)))
+            session.commit()
+
+        warmer = CacheWarmer(budget=10)
+        assert warmer.candidates(10) == [("show", 3), ("movie", 2)]
+
+    def test_recent_titles_come_first(self, engine):
+        with Session(engine) as session:
+            session.add(CachedMovie(id=1, title="Recent", cached_at=days_ago(2)))
+            session.add(CachedMovie(id=2, title="Old", cached_at=days_ago(29)))
+            session.add(CachedMovie(id=3, title="Just cached", cached_at=days_ago(0)))
+            session.commit()
+
+        warmer = CacheWarmer(budget=10)
+        warmer.note_recent("movie", 1)
+        warmer.note_recent("movie", 3)
+
+        # Recently cached titles are not worth refreshing yet
+        assert warmer.candidates(10) == [("movie", 1), ("movie", 2)]
+
+    def test_respects_limit(self, engine):
+        with Session(engine) as session:
+            for i in range(5):
+                session.add(
+                    CachedMovie(id=i, title="Old", cached_at=days_ago(CACHE_TTL_DAYS))
+                )
+            session.commit()
+
+        assert len(CacheWarmer(budget=10).candidates(2)) == 2
+
+
+class TestCacheWarmerRun:
+    @pytest.mark.asyncio
+    async def test_refreshes_within_budget(self, engine, repository):
+        with Session(engine) as session:
+            for i in range(5):
+                session.add(CachedMovie(id=i, title="Old", cached_at=days_ago(29)))
+            session.commit()
+
+        warmer = CacheWarmer(repository=repository, budget=3)
+        refreshed = await warmer.run()
+
+        assert refreshed == 3
+        assert repository.refresh.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_stops_when_asked(self, engine, repository):
+        with Session(engine) as session:
+            for i in range(5):
+                session.add(CachedMovie(id=i, title="Old", cached_at=days_ago(29)))
+            session.commit()
+
+        warmer = CacheWarmer(repository=repository, budget=5)
+        refreshed = await warmer.run(
+            should_stop=lambda: repository.refresh.await_count >= 2
+        )
+
+        assert refreshed == 2
+
+    @pytest.mark.asyncio
+    async def test_skips_when_offline(self, engine, repository):
+        with Session(engine) as session:
+            session.add(CachedMovie(id=1, title="Old", cached_at=days_ago(29)))
+            session.commit()
+        repository.is_offline = True
+
+        refreshed = await CacheWarmer(repository=repository, budget=5).run()
+
+        assert refreshed == 0
+        repository.refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_does_not_stop_run(self, engine, repository):
+        with Session(engine) as session:
+            session.add(CachedMovie(id=1, title="Old", cached_at=days_ago(29)))
+            session.add(CachedMovie(id=2, title="Old", cached_at=days_ago(28)))
+            session.commit()
+        repository.refresh.side_effect = [httpx.ConnectError("API Error"), None]
+
+        refreshed = await CacheWarmer(repository=repository, budget=5).run()
+
+        assert refreshed == 1
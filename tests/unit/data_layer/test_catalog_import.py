@@ -0,0 +1,120 @@
+import gzip
+import json
+
+import pytest
+from sqlmodel import select
+from sqlmodel import Session
+
+from streaming_overview_tui.data_layer.catalog_import import _build_match_query
+from streaming_overview_tui.data_layer.catalog_import import detect_content_type
+from streaming_overview_tui.data_layer.catalog_import import import_catalog
+from streaming_overview_tui.data_layer.catalog_import import iter_export_rows
+from streaming_overview_tui.data_layer.catalog_import import load_search_index
+from streaming_overview_tui.data_layer.catalog_import import search_catalog
+from streaming_overview_tui.data_layer.models import CatalogTitle
+
+
+def write_export(path, entries):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+    return path
+
+
+class TestDetectContentType:
+    def test_movie_export(self, tmp_path):
+        path = tmp_path / "movie_ids_05_15_2024.json.gz"
+        assert detect_content_type(path) == "movie"
+
+    def test_tv_export(self, tmp_path):
+        path = tmp_path / "tv_series_ids_05_15_2024.json.gz"
+        assert detect_content_type(path) == "show"
+
+    def test_unknown_export_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="content type"):
+            detect_content_type(tmp_path / "collection_ids.json.gz")
+
+
+class TestIterExportRows:
+    def test_skips_malformed_lines(self, tmp_path):
+        path = tmp_path / "movie_ids.json"
+        path.write_text(
+            '{"id": 1, "original_title": "Alien", "popularity": 40.5}\n'
+            "not json\n"
+            '{"id": 2}\n'
+            '{"original_title": "No id"}\n'
+        )
+        rows = list(iter_export_rows(path, "movie"))
+        assert rows == [
+            {"content_type": "movie", "id": 1, "title": "Alien", "popularity": 40.5}
+        ]
+
+    def test_reads_tv_names(self, tmp_path):
+        path = write_export(
+            tmp_path / "tv_series_ids.json.gz",
+            [{"id": 1396, "original_name": "Breaking Bad", "popularity": 300.0}],
+        )
+        rows = list(iter_export_rows(path, "show"))
+        assert rows[0]["title"] == "Breaking Bad"
+        assert rows[0]["content_type"] == "show"
+
+
+class TestImportCatalog:
+    def test_imports_in_batches(self, tmp_path, engine):
+        entries = [
+            {"id": i, "original_title": f"Movie {i}", "popularity": float(i)}
+            for i in range(1, 26)
+        ]
+        path = write_export(tmp_path / "movie_ids_01_01_2026.json.gz", entries)
+        progress = []
+
+        total = import_catalog(path, batch_size=10, on_progress=progress.append)
+
+        assert total == 25
+        assert progress == [10, 20, 25]
+        with Session(engine) as session:
+            assert len(session.exec(select(CatalogTitle)).all()) == 25
+
+    def test_reimport_updates_existing_rows(self, tmp_path, engine):
+        path = write_export(
+            tmp_path / "movie_ids.json.gz",
+            [{"id": 1, "original_title": "Alien", "popularity": 1.0}],
+        )
+        import_catalog(path)
+        write_export(path, [{"id": 1, "original_title": "Alien", "popularity": 9.0}])
+        import_catalog(path)
+
+        with Session(engine) as session:
+            rows = session.exec(select(CatalogTitle)).all()
+        assert len(rows) == 1
+        assert rows[0].popularity == 9.0
+
+
+class TestSearchCatalog:
+    def test_prefix_search_ordered_by_popularity(self, tmp_path, engine):
+        path = write_export(
+            tmp_path / "movie_ids.json.gz",
+            [
+                {"id": 1, "original_title": "The Dark Knight", "popularity": 90.0},
+                {"id": 2, "original_title": "Dark City", "popularity": 20.0},
+                {"id": 3, "original_title": "Amélie", "popularity": 50.0},
+            ],
+        )
+        import_catalog(path)
+
+        results = search_catalog("dark")
+        assert [r.id for r in results] == [1, 2]
+        assert results[0].content_type == "movie"
+
+        assert [r.id for r in search_catalog("dark kni")] == [1]
+        assert [r.id for r in search_catalog("amelie")] == [3]
+
+    def test_returns_empty_without_index(self, engine):
+        assert search_catalog("dark") == []
+
+    def test_load_index_without_catalog(self, engine):
+        load_search_index()  # Nothing to load, and no error
+
+    def test_match_query_quotes_tokens(self):
+        assert _build_match_query('dark "kni') == '"dark"* "kni"*'
+        assert _build_match_query("   ") is None
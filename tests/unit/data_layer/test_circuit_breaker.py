@@ -0,0 +1,82 @@
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitBreaker
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    def test_starts_closed(self):
+        breaker = CircuitBreaker()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request() is True
+        assert breaker.is_offline is False
+
+    def test_opens_after_threshold_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, clock=FakeClock())
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allow_request() is False
+        assert breaker.is_offline is True
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_allows_single_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 30.0
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request() is True
+        # Only one probe at a time
+        assert breaker.allow_request() is False
+
+    def test_successful_probe_closes_circuit(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 31.0
+        breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.is_offline is False
+
+    def test_failed_probe_reopens_circuit(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 31.0
+        breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        clock.now = 60.0
+        assert breaker.state == CircuitState.OPEN
+        clock.now = 61.0
+        assert breaker.state == CircuitState.HALF_OPEN
+
+    def test_released_probe_lets_next_probe_through(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 31.0
+        assert breaker.allow_request() is True
+
+        breaker.release_probe()
+        assert breaker.allow_request() is True
@@ -0,0 +1,40 @@
+from unittest.mock import patch
+
+from sqlalchemy import inspect
+from sqlmodel import create_engine
+from sqlmodel import SQLModel
+
+from streaming_overview_tui.data_layer import database
+
+
+class TestInitDb:
+    def test_creates_tables(self, empty_engine):
+        database.init_db()
+
+        assert "cached_movies" in inspect(empty_engine).get_table_names()
+
+    def test_creates_tables_once_per_engine(self, empty_engine):
+        with patch.object(
+            SQLModel.metadata, "create_all", wraps=SQLModel.metadata.create_all
+        ) as create_all:
+            database.init_db()
+            database.init_db()
+
+        create_all.assert_called_once_with(empty_engine)
+
+    def test_new_engine_gets_tables(self, empty_engine, tmp_path, monkeypatch):
+        database.init_db()
+        other = create_engine(f"sqlite:///{tmp_path / 'other.db'}")
+        monkeypatch.setattr(database, "_engine", other)
+
+        database.init_db()
+
+        assert "cached_movies" in inspect(other).get_table_names()
+        other.dispose()
+
+
+class TestWarmUpDb:
+    def test_creates_tables(self, empty_engine):
+        database.warm_up_db()
+
+        assert "cached_movies" in inspect(empty_engine).get_table_names()
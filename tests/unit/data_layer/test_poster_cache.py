@@ -0,0 +1,174 @@
+import os
+import threading
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from streaming_overview_tui.data_layer.poster_cache import DiskPosterCache
+from streaming_overview_tui.data_layer.poster_cache import PosterMemoryCache
+from streaming_overview_tui.data_layer.poster_cache import PosterThumbnailStore
+
+
+def make_grid(width: int, height: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, size=(height, width, 2, 3), dtype=np.uint8)
+
+
+class TestDiskPosterCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return DiskPosterCache(directory=tmp_path / "posters")
+
+    def test_miss_returns_none(self, cache):
+        assert cache.get(1, "/a.jpg", 12, 18) is None
+
+    def test_round_trip(self, cache):
+        grid = make_grid(12, 18)
+        cache.put(1, "/a.jpg", 12, 18, grid)
+
+        cached = cache.get(1, "/a.jpg", 12, 18)
+
+        assert cached is not None
+        assert cached.shape == (18, 12, 2, 3)
+        assert np.array_equal(cached, grid)
+
+    def test_key_includes_path_and_size(self, cache):
+        cache.put(1, "/a.jpg", 12, 18, make_grid(12, 18))
+
+        assert cache.get(1, "/b.jpg", 12, 18) is None
+        assert cache.get(1, "/a.jpg", 24, 36) is None
+        assert cache.get(2, "/a.jpg", 12, 18) is None
+
+    def test_corrupt_entry_is_a_miss(self, cache):
+        cache.put(1, "/a.jpg", 12, 18, make_grid(12, 18))
+        (entry,) = cache.directory.glob("*.bin")
+        entry.write_bytes(b"garbage")
+
+        assert cache.get(1, "/a.jpg", 12, 18) is None
+
+    def test_contains_does_not_mark_as_used(self, cache):
+        cache.put(1, "/a.jpg", 12, 18, make_grid(12, 18))
+        (entry,) = cache.directory.glob("*.bin")
+        os.utime(entry, ns=(10**9, 10**9))
+
+        assert cache.contains(1, "/a.jpg", 12, 18)
+        assert not cache.contains(1, "/a.jpg", 24, 36)
+        assert entry.stat().st_mtime_ns == 10**9
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = DiskPosterCache(directory=tmp_path / "posters", max_bytes=10_000)
+        # Random grids barely compress, so each entry is about 1.3 kB
+        for tmdb_id in range(6):
+            cache.put(tmdb_id, "/a.jpg", 12, 18, make_grid(12, 18, seed=tmdb_id))
+        entries = sorted(cache.directory.glob("*.bin"))
+        for age, entry in enumerate(entries):
+            os.utime(entry, ns=(age * 10**9, age * 10**9))
+        # Reading an entry makes it the most recently used
+        cache.get(0, "/a.jpg", 12, 18)
+
+        for tmdb_id in range(6, 12):
+            cache.put(tmdb_id, "/a.jpg", 12, 18, make_grid(12, 18, seed=tmdb_id))
+
+        total = sum(entry.stat().st_size for entry in cache.directory.glob("*.bin"))
+        assert total <= 10_000
+        assert cache.get(0, "/a.jpg", 12, 18) is not None
+        assert cache.get(11, "/a.jpg", 12, 18) is not None
+        assert cache.get(1, "/a.jpg", 12, 18) is None
+
+    def test_clear(self, cache):
+        cache.put(1, "/a.jpg", 12, 18, make_grid(12, 18))
+        cache.clear()
+        assert cache.get(1, "/a.jpg", 12, 18) is None
+
+
+class TestPosterMemoryCache:
+    def test_miss_and_hit_are_counted(self):
+        cache = PosterMemoryCache()
+        assert cache.get(1) is None
+        cache.put(1, Image.new("RGB", (10, 15), "red"))
+
+        assert cache.get(1) is not None
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+    def test_stores_rgb_thumbnail(self):
+        cache = PosterMemoryCache(thumbnail_size=(92, 138))
+        cache.put(1, Image.new("RGBA", (500, 750)))
+
+        image = cache.get(1)
+
+        assert image.mode == "RGB"
+        assert image.size == (92, 138)
+        assert cache.stats.size_bytes == 92 * 138 * 3
+
+    def test_evicts_least_recently_used(self):
+        # Room for two 10x10 RGB images
+        cache = PosterMemoryCache(max_bytes=600)
+        cache.put(1, Image.new("RGB", (10, 10)))
+        cache.put(2, Image.new("RGB", (10, 10)))
+        cache.get(1)  # 2 is now least recently used
+
+        cache.put(3, Image.new("RGB", (10, 10)))
+
+        assert 1 in cache
+        assert 2 not in cache
+        assert 3 in cache
+        assert cache.stats.evictions == 1
+        assert cache.stats.size_bytes <= 600
+
+    def test_replacing_entry_keeps_size_accurate(self):
+        cache = PosterMemoryCache()
+        cache.put(1, Image.new("RGB", (10, 10)))
+        cache.put(1, Image.new("RGB", (20, 20)))
+
+        assert len(cache) == 1
+        assert cache.stats.size_bytes == 20 * 20 * 3
+
+    def test_image_larger_than_budget_is_not_cached(self):
+        cache = PosterMemoryCache(max_bytes=100)
+        cache.put(1, Image.new("RGB", (10, 10)))
+        assert 1 not in cache
+
+    def test_concurrent_puts_stay_within_budget(self):
+        cache = PosterMemoryCache(max_bytes=3000)
+
+        def fill(offset: int):
+            for i in range(200):
+                cache.put(offset + i, Image.new("RGB", (10, 10)))
+                cache.get(offset + i // 2)
+
+        threads = [threading.Thread(target=fill, args=(n * 1000,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats
+        assert stats.size_bytes <= 3000
+        assert stats.entries == 10
+        assert stats.evictions == 800 - 10
+
+
+class TestPosterThumbnailStore:
+    def test_round_trip(self, engine):
+        store = PosterThumbnailStore()
+        grid = make_grid(3, 4)
+
+        store.put("/a.jpg", grid)
+
+        assert np.array_equal(store.get("/a.jpg"), grid)
+        assert store.get("/b.jpg") is None
+
+    def test_put_replaces_earlier_thumbnail(self, engine):
+        store = PosterThumbnailStore()
+        store.put("/a.jpg", make_grid(3, 4, seed=1))
+        store.put("/a.jpg", make_grid(3, 4, seed=2))
+
+        assert np.array_equal(store.get("/a.jpg"), make_grid(3, 4, seed=2))
+
+    def test_missing_table_is_a_miss(self, empty_engine):
+        store = PosterThumbnailStore()
+
+        assert store.get("/a.jpg") is None
+        store.put("/a.jpg", make_grid(3, 4))  # Does not raise
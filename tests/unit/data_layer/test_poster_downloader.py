@@ -0,0 +1,120 @@
+import threading
+from concurrent.futures import CancelledError
+
+import httpx
+import pytest
+
+from streaming_overview_tui.data_layer.poster_downloader import PosterDownloader
+
+
+class BlockingTransport(httpx.BaseTransport):
+    """Serves image bytes, holding each request until released."""
+
+    def __init__(self):
+        self.requested: list[str] = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.status_code = 200
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.requested.append(request.url.path)
+        self.started.set()
+        self.release.wait(timeout=5)
+        return httpx.Response(self.status_code, content=request.url.path.encode())
+
+
+@pytest.fixture
+def transport():
+    transport = BlockingTransport()
+    yield transport
+    transport.release.set()
+
+
+def make_downloader(transport: BlockingTransport, max_concurrent: int = 1):
+    client = httpx.Client(transport=transport)
+    return PosterDownloader(max_concurrent=max_concurrent, client=client)
+
+
+class TestPosterDownloader:
+    def test_fetch_returns_bytes(self, transport):
+        transport.release.set()
+        downloader = make_downloader(transport)
+
+        assert downloader.fetch("https://img/a.jpg") == b"/a.jpg"
+
+    def test_same_url_is_downloaded_once(self, transport):
+        downloader = make_downloader(transport)
+
+        first = downloader.submit("https://img/a.jpg")
+        second = downloader.submit("https://img/a.jpg")
+        transport.release.set()
+
+        assert first.result(timeout=5) == second.result(timeout=5) == b"/a.jpg"
+        assert transport.requested == ["/a.jpg"]
+
+    def test_recent_download_is_reused(self, transport):
+        transport.release.set()
+        downloader = make_downloader(transport)
+        downloader.fetch("https://img/a.jpg")
+
+        assert downloader.submit("https://img/a.jpg").done()
+        assert transport.requested == ["/a.jpg"]
+
+    def test_most_urgent_request_goes_first(self, transport):
+        downloader = make_downloader(transport)
+        # Occupy the only worker so the rest queue up
+        blocker = downloader.submit("https://img/blocker.jpg")
+        assert transport.started.wait(timeout=5)
+
+        far = downloader.submit("https://img/far.jpg", priority=2)
+        near = downloader.submit("https://img/near.jpg", priority=1)
+        highlighted = downloader.submit("https://img/far2.jpg", priority=3)
+        # Asking again with a lower value moves a request up the queue
+        downloader.submit("https://img/far2.jpg", priority=0)
+        transport.release.set()
+
+        for future in (blocker, far, near, highlighted):
+            future.result(timeout=5)
+        assert transport.requested == [
+            "/blocker.jpg",
+            "/far2.jpg",
+            "/near.jpg",
+            "/far.jpg",
+        ]
+
+    def test_prioritize_drops_unlisted_queued_requests(self, transport):
+        downloader = make_downloader(transport)
+        blocker = downloader.submit("https://img/blocker.jpg")
+        assert transport.started.wait(timeout=5)
+        stale = downloader.submit("https://img/stale.jpg", priority=1)
+        wanted = downloader.submit("https://img/wanted.jpg", priority=1)
+
+        downloader.prioritize({"https://img/wanted.jpg": 0})
+        transport.release.set()
+
+        assert stale.cancelled()
+        assert wanted.result(timeout=5) == b"/wanted.jpg"
+        # The running download is left to finish
+        assert blocker.result(timeout=5) == b"/blocker.jpg"
+        assert "/stale.jpg" not in transport.requested
+
+    def test_cancel_keeps_listed_urls(self, transport):
+        downloader = make_downloader(transport)
+        running = downloader.submit("https://img/old.jpg")
+        assert transport.started.wait(timeout=5)
+        kept = downloader.submit("https://img/kept.jpg", priority=1)
+
+        downloader.cancel(keep={"https://img/kept.jpg"})
+        transport.release.set()
+
+        with pytest.raises(CancelledError):
+            running.result(timeout=5)
+        assert kept.result(timeout=5) == b"/kept.jpg"
+
+    def test_http_error_is_raised(self, transport):
+        transport.status_code = 404
+        transport.release.set()
+        downloader = make_downloader(transport)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            downloader.fetch("https://img/missing.jpg")
@@ -5,11 +5,17 @@ from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import httpx
 import pytest
 
+from streaming_overview_tui.data_layer import database
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitOpenError
 from streaming_overview_tui.data_layer.models import CachedMovie
+from streaming_overview_tui.data_layer.models import CachedShow
+from streaming_overview_tui.data_layer.models import StreamingProvider
 from streaming_overview_tui.data_layer.repository import CACHE_TTL_DAYS
 from streaming_overview_tui.data_layer.repository import ContentRepository
+from streaming_overview_tui.data_layer.repository import EMPTY_QUERY_TTL
 
 
 class TestContentRepository:
@@ -115,8 +121,9 @@ class TestContentRepository:
 
     @pytest.mark.asyncio
     async def test_search_returns_results(
-        self, mock_tmdb_client, mock_init_db, mock_user_config
+        self, mock_tmdb_client, mock_init_db, mock_session, mock_user_config
     ):
+        mock_session.get.return_value = None
         mock_client_instance = mock_tmdb_client.return_value
         mock_client_instance.search_multi = AsyncMock(
             return_value={
@@ -268,3 +275,175 @@ class TestContentRepository:
 
         with pytest.raises(Exception, match="API Error"):
             await repo.get_movie(123)
+
+    @pytest.mark.asyncio
+    async def test_search_serves_cache_when_circuit_open(
+        self, mock_tmdb_client, mock_init_db, mock_session
+    ):
+        mock_tmdb_client.return_value.search_multi = AsyncMock(
+            side_effect=CircuitOpenError("open")
+        )
+        cached_movie = CachedMovie(
+            id=123, title="Cached Batman", release_year=2022, rating=7.8
+        )
+        cached_show = CachedShow(
+            id=456, title="Batman Show", first_air_year=1966, rating=8.1
+        )
+        mock_session.get.return_value = None
+        mock_session.exec.return_value.all.side_effect = [
+            [cached_movie],
+            [cached_show],
+        ]
+
+        repo = ContentRepository()
+        with patch(
+            "streaming_overview_tui.data_layer.repository.search_catalog",
+            return_value=[],
+        ):
+            results = await repo.search("batman")
+
+        assert [r.id for r in results] == [456, 123]
+        assert results[0].content_type == "show"
+        assert results[1].content_type == "movie"
+
+    def test_is_offline_reflects_client(self, mock_tmdb_client, mock_init_db):
+        mock_tmdb_client.return_value.is_offline = True
+        repo = ContentRepository()
+        assert repo.is_offline is True
+
+
+class TestNegativeCache:
+    @pytest.fixture
+    def mock_tmdb_client(self):
+        with patch("streaming_overview_tui.data_layer.repository.TMDBClient") as mock:
+            yield mock.return_value
+
+    @pytest.fixture
+    def mock_user_config(self):
+        with patch(
+            "streaming_overview_tui.data_layer.repository.load_user_config"
+        ) as mock:
+            mock.return_value.region = "DK"
+            yield mock.return_value
+
+    def not_found(self) -> httpx.HTTPStatusError:
+        request = httpx.Request("GET", "https://api.themoviedb.org/3/movie/1")
+        return httpx.HTTPStatusError(
+            "Not found", request=request, response=httpx.Response(404)
+        )
+
+    @pytest.mark.asyncio
+    async def test_empty_query_not_sent_again(self, engine, mock_tmdb_client):
+        mock_tmdb_client.search_multi = AsyncMock(return_value={"results": []})
+        repo = ContentRepository()
+
+        assert await repo.search("xyzzy") == []
+        assert await repo.search("  XYZZY ") == []
+
+        mock_tmdb_client.search_multi.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_query_expires(self, engine, mock_tmdb_client):
+        mock_tmdb_client.search_multi = AsyncMock(return_value={"results": []})
+        repo = ContentRepository()
+        await repo.search("xyzzy")
+
+        later = datetime.now(timezone.utc) + EMPTY_QUERY_TTL + timedelta(minutes=1)
+        with patch("streaming_overview_tui.data_layer.repository.datetime") as mock_dt:
+            mock_dt.now.return_value = later
+            await repo.search("xyzzy")
+
+        assert mock_tmdb_client.search_multi.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_not_found_detail_is_cached(
+        self, engine, mock_tmdb_client, mock_user_config
+    ):
+        mock_tmdb_client.get_movie = AsyncMock(side_effect=self.not_found())
+        repo = ContentRepository()
+
+        assert await repo.get_movie(1) is None
+        assert await repo.get_movie(1) is None
+
+        mock_tmdb_client.get_movie.assert_awaited_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_not_cached(
+        self, engine, mock_tmdb_client, mock_user_config
+    ):
+        mock_tmdb_client.get_show = AsyncMock(side_effect=Exception("API Error"))
+        repo = ContentRepository()
+
+        for _ in range(2):
+            with pytest.raises(Exception, match="API Error"):
+                await repo.get_show(1)
+
+        assert mock_tmdb_client.get_show.await_count == 2
+
+
+class TestGetCached:
+    @pytest.fixture
+    def mock_tmdb_client(self):
+        with patch("streaming_overview_tui.data_layer.repository.TMDBClient") as mock:
+            yield mock.return_value
+
+    @pytest.fixture
+    def mock_user_config(self):
+        with patch(
+            "streaming_overview_tui.data_layer.repository.load_user_config"
+        ) as mock:
+            mock.return_value.region = "DK"
+            yield mock.return_value
+
+    def test_returns_stale_details_without_tmdb(
+        self, engine, mock_tmdb_client, mock_user_config
+    ):
+        repo = ContentRepository()
+        repo._cache_movie(
+            {"id": 1, "title": "Old Movie", "release_date": "1999-01-01"},
+            [StreamingProvider(provider_id=8, provider_name="Netflix", link="url")],
+            "DK",
+        )
+        stale = datetime.now(timezone.utc) - timedelta(days=CACHE_TTL_DAYS + 1)
+        with database.get_session() as session:
+            session.get(CachedMovie, 1).cached_at = stale
+            session.commit()
+
+        movie = repo.get_cached("movie", 1)
+
+        assert movie.title == "Old Movie"
+        assert movie.release_year == 1999
+        assert [p.provider_name for p in movie.providers] == ["Netflix"]
+        mock_tmdb_client.get_movie.assert_not_called()
+
+    def test_missing_details(self, engine, mock_tmdb_client, mock_user_config):
+        repo = ContentRepository()
+
+        assert repo.get_cached("movie", 1) is None
+        assert repo.get_cached("show", 1) is None
+
+
+class TestSearchCache:
+    @pytest.fixture
+    def mock_tmdb_client(self):
+        with patch("streaming_overview_tui.data_layer.repository.TMDBClient") as mock:
+            yield mock.return_value
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [("100%", ["100% Wolf"]), ("a_b", ["a_b"]), ("a\\b", ["a\\b"])],
+    )
+    def test_wildcards_match_literally(self, engine, mock_tmdb_client, query, expected):
+        repo = ContentRepository()
+        for movie_id, title in enumerate(
+            ["100% Wolf", "1000 Wolves", "a_b", "axb", "a\\b"], start=1
+        ):
+            repo._cache_movie({"id": movie_id, "title": title}, [], "DK")
+
+        with patch(
+            "streaming_overview_tui.data_layer.repository.search_catalog",
+            return_value=[],
+        ):
+            results = repo._search_cache(query)
+
+        assert [r.title for r in results] == expected
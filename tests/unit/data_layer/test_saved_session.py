@@ -0,0 +1,32 @@
+from streaming_overview_tui.data_layer.saved_session import load_session
+from streaming_overview_tui.data_layer.saved_session import save_session
+
+
+class TestSavedSession:
+    def test_nothing_saved(self, engine):
+        assert load_session() is None
+
+    def test_round_trip(self, engine):
+        save_session("batman", [("movie", 414906), ("tv", 2098)], ("tv", 2098))
+
+        saved = load_session()
+
+        assert saved.query == "batman"
+        assert saved.results == [("movie", 414906), ("tv", 2098)]
+        assert saved.selected == ("tv", 2098)
+
+    def test_save_replaces_previous(self, engine):
+        save_session("batman", [("movie", 414906)], ("movie", 414906))
+        save_session("barbie", [("movie", 346698)], None)
+
+        saved = load_session()
+
+        assert saved.query == "barbie"
+        assert saved.results == [("movie", 346698)]
+        assert saved.selected is None
+
+    def test_empty_search_clears_session(self, engine):
+        save_session("batman", [("movie", 414906)], None)
+        save_session("", [], None)
+
+        assert load_session() is None
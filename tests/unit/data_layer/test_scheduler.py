@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from streaming_overview_tui.data_layer.scheduler import Priority
+from streaming_overview_tui.data_layer.scheduler import WorkScheduler
+
+
+async def hold(scheduler: WorkScheduler, priority: Priority, release: asyncio.Event):
+    """Hold a slot until released."""
+    async with scheduler.slot(priority):
+        await release.wait()
+
+
+class TestWorkScheduler:
+    @pytest.mark.asyncio
+    async def test_limits_concurrency_per_class(self):
+        scheduler = WorkScheduler({Priority.PREFETCH: 2})
+        release = asyncio.Event()
+        tasks = [
+            asyncio.create_task(hold(scheduler, Priority.PREFETCH, release))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        assert scheduler.running(Priority.PREFETCH) == 2
+        assert scheduler.waiting(Priority.PREFETCH) == 1
+        # Other classes have their own slots
+        async with scheduler.slot(Priority.VISIBLE):
+            assert scheduler.running(Priority.VISIBLE) == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert scheduler.running(Priority.PREFETCH) == 0
+
+    @pytest.mark.asyncio
+    async def test_less_urgent_classes_wait_for_queued_urgent_work(self):
+        scheduler = WorkScheduler({Priority.VISIBLE: 1})
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def operation(name: str, priority: Priority):
+            async with scheduler.slot(priority):
+                order.append(name)
+
+        holder = asyncio.create_task(hold(scheduler, Priority.VISIBLE, release))
+        await asyncio.sleep(0)
+        visible = asyncio.create_task(operation("visible", Priority.VISIBLE))
+        await asyncio.sleep(0)
+        prefetch = asyncio.create_task(operation("prefetch", Priority.PREFETCH))
+        await asyncio.sleep(0)
+
+        assert order == []
+        assert scheduler.waiting(Priority.PREFETCH) == 1
+
+        release.set()
+        await asyncio.gather(holder, visible, prefetch)
+        assert order == ["visible", "prefetch"]
+
+    @pytest.mark.asyncio
+    async def test_slots_default_to_job_class_and_nest(self):
+        scheduler = WorkScheduler()
+        async with (
+            scheduler.job(Priority.INTERACTIVE),
+            scheduler.slot(),
+            scheduler.slot(),
+        ):
+            assert scheduler.running(Priority.INTERACTIVE) == 1
+        assert scheduler.running(Priority.INTERACTIVE) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_group_cancels_waiting_and_running_jobs(self):
+        scheduler = WorkScheduler({Priority.MAINTENANCE: 1})
+        release = asyncio.Event()
+        running = scheduler.spawn(release.wait, Priority.MAINTENANCE, group="cache")
+        waiting = scheduler.spawn(release.wait, Priority.MAINTENANCE, group="cache")
+        other = scheduler.spawn(release.wait, Priority.MAINTENANCE, group="other")
+        await asyncio.sleep(0)
+
+        scheduler.cancel_group("cache")
+        await asyncio.sleep(0)
+
+        assert running.cancelled()
+        assert waiting.cancelled()
+        assert not other.done()
+        assert scheduler.running(Priority.MAINTENANCE) == 1
+        release.set()
+        await scheduler.join()
+        assert scheduler.running(Priority.MAINTENANCE) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_lets_others_through(self):
+        scheduler = WorkScheduler({Priority.VISIBLE: 1})
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(scheduler, Priority.VISIBLE, release))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hold(scheduler, Priority.VISIBLE, release))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        await asyncio.sleep(0)
+
+        assert scheduler.waiting(Priority.VISIBLE) == 0
+        async with scheduler.slot(Priority.PREFETCH):
+            pass  # Not blocked behind the cancelled waiter
+        release.set()
+        await holder
+
+    @pytest.mark.asyncio
+    async def test_spawned_job_errors_are_logged(self, caplog):
+        scheduler = WorkScheduler()
+
+        async def fail():
+            raise RuntimeError("disk full")
+
+        scheduler.spawn(fail, Priority.MAINTENANCE)
+        await scheduler.join()
+
+        assert "MAINTENANCE job failed" in caplog.text
@@ -0,0 +1,162 @@
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from sqlmodel import Session
+
+from streaming_overview_tui.data_layer.models import CachedMovie
+from streaming_overview_tui.data_layer.models import CachedShow
+from streaming_overview_tui.data_layer.models import SyncState
+from streaming_overview_tui.data_layer.sync import sync_changes
+from streaming_overview_tui.data_layer.sync import SYNC_STATE_NAME
+from tests.unit.data_layer.conftest import days_ago
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.get_movie_changes = AsyncMock(
+        return_value={"results": [], "page": 1, "total_pages": 1}
+    )
+    client.get_tv_changes = AsyncMock(
+        return_value={"results": [], "page": 1, "total_pages": 1}
+    )
+    return client
+
+
+@pytest.fixture
+def repository():
+    repository = MagicMock()
+    repository.refresh = AsyncMock()
+    return repository
+
+
+class TestSyncChanges:
+    @pytest.mark.asyncio
+    async def test_refreshes_only_changed_cached_titles(
+        self, engine, client, repository
+    ):
+        with Session(engine) as session:
+            session.add(CachedMovie(id=1, title="Changed", cached_at=days_ago(2)))
+            session.add(CachedMovie(id=2, title="Unchanged", cached_at=days_ago(2)))
+            session.add(CachedShow(id=3, title="Changed Show", cached_at=days_ago(2)))
+            session.commit()
+        client.get_movie_changes.return_value = {
+            "results": [{"id": 1}, {"id": 99}],
+            "total_pages": 1,
+        }
+        client.get_tv_changes.return_value = {"results": [{"id": 3}], "total_pages": 1}
+
+        report = await sync_changes(repository=repository, client=client)
+
+        refreshed = {call.args for call in repository.refresh.await_args_list}
+        assert refreshed == {("movie", 1), ("show", 3)}
+        assert report.refreshed == 2
+        assert report.extended == 1
+        assert report.failed == 0
+
+    @pytest.mark.asyncio
+    async def test_extends_unchanged_entries_without_fetch(
+        self, engine, client, repository
+    ):
+        with Session(engine) as session:
+            session.add(CachedMovie(id=2, title="Unchanged", cached_at=days_ago(5)))
+            session.commit()
+
+        await sync_changes(repository=repository, client=client)
+
+        repository.refresh.assert_not_called()
+        with Session(engine) as session:
+            movie = session.get(CachedMovie, 2)
+            assert movie.cached_at > days_ago(1)
+
+    @pytest.mark.asyncio
+    async def test_entries_older_than_window_are_not_extended(
+        self, engine, client, repository
+    ):
+        old = days_ago(20)
+        with Session(engine) as session:
+            session.add(CachedMovie(id=2, title="Old", cached_at=old))
+            session.commit()
+
+        report = await sync_changes(repository=repository, client=client)
+
+        assert report.extended == 0
+        with Session(engine) as session:
+            assert session.get(CachedMovie, 2).cached_at == old
+
+    @pytest.mark.asyncio
+    async def test_reads_changes_since_watermark(self, engine, client, repository):
+        watermark = days_ago(3)
+        with Session(engine) as session:
+            session.add(SyncState(name=SYNC_STATE_NAME, synced_at=watermark))
+            session.commit()
+
+        await sync_changes(repository=repository, client=client)
+
+        start_date = client.get_movie_changes.await_args.args[0]
+        assert start_date == watermark.date()
+        with Session(engine) as session:
+            assert session.get(SyncState, SYNC_STATE_NAME).synced_at > watermark
+
+    @pytest.mark.asyncio
+    async def test_follows_all_pages(self, engine, client, repository):
+        with Session(engine) as session:
+            session.add(CachedMovie(id=7, title="Page two", cached_at=days_ago(1)))
+            session.commit()
+        client.get_movie_changes.side_effect = [
+            {"results": [{"id": 1}], "total_pages": 2},
+            {"results": [{"id": 7}], "total_pages": 2},
+        ]
+
+        report = await sync_changes(repository=repository, client=client)
+
+        assert client.get_movie_changes.await_count == 2
+        repository.refresh.assert_awaited_once_with("movie", 7)
+        assert report.refreshed == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_is_reported_not_extended(
+        self, engine, client, repository
+    ):
+        cached_at = days_ago(2)
+        with Session(engine) as session:
+            session.add(CachedMovie(id=1, title="Changed", cached_at=cached_at))
+            session.commit()
+        client.get_movie_changes.return_value = {
+            "results": [{"id": 1}],
+            "total_pages": 1,
+        }
+        repository.refresh.side_effect = httpx.ConnectError("API Error")
+
+        report = await sync_changes(repository=repository, client=client)
+
+        assert report.failed == 1
+        assert report.extended == 0
+        with Session(engine) as session:
+            assert session.get(CachedMovie, 1).cached_at == cached_at
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_watermark_for_retry(
+        self, engine, client, repository
+    ):
+        watermark = days_ago(3)
+        with Session(engine) as session:
+            session.add(SyncState(name=SYNC_STATE_NAME, synced_at=watermark))
+            session.add(CachedMovie(id=1, title="Changed", cached_at=days_ago(2)))
+            session.commit()
+        client.get_movie_changes.return_value = {
+            "results": [{"id": 1}],
+            "total_pages": 1,
+        }
+        repository.refresh.side_effect = [httpx.ConnectError("API Error"), None]
+
+        await sync_changes(repository=repository, client=client)
+        with Session(engine) as session:
+            assert session.get(SyncState, SYNC_STATE_NAME).synced_at == watermark
+
+        report = await sync_changes(repository=repository, client=client)
+        assert report.refreshed == 1
+        with Session(engine) as session:
+            assert session.get(SyncState, SYNC_STATE_NAME).synced_at > watermark
@@ -1,5 +1,12 @@
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+import httpx
 import pytest
 
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitBreaker
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitOpenError
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitState
 from streaming_overview_tui.data_layer.tmdb_client import TMDBClient
 
 
@@ -38,3 +45,61 @@ class TestTMDBClient:
         headers = client._get_headers()
         assert headers["Authorization"] == "Bearer test_token"
         assert headers["Accept"] == "application/json"
+
+
+class TestTMDBClientCircuitBreaker:
+    @pytest.fixture
+    def settings(self, monkeypatch):
+        monkeypatch.setattr(
+            "streaming_overview_tui.data_layer.tmdb_client.app_settings",
+            type(
+                "Settings",
+                (),
+                {
+                    "tmdb_bearer_token": "test_token",
+                    "tmdb_url": "https://api.themoviedb.org/3",
+                },
+            )(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_rejects_without_request(self, settings):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure()
+        client = TMDBClient(circuit_breaker=breaker)
+
+        with patch("httpx.AsyncClient.get") as mock_get:
+            with pytest.raises(CircuitOpenError):
+                await client.search_multi("batman")
+            mock_get.assert_not_called()
+        assert client.is_offline is True
+
+    @pytest.mark.asyncio
+    async def test_network_errors_open_circuit(self, settings):
+        breaker = CircuitBreaker(failure_threshold=2)
+        client = TMDBClient(circuit_breaker=breaker)
+
+        with patch(
+            "httpx.AsyncClient.get",
+            AsyncMock(side_effect=httpx.ConnectError("unreachable")),
+        ):
+            for _ in range(2):
+                with pytest.raises(httpx.ConnectError):
+                    await client.search_multi("batman")
+
+        assert breaker.state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_open_circuit(self, settings):
+        breaker = CircuitBreaker(failure_threshold=1)
+        client = TMDBClient(circuit_breaker=breaker)
+        request = httpx.Request("GET", "https://api.themoviedb.org/3/movie/1")
+        response = httpx.Response(404, request=request)
+
+        with (
+            patch("httpx.AsyncClient.get", AsyncMock(return_value=response)),
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            await client.get_movie(1)
+
+        assert breaker.state == CircuitState.CLOSED
@@ -0,0 +1,37 @@
+from streaming_overview_tui.data_layer.tmdb_images import build_image_url
+from streaming_overview_tui.data_layer.tmdb_images import pick_poster_size
+from streaming_overview_tui.data_layer.tmdb_images import sized_image_url
+
+
+class TestPickPosterSize:
+    def test_default_poster_widget_fits_smallest_size(self):
+        # 12x18 cells = 12x36 pixels
+        assert pick_poster_size(12, 36) == "w92"
+
+    def test_height_drives_size_for_tall_targets(self):
+        # 200 pixels tall needs a 134 pixel wide poster at 2:3
+        assert pick_poster_size(40, 200) == "w154"
+
+    def test_width_drives_size_for_wide_targets(self):
+        assert pick_poster_size(300, 100) == "w342"
+
+    def test_exact_width_is_enough(self):
+        assert pick_poster_size(185, 10) == "w185"
+
+    def test_falls_back_to_original(self):
+        assert pick_poster_size(2000, 3000) == "original"
+
+
+class TestImageUrls:
+    def test_build_image_url(self):
+        assert build_image_url("/abc.jpg", "w92") == (
+            "https://image.tmdb.org/t/p/w92/abc.jpg"
+        )
+
+    def test_sized_image_url_rewrites_tmdb_urls(self):
+        url = "https://image.tmdb.org/t/p/w500/abc.jpg"
+        assert sized_image_url(url, 12, 36) == "https://image.tmdb.org/t/p/w92/abc.jpg"
+
+    def test_sized_image_url_keeps_other_urls(self):
+        url = "https://example.com/poster.jpg"
+        assert sized_image_url(url, 12, 36) == url
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -6,10 +7,15 @@ import httpx
 import pytest
 
 from streaming_overview_tui.config_layer.config import StreamingService
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitOpenError
 from streaming_overview_tui.data_layer.models import Movie
+from streaming_overview_tui.data_layer.models import Show
 from streaming_overview_tui.data_layer.models import StreamingProvider
 from streaming_overview_tui.data_layer.models import TMDBSearchResult
+from streaming_overview_tui.search_engine.search import restore_results
 from streaming_overview_tui.search_engine.search import search
+from streaming_overview_tui.search_engine.search import search_stream
+from streaming_overview_tui.search_engine.search import SearchError
 
 
 class TestSearchValidation:
@@ -249,3 +255,223 @@ class TestSearchErrorHandling:
         assert result.available == []
         assert result.other == []
         assert "TMDB API" in result.error
+
+
+class TestSearchOffline:
+    @pytest.fixture
+    def mock_repository(self):
+        with patch(
+            "streaming_overview_tui.search_engine.search.ContentRepository"
+        ) as mock:
+            repo_instance = MagicMock()
+            mock.return_value = repo_instance
+            yield repo_instance
+
+    @pytest.mark.asyncio
+    async def test_offline_flag_set_when_repository_offline(self, mock_repository):
+        mock_repository.is_offline = True
+        mock_repository.search = AsyncMock(return_value=[])
+
+        result = await search(
+            query="batman",
+            subscribed_services=[StreamingService.NETFLIX],
+        )
+
+        assert result.offline is True
+        assert result.error is None
+
+    @pytest.mark.asyncio
+    async def test_offline_flag_clear_when_online(self, mock_repository):
+        mock_repository.is_offline = False
+        mock_repository.search = AsyncMock(return_value=[])
+
+        result = await search(
+            query="batman",
+            subscribed_services=[StreamingService.NETFLIX],
+        )
+
+        assert result.offline is False
+
+    @pytest.mark.asyncio
+    async def test_keeps_results_without_cached_details(self, mock_repository):
+        mock_repository.is_offline = True
+        mock_repository.search = AsyncMock(
+            return_value=[
+                TMDBSearchResult(
+                    id=123,
+                    title="Catalog Batman",
+                    year=None,
+                    content_type="movie",
+                    poster_path=None,
+                    rating=None,
+                )
+            ]
+        )
+        mock_repository.get_movie = AsyncMock(side_effect=CircuitOpenError("open"))
+
+        result = await search(
+            query="batman",
+            subscribed_services=[StreamingService.NETFLIX],
+        )
+
+        assert result.available == []
+        assert [item.title for item in result.other] == ["Catalog Batman"]
+        assert result.other[0].services == []
+        assert result.other[0].overview is None
+
+
+class TestSearchWithTMDBResults:
+    @pytest.mark.asyncio
+    async def test_given_results_skip_tmdb_search(self):
+        with patch(
+            "streaming_overview_tui.search_engine.search.ContentRepository"
+        ) as mock:
+            repository = MagicMock()
+            repository.search = AsyncMock()
+            repository.get_movie = AsyncMock(return_value=None)
+            mock.return_value = repository
+
+            await search(
+                query="batman",
+                subscribed_services=[StreamingService.NETFLIX],
+                tmdb_results=[
+                    TMDBSearchResult(
+                        id=1,
+                        title="The Batman",
+                        year=2022,
+                        content_type="movie",
+                        poster_path=None,
+                        rating=None,
+                    )
+                ],
+            )
+
+            repository.search.assert_not_called()
+            repository.get_movie.assert_called_once_with(1)
+
+
+class TestSearchStream:
+    @pytest.fixture
+    def mock_repository(self):
+        with patch(
+            "streaming_overview_tui.search_engine.search.ContentRepository"
+        ) as mock:
+            repo_instance = MagicMock()
+            mock.return_value = repo_instance
+            yield repo_instance
+
+    @pytest.mark.asyncio
+    async def test_yields_results_as_details_arrive(self, mock_repository):
+        mock_repository.search = AsyncMock(
+            return_value=[
+                TMDBSearchResult(
+                    id=tmdb_id,
+                    title=f"Movie {tmdb_id}",
+                    year=2020,
+                    content_type="movie",
+                    poster_path=None,
+                    rating=None,
+                )
+                for tmdb_id in (1, 2, 3)
+            ]
+        )
+        delays = {1: 0.05, 2: 0.0, 3: None}
+
+        async def get_movie(movie_id):
+            if delays[movie_id] is None:
+                return None  # Details not found, so skipped
+            await asyncio.sleep(delays[movie_id])
+            return Movie(
+                id=movie_id,
+                title=f"Movie {movie_id}",
+                release_year=2020,
+                overview=None,
+                rating=None,
+                poster_path=None,
+                providers=[
+                    StreamingProvider(provider_id=8, provider_name="Netflix", link="")
+                ],
+            )
+
+        mock_repository.get_movie = get_movie
+
+        results = [
+            (rank, item.tmdb_id, item.services)
+            async for rank, item in search_stream("movie", [StreamingService.NETFLIX])
+        ]
+
+        assert results == [
+            (1, 2, [StreamingService.NETFLIX]),
+            (0, 1, [StreamingService.NETFLIX]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_search_raises_with_message(self, mock_repository):
+        mock_repository.search = AsyncMock(
+            side_effect=httpx.TimeoutException("Connection timeout")
+        )
+
+        with pytest.raises(SearchError, match="connection timeout"):
+            async for _ in search_stream("batman", []):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_short_query_yields_nothing(self, mock_repository):
+        assert [result async for result in search_stream("b", [])] == []
+        mock_repository.search.assert_not_called()
+
+
+class TestRestoreResults:
+    def test_rebuilds_from_cache_in_order(self):
+        cached = {
+            ("movie", 1): Movie(
+                id=1,
+                title="On Netflix",
+                release_year=2020,
+                overview="...",
+                rating=7.0,
+                poster_path="/1.jpg",
+                providers=[
+                    StreamingProvider(provider_id=8, provider_name="Netflix", link="a")
+                ],
+            ),
+            ("show", 2): Show(
+                id=2,
+                title="Not Streaming",
+                first_air_year=2019,
+                overview=None,
+                rating=None,
+                poster_path=None,
+                providers=[],
+            ),
+            ("movie", 3): Movie(
+                id=3,
+                title="Also on Netflix",
+                release_year=2021,
+                overview=None,
+                rating=None,
+                poster_path=None,
+                providers=[
+                    StreamingProvider(provider_id=8, provider_name="Netflix", link="b")
+                ],
+            ),
+        }
+        with patch(
+            "streaming_overview_tui.search_engine.search.ContentRepository"
+        ) as mock:
+            repository = mock.return_value
+            repository.get_cached.side_effect = lambda content_type, content_id: (
+                cached.get((content_type, content_id))
+            )
+
+            result = restore_results(
+                [("tv", 2), ("movie", 1), ("movie", 4), ("movie", 3)],
+                [StreamingService.NETFLIX],
+            )
+
+        assert [item.tmdb_id for item in result.available] == [1, 3]
+        assert [item.tmdb_id for item in result.other] == [2]
+        assert result.other[0].content_type == "tv"
+        assert result.other[0].year == 2019
+        assert result.available[0].watch_urls == {StreamingService.NETFLIX: "a"}
+        repository.get_movie.assert_not_called()
@@ -0,0 +1,137 @@
+import asyncio
+
+import httpx
+import pytest
+
+from streaming_overview_tui.data_layer.models import TMDBSearchResult
+from streaming_overview_tui.search_engine.speculative import SpeculativeSearch
+
+
+def make_result(tmdb_id: int, title: str) -> TMDBSearchResult:
+    return TMDBSearchResult(
+        id=tmdb_id,
+        title=title,
+        year=2020,
+        content_type="movie",
+        poster_path=None,
+        rating=None,
+    )
+
+
+class FakeRepository:
+    """Repository answering searches after the test releases them."""
+
+    def __init__(self):
+        self.queries: list[str] = []
+        self.cancelled: list[str] = []
+        self.release = asyncio.Event()
+
+    async def search(self, query: str) -> list[TMDBSearchResult]:
+        self.queries.append(query)
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(query)
+            raise
+        if query == "fail":
+            raise httpx.ConnectError("TMDB down")
+        return [make_result(1, "The Batman"), make_result(2, "Bad Boys")]
+
+
+@pytest.fixture
+def repository() -> FakeRepository:
+    return FakeRepository()
+
+
+@pytest.fixture
+def speculation(repository: FakeRepository) -> SpeculativeSearch:
+    return SpeculativeSearch(repository_factory=lambda: repository)
+
+
+class TestSpeculativeSearch:
+    @pytest.mark.asyncio
+    async def test_reuses_results_for_same_query(self, repository, speculation):
+        speculation.update("ba")
+        await asyncio.sleep(0)
+        repository.release.set()
+
+        results = await speculation.take("ba")
+
+        assert [r.title for r in results] == ["The Batman", "Bad Boys"]
+        assert repository.queries == ["ba"]
+
+    @pytest.mark.asyncio
+    async def test_one_request_in_flight_while_typing(self, repository, speculation):
+        for query in ("ba", "bat", "batm"):
+            speculation.update(query)
+            await asyncio.sleep(0)
+
+        assert repository.queries == ["ba"]
+
+    @pytest.mark.asyncio
+    async def test_next_prefix_is_searched_once_previous_returns(
+        self, repository, speculation
+    ):
+        repository.release.set()
+        speculation.update("ba")
+        await asyncio.sleep(0.01)
+
+        speculation.update("bat")
+        await asyncio.sleep(0)
+
+        assert repository.queries == ["ba", "bat"]
+
+    @pytest.mark.asyncio
+    async def test_edited_query_cancels_speculation(self, repository, speculation):
+        speculation.update("bat")
+        await asyncio.sleep(0)
+
+        speculation.update("bad")
+        await asyncio.sleep(0)
+
+        assert repository.cancelled == ["bat"]
+        assert repository.queries == ["bat", "bad"]
+
+    @pytest.mark.asyncio
+    async def test_take_cancels_unrelated_speculation(self, repository, speculation):
+        speculation.update("bat")
+        await asyncio.sleep(0)
+
+        assert await speculation.take("superman") is None
+        await asyncio.sleep(0)
+
+        assert repository.cancelled == ["bat"]
+
+    @pytest.mark.asyncio
+    async def test_provisional_results_filter_prefix_results(
+        self, repository, speculation
+    ):
+        repository.release.set()
+        speculation.update("ba")
+        await asyncio.sleep(0.01)
+
+        assert await speculation.take("batman") is None
+        results = await speculation.provisional_results("batman")
+
+        assert [r.title for r in results] == ["The Batman"]
+
+    @pytest.mark.asyncio
+    async def test_provisional_results_wait_for_running_prefix(
+        self, repository, speculation
+    ):
+        speculation.update("bat")
+        await asyncio.sleep(0)
+        pending = asyncio.create_task(speculation.provisional_results("batman"))
+        await asyncio.sleep(0)
+        assert not pending.done()
+
+        repository.release.set()
+
+        assert [r.title for r in await pending] == ["The Batman"]
+
+    @pytest.mark.asyncio
+    async def test_failed_speculation_is_not_reused(self, repository, speculation):
+        repository.release.set()
+        speculation.update("fail")
+
+        assert await speculation.take("fail") is None
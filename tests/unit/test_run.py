@@ -0,0 +1,176 @@
+import json
+import subprocess
+import sys
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+import pytest
+from sqlmodel import create_engine
+
+from streaming_overview_tui.config_layer.config import StreamingService
+from streaming_overview_tui.config_layer.config import UserConfig
+from streaming_overview_tui.data_layer import database
+from streaming_overview_tui.data_layer.circuit_breaker import CircuitOpenError
+from streaming_overview_tui.run import main
+from streaming_overview_tui.search_engine import ContentItem
+from streaming_overview_tui.search_engine import SearchError
+
+# Cumulative import time allowed for the streaming-tui entry point
+ENTRY_POINT_IMPORT_BUDGET_MS = 100
+
+# Modules the entry point must leave to the command that needs them
+HEAVY_MODULES = ["textual", "PIL", "httpx", "sqlmodel", "pydantic_settings"]
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        Cumulative import time in microseconds per imported module
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestEntryPointImport:
+    def test_within_budget(self):
+        times = import_times("streaming_overview_tui.run")
+
+        assert times["streaming_overview_tui.run"] / 1000 <= (
+            ENTRY_POINT_IMPORT_BUDGET_MS
+        )
+
+    def test_heavy_modules_are_deferred(self):
+        times = import_times("streaming_overview_tui.run")
+
+        assert [module for module in HEAVY_MODULES if module in times] == []
+
+
+class TestImportCatalogCommand:
+    @pytest.fixture
+    def engine(self, tmp_path, monkeypatch):
+        engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+        monkeypatch.setattr(database, "_engine", engine)
+        yield engine
+        engine.dispose()
+
+    def test_unknown_file_name_exits_with_error(self, engine, tmp_path, capsys):
+        export = tmp_path / "export.json"
+        export.write_text("")
+
+        with pytest.raises(SystemExit) as exit_info:
+            main(["import-catalog", str(export)])
+
+        assert exit_info.value.code == 1
+        assert "--type" in capsys.readouterr().err
+
+    def test_missing_file_exits_with_error(self, engine, tmp_path, capsys):
+        with pytest.raises(SystemExit) as exit_info:
+            main(["import-catalog", str(tmp_path / "movie_ids.json")])
+
+        assert exit_info.value.code == 1
+        assert "Cannot read" in capsys.readouterr().err
+
+
+class TestSyncCommand:
+    def test_unreachable_tmdb_exits_with_error(self, capsys):
+        with (
+            patch(
+                "streaming_overview_tui.data_layer.sync.sync_changes",
+                AsyncMock(side_effect=CircuitOpenError("TMDB API circuit is open")),
+            ),
+            pytest.raises(SystemExit) as exit_info,
+        ):
+            main(["sync"])
+
+        assert exit_info.value.code == 1
+        assert "TMDB API circuit is open" in capsys.readouterr().err
+
+
+class TestSearchCommand:
+    @pytest.fixture
+    def user_config(self):
+        with patch(
+            "streaming_overview_tui.config_layer.config.load_user_config",
+            return_value=UserConfig(subscriptions=[StreamingService.NETFLIX.value]),
+        ):
+            yield
+
+    def test_prints_json_lines(self, user_config, capsys):
+        item = ContentItem(
+            tmdb_id=414906,
+            title="The Batman",
+            year=2022,
+            content_type="movie",
+            poster_url=None,
+            services=[StreamingService.NETFLIX],
+            rating=7.7,
+            watch_urls={StreamingService.NETFLIX: "https://example.com/batman"},
+        )
+
+        async def search_stream(query, subscribed_services):
+            assert subscribed_services == [StreamingService.NETFLIX]
+            yield 0, item
+
+        with patch(
+            "streaming_overview_tui.search_engine.search.search_stream", search_stream
+        ):
+            main(["search", "batman", "--json"])
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {
+                "rank": 0,
+                "tmdb_id": 414906,
+                "title": "The Batman",
+                "year": 2022,
+                "content_type": "movie",
+                "services": ["Netflix"],
+                "watch_urls": {"Netflix": "https://example.com/batman"},
+                "rating": 7.7,
+                "overview": None,
+                "poster_url": None,
+            }
+        ]
+
+    def test_failed_search_exits_with_error(self, user_config, capsys):
+        async def search_stream(query, subscribed_services):
+            raise SearchError("TMDB API unavailable")
+            yield
+
+        with (
+            patch(
+                "streaming_overview_tui.search_engine.search.search_stream",
+                search_stream,
+            ),
+            pytest.raises(SystemExit) as exit_info,
+        ):
+            main(["search", "batman", "--json"])
+
+        assert exit_info.value.code == 1
+        assert capsys.readouterr().err.strip() == "TMDB API unavailable"
+
+    def test_does_not_import_textual_or_pil(self):
+        code = (
+            "import sys\n"
+            "from streaming_overview_tui.run import main\n"
+            "main(['search', 'x', '--json'])\n"
+            "print([m for m in ('textual', 'PIL') if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
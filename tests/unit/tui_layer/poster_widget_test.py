@@ -1,13 +1,28 @@
 import io
-from unittest.mock import AsyncMock
+import threading
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import httpx
+import numpy as np
 import pytest
 from PIL import Image
 from textual.app import App
 from textual.app import ComposeResult
 
+from streaming_overview_tui.data_layer.poster_cache import DiskPosterCache
+from streaming_overview_tui.data_layer.poster_cache import PosterMemoryCache
+from streaming_overview_tui.data_layer.poster_downloader import PosterDownloader
+from streaming_overview_tui.data_layer.scheduler import work_scheduler
+from streaming_overview_tui.tui_layer.widgets.poster_widget import (
+    poster_download_url,
+)
+from streaming_overview_tui.tui_layer.widgets.poster_widget import POSTER_HEIGHT
+from streaming_overview_tui.tui_layer.widgets.poster_widget import POSTER_WIDTH
 from streaming_overview_tui.tui_layer.widgets.poster_widget import PosterWidget
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import (
+    GraphicsProtocol,
+)
 
 
 class PosterWidgetApp(App):
@@ -43,23 +58,319 @@ class TestPosterWidgetFetch:
         test_image.save(img_bytes, format="PNG")
         img_bytes.seek(0)
 
-        mock_response = AsyncMock()
-        mock_response.content = img_bytes.getvalue()
-        mock_response.raise_for_status = lambda: None
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=img_bytes.getvalue())
+        )
+        app = PosterWidgetApp(
+            poster_url="https://image.tmdb.org/t/p/w92/test.jpg",
+            tmdb_id=123,
+        )
+        app.poster_downloader = PosterDownloader(
+            client=httpx.Client(transport=transport)
+        )
+        async with app.run_test() as pilot:
+            widget = pilot.app.query_one(PosterWidget)
+            # Trigger fetch
+            widget.fetch_poster()
+            # Wait for worker to complete
+            await pilot.app.workers.wait_for_complete()
+            await pilot.pause()
+
+            rendered = widget.render_str()
+            # Should contain half-block characters, not placeholder
+            assert "▄" in rendered
+
+
+class TestPosterWidgetDiskCache:
+    @pytest.mark.asyncio
+    async def test_renders_from_disk_cache_without_download(self, tmp_path):
+        disk_cache = DiskPosterCache(directory=tmp_path)
+        grid = np.zeros((POSTER_HEIGHT, POSTER_WIDTH, 2, 3), dtype=np.uint8)
+        disk_cache.put(123, "/test.jpg", POSTER_WIDTH, POSTER_HEIGHT, grid)
+
+        app = PosterWidgetApp(
+            poster_url="https://image.tmdb.org/t/p/w500/test.jpg",
+            tmdb_id=123,
+        )
+        app.poster_disk_cache = disk_cache
+        app.poster_downloader = MagicMock()
+        async with app.run_test() as pilot:
+            widget = pilot.app.query_one(PosterWidget)
+            widget.fetch_poster()
+            await pilot.app.workers.wait_for_complete()
+
+            assert "▄" in widget.render_str()
+            app.poster_downloader.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reads_disk_cache_after_delay_off_the_ui_thread(self):
+        app = PosterWidgetApp(
+            poster_url="https://image.tmdb.org/t/p/w500/test.jpg",
+            tmdb_id=123,
+        )
+        threads = []
+        app.poster_disk_cache = MagicMock()
+        app.poster_disk_cache.get.side_effect = lambda *key: threads.append(
+            threading.current_thread()
+        )
+        app.poster_downloader = MagicMock()
+        async with app.run_test() as pilot:
+            widget = pilot.app.query_one(PosterWidget)
+            widget.fetch_poster(delay=60)
+            await pilot.pause()
+            app.poster_disk_cache.get.assert_not_called()
+
+            widget.fetch_poster()
+            await pilot.app.workers.wait_for_complete()
+
+            assert threads
+            assert threading.main_thread() not in threads
+
+    @pytest.mark.asyncio
+    async def test_repaints_reuse_cached_strips(self, tmp_path):
+        disk_cache = DiskPosterCache(directory=tmp_path)
+        grid = np.zeros((POSTER_HEIGHT, POSTER_WIDTH, 2, 3), dtype=np.uint8)
+        disk_cache.put(123, "/test.jpg", POSTER_WIDTH, POSTER_HEIGHT, grid)
+
+        app = PosterWidgetApp(
+            poster_url="https://image.tmdb.org/t/p/w500/test.jpg",
+            tmdb_id=123,
+        )
+        app.poster_disk_cache = disk_cache
+        async with app.run_test() as pilot:
+            widget = pilot.app.query_one(PosterWidget)
+            widget.fetch_poster()
+            await pilot.app.workers.wait_for_complete()
+
+            first = widget.render_line(0)
+            widget.refresh()
+            await pilot.pause()
+
+            assert widget.render_line(0) is first
+            assert first.text == "▄" * POSTER_WIDTH
+
+
+class TestPosterWidgetResize:
+    @pytest.mark.asyncio
+    async def test_resize_redraws_from_decoded_image(self):
+        app = PosterWidgetApp(
+            poster_url="https://image.tmdb.org/t/p/w500/test.jpg",
+            tmdb_id=123,
+        )
+        app.poster_cache = PosterMemoryCache()
+        app.poster_cache.put(123, Image.new("RGB", (92, 138), color=(255, 0, 0)))
+        app.poster_downloader = MagicMock()
+        async with app.run_test() as pilot:
+            widget = pilot.app.query_one(PosterWidget)
+            widget.fetch_poster()
+            small = widget.render_line(0)
+
+            widget.styles.width = 24
+            widget.styles.height = 36
+            await pilot.pause()
+
+            lines = widget.render_str().split("\n")
+            assert len(lines) == 36
+            assert all(len(line) == 24 for line in lines)
+            app.poster_downloader.fetch.assert_not_called()
+
+            # Going back to the old size is a render cache hit
+            widget.styles.width = POSTER_WIDTH
+            widget.styles.height = POSTER_HEIGHT
+            await pilot.pause()
+            assert widget.render_line(0) is small
+
+    @pytest.mark.asyncio
+    async def test_resize_scales_grid_without_image(self, tmp_path):
+        disk_cache = DiskPosterCache(directory=tmp_path)
+        grid = np.full((POSTER_HEIGHT, POSTER_WIDTH, 2, 3), 90, dtype=np.uint8)
+        disk_cache.put(123, "/test.jpg", POSTER_WIDTH, POSTER_HEIGHT, grid)
+
+        app = PosterWidgetApp(
+            poster_url="https://image.tmdb.org/t/p/w500/test.jpg",
+            tmdb_id=123,
+        )
+        app.poster_disk_cache = disk_cache
+        app.poster_downloader = MagicMock()
+        async with app.run_test() as pilot:
+            widget = pilot.app.query_one(PosterWidget)
+            widget.fetch_poster()
+            await pilot.app.workers.wait_for_complete()
+
+            widget.styles.width = 20
+            widget.styles.height = 30
+            await pilot.pause()
+
+            assert widget.render_str().count("▄") == 20 * 30
+            app.poster_downloader.fetch.assert_not_called()
+
+
+class TestPosterWidgetThumbnail:
+    @pytest.mark.asyncio
+    async def test_paints_stored_thumbnail_while_loading(self):
+        app = PosterWidgetApp(
+            poster_url="https://image.tmdb.org/t/p/w500/test.jpg",
+            tmdb_id=123,
+        )
+        app.poster_thumbnails = MagicMock()
+        app.poster_thumbnails.get.return_value = np.full(
+            (4, 3, 2, 3), 200, dtype=np.uint8
+        )
+        app.poster_downloader = MagicMock()
+        async with app.run_test() as pilot:
+            widget = pilot.app.query_one(PosterWidget)
+            # Long enough that the download does not start during the test
+            widget.fetch_poster(delay=60)
+            await pilot.app.workers.wait_for_complete()
+            await pilot.pause()
 
-        with patch("httpx.Client.get", return_value=mock_response):
-            app = PosterWidgetApp(
-                poster_url="https://image.tmdb.org/t/p/w92/test.jpg",
-                tmdb_id=123,
-            )
+            # Shows an approximate poster instead of "Loading"
+            rendered = widget.render_str()
+            assert "Loading" not in rendered
+            assert rendered.count("▄") == POSTER_WIDTH * POSTER_HEIGHT
+            app.poster_thumbnails.get.assert_called_once_with("/test.jpg")
+
+    @pytest.mark.asyncio
+    async def test_reads_thumbnail_off_the_ui_thread(self):
+        app = PosterWidgetApp(
+            poster_url="https://image.tmdb.org/t/p/w500/test.jpg",
+            tmdb_id=123,
+        )
+        threads = []
+        app.poster_thumbnails = MagicMock()
+        app.poster_thumbnails.get.side_effect = lambda path: threads.append(
+            threading.current_thread()
+        )
+        app.poster_downloader = MagicMock()
+        async with app.run_test() as pilot:
+            widget = pilot.app.query_one(PosterWidget)
+            widget.fetch_poster(delay=60)
+            await pilot.app.workers.wait_for_complete()
+
+            assert threads
+            assert threading.main_thread() not in threads
+
+    @pytest.mark.asyncio
+    async def test_stores_thumbnail_after_download(self):
+        test_image = Image.new("RGB", (92, 138), color=(255, 0, 0))
+        img_bytes = io.BytesIO()
+        test_image.save(img_bytes, format="PNG")
+
+        app = PosterWidgetApp(
+            poster_url="https://image.tmdb.org/t/p/w500/test.jpg",
+            tmdb_id=123,
+        )
+        app.poster_thumbnails = MagicMock()
+        app.poster_thumbnails.get.return_value = None
+        app.poster_downloader = MagicMock()
+        app.poster_downloader.fetch.return_value = img_bytes.getvalue()
+        async with app.run_test() as pilot:
+            widget = pilot.app.query_one(PosterWidget)
+            widget.fetch_poster()
+            await pilot.app.workers.wait_for_complete()
+            await work_scheduler.join()
+
+            path, grid = app.poster_thumbnails.put.call_args.args
+            assert path == "/test.jpg"
+            assert grid.shape == (4, 3, 2, 3)
+            assert tuple(grid[0, 0, 0]) == (255, 0, 0)
+
+
+class TestPosterWidgetGraphics:
+    @pytest.mark.asyncio
+    async def test_kitty_sends_image_once_then_places_it(self):
+        app = PosterWidgetApp(
+            poster_url="https://image.tmdb.org/t/p/w500/test.jpg",
+            tmdb_id=123,
+        )
+        app.poster_graphics = GraphicsProtocol.KITTY
+        # 12x18 cells of 10x20 pixels need the w342 poster
+        app.poster_image_cache = PosterMemoryCache(thumbnail_size=(780, 1170))
+        app.poster_image_cache.put(
+            "https://image.tmdb.org/t/p/w342/test.jpg",
+            Image.new("RGB", (342, 513), color=(255, 0, 0)),
+        )
+        app.poster_downloader = MagicMock()
+        written: list[str] = []
+        with patch.object(PosterWidget, "_write_terminal", side_effect=written.append):
+            async with app.run_test() as pilot:
+                widget = pilot.app.query_one(PosterWidget)
+                widget.fetch_poster()
+                await pilot.pause()
+                app.poster_downloader.fetch.assert_not_called()
+
+                # Cells stay blank, the image is drawn over them
+                assert widget.render_str().strip() == ""
+                assert len(written) == 1
+                assert "a=T,f=100" in written[0]
+
+                widget.refresh()
+                await pilot.pause()
+                assert len(written) == 2
+                assert "a=p" in written[1]
+                assert "a=T" not in written[1]
+
+                widget._show_placeholder()
+                assert "a=d" in written[-1]
+
+    @pytest.mark.asyncio
+    async def test_kitty_downloads_and_sends_full_size_poster(self):
+        buffer = io.BytesIO()
+        Image.new("RGB", (342, 513), color=(0, 0, 255)).save(buffer, format="PNG")
+        app = PosterWidgetApp(
+            poster_url="https://image.tmdb.org/t/p/w500/test.jpg",
+            tmdb_id=123,
+        )
+        app.poster_graphics = GraphicsProtocol.KITTY
+        app.poster_cell_pixels = (10, 20)
+        app.poster_image_cache = PosterMemoryCache(thumbnail_size=(780, 1170))
+        app.poster_downloader = MagicMock()
+        app.poster_downloader.fetch.return_value = buffer.getvalue()
+        with patch.object(PosterWidget, "_write_terminal"):
             async with app.run_test() as pilot:
                 widget = pilot.app.query_one(PosterWidget)
-                # Trigger fetch
                 widget.fetch_poster()
-                # Wait for worker to complete
+                await pilot.app.workers.wait_for_complete()
                 await pilot.pause()
+
+                url = "https://image.tmdb.org/t/p/w342/test.jpg"
+                assert app.poster_downloader.fetch.call_args.args[0] == url
+                assert widget._graphics_image.size == (342, 513)
+                assert app.poster_image_cache.get(url).size == (342, 513)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_half_blocks_without_terminal(self):
+        app = PosterWidgetApp(
+            poster_url="https://image.tmdb.org/t/p/w500/test.jpg",
+            tmdb_id=123,
+        )
+        app.poster_graphics = GraphicsProtocol.KITTY
+        app.poster_cache = PosterMemoryCache()
+        app.poster_cache.put(123, Image.new("RGB", (92, 138), color=(255, 0, 0)))
+        written: list[str] = []
+        with (
+            patch.object(PosterWidget, "_terminal_driver", return_value=None),
+            patch.object(PosterWidget, "_write_terminal", side_effect=written.append),
+        ):
+            async with app.run_test() as pilot:
+                widget = pilot.app.query_one(PosterWidget)
+                widget.fetch_poster()
                 await pilot.pause()
 
-                rendered = widget.render_str()
-                # Should contain half-block characters, not placeholder
-                assert "▄" in rendered
+                assert widget.graphics_protocol == GraphicsProtocol.HALF_BLOCKS
+                assert "▄" in widget.render_str()
+                assert written == []
+
+
+class TestPosterDownloadUrl:
+    def test_half_blocks_use_smallest_size(self):
+        url = "https://image.tmdb.org/t/p/w500/test.jpg"
+        assert poster_download_url(url) == "https://image.tmdb.org/t/p/w92/test.jpg"
+
+    def test_sized_for_cell_pixels(self):
+        url = "https://image.tmdb.org/t/p/w500/test.jpg"
+        assert poster_download_url(url, 12, 18, (10, 20)).endswith("/w342/test.jpg")
+
+    def test_never_the_original(self):
+        url = "https://image.tmdb.org/t/p/w500/test.jpg"
+        assert poster_download_url(url, 40, 60, (10, 20)).endswith("/w780/test.jpg")
@@ -1,10 +1,19 @@
+from concurrent.futures import CancelledError
+from unittest.mock import MagicMock
+
 import pytest
 from textual.app import App
 from textual.app import ComposeResult
+from textual.widgets import Button
+from textual.widgets import Label
 
 from streaming_overview_tui.config_layer.config import StreamingService
 from streaming_overview_tui.search_engine.models import ContentItem
 from streaming_overview_tui.tui_layer.widgets.detail_panel import DetailPanel
+from streaming_overview_tui.tui_layer.widgets.detail_panel import (
+    POSTER_SETTLE_SECONDS,
+)
+from streaming_overview_tui.tui_layer.widgets.detail_panel import poster_size_for
 from streaming_overview_tui.tui_layer.widgets.poster_widget import PosterWidget
 
 
@@ -152,3 +161,97 @@ class TestDetailPanelLayout:
         async with DetailPanelApp(item).run_test() as pilot:
             poster = pilot.app.query_one(PosterWidget)
             assert poster.tmdb_id == 456
+
+
+class TestDetailPanelUpdates:
+    @pytest.mark.asyncio
+    async def test_switching_items_updates_widgets_in_place(self):
+        first = ContentItem(
+            tmdb_id=1,
+            title="First",
+            year=2020,
+            content_type="movie",
+            poster_url=None,
+            services=[StreamingService.NETFLIX, StreamingService.HBO_MAX],
+            overview="One",
+            rating=7.0,
+            watch_urls={
+                StreamingService.NETFLIX: "https://netflix.com/1",
+                StreamingService.HBO_MAX: "https://max.com/1",
+            },
+        )
+        second = ContentItem(
+            tmdb_id=2,
+            title="Second",
+            year=2021,
+            content_type="tv",
+            poster_url=None,
+            services=[StreamingService.HBO_MAX],
+            overview=None,
+            rating=None,
+            watch_urls={StreamingService.HBO_MAX: "https://max.com/2"},
+        )
+        async with DetailPanelApp(first).run_test() as pilot:
+            panel = pilot.app.query_one(DetailPanel)
+            await pilot.pause()
+            widgets = list(panel.query("#info-container > *"))
+
+            panel.item = second
+            await pilot.pause()
+
+            assert list(panel.query("#info-container > *")) == widgets
+            assert "Second" in str(panel.query_one(".title", Label).render())
+            assert not panel.query_one(".rating", Label).display
+            buttons = [button for button in panel.query(Button) if button.display]
+            assert [button.url for button in buttons] == ["https://max.com/2"]
+            assert str(buttons[0].label) == f"Watch on {StreamingService.HBO_MAX.value}"
+
+    @pytest.mark.asyncio
+    async def test_poster_download_waits_for_item_to_settle(self):
+        def make(tmdb_id: int) -> ContentItem:
+            return ContentItem(
+                tmdb_id=tmdb_id,
+                title=f"Title {tmdb_id}",
+                year=2020,
+                content_type="movie",
+                poster_url=f"/{tmdb_id}.jpg",
+                services=[],
+            )
+
+        app = DetailPanelApp()
+        app.poster_downloader = MagicMock()
+        app.poster_downloader.fetch.side_effect = CancelledError
+        async with app.run_test() as pilot:
+            panel = pilot.app.query_one(DetailPanel)
+            await pilot.pause()
+            for tmdb_id in range(1, 6):
+                panel.item = make(tmdb_id)
+            assert pilot.app.query_one(PosterWidget)._fetch_worker is None
+
+            await pilot.pause(POSTER_SETTLE_SECONDS * 2)
+            await pilot.app.workers.wait_for_complete()
+
+            app.poster_downloader.fetch.assert_called_once()
+            assert "/5.jpg" in app.poster_downloader.fetch.call_args.args[0]
+
+
+class TestPosterSize:
+    def test_small_panel_keeps_default_size(self):
+        assert poster_size_for(20, 10) == (12, 18)
+
+    def test_scales_with_panel_width(self):
+        assert poster_size_for(60, 100) == (24, 36)
+
+    def test_limited_by_panel_height(self):
+        assert poster_size_for(100, 30) == (20, 30)
+
+    def test_never_exceeds_max_size(self):
+        assert poster_size_for(400, 400) == (40, 60)
+
+    @pytest.mark.asyncio
+    async def test_poster_follows_panel_size(self):
+        async with DetailPanelApp().run_test(size=(150, 60)) as pilot:
+            poster = pilot.app.query_one(PosterWidget)
+            await pilot.pause()
+            assert poster.size.width > 12
+            assert poster.size.height == poster.size.width * 18 // 12
@@ -1,8 +1,21 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
 import pytest
 from textual.app import App
 from textual.app import ComposeResult
 from textual.widgets import Input
+from textual.widgets import Static
 
+from streaming_overview_tui.config_layer.config import StreamingService
+from streaming_overview_tui.config_layer.config import UserConfig
+from streaming_overview_tui.data_layer.saved_session import SavedSession
+from streaming_overview_tui.search_engine import ContentItem
+from streaming_overview_tui.search_engine import SearchResult
 from streaming_overview_tui.tui_layer.main_screen import MainScreen
 from streaming_overview_tui.tui_layer.widgets import DetailPanel
 from streaming_overview_tui.tui_layer.widgets import ResultsList
@@ -40,3 +53,242 @@ class TestMainScreen:
             results_list = pilot.app.query_one(ResultsList)
             rendered = results_list.render_str()
             assert "Start typing" in rendered or "search" in rendered.lower()
+
+    @pytest.mark.asyncio
+    async def test_typing_pauses_cache_warmer(self):
+        async with MainScreenApp().run_test() as pilot:
+            screen = pilot.app.query_one(MainScreen)
+            assert screen._idle_timer is not None
+
+            await pilot.press("b")
+
+            assert screen._idle_timer is None
+
+    @pytest.mark.asyncio
+    async def test_search_waits_for_config_loaded_after_mount(self):
+        loading = threading.Event()
+
+        def load_user_config():
+            loading.wait(5)
+            return UserConfig(subscriptions=[StreamingService.NETFLIX.value])
+
+        search = AsyncMock(
+            return_value=SearchResult(available=[], other=[], error=None)
+        )
+        with (
+            patch(
+                "streaming_overview_tui.tui_layer.main_screen.load_user_config",
+                load_user_config,
+            ),
+            patch("streaming_overview_tui.tui_layer.main_screen.search", search),
+        ):
+            async with MainScreenApp().run_test() as pilot:
+                screen = pilot.app.query_one(MainScreen)
+                screen._speculation.update = lambda query: None
+
+                screen._do_search("batman")
+                await pilot.pause()
+                search.assert_not_called()
+
+                loading.set()
+                await pilot.app.workers.wait_for_complete()
+
+                search.assert_awaited_once_with("batman", [StreamingService.NETFLIX])
+
+
+def make_item(tmdb_id: int) -> ContentItem:
+    return ContentItem(
+        tmdb_id=tmdb_id,
+        title=f"Title {tmdb_id}",
+        year=2020,
+        content_type="movie",
+        poster_url=f"https://image.tmdb.org/t/p/w500/{tmdb_id}.jpg",
+        services=[],
+    )
+
+
+def poster_url(tmdb_id: int) -> str:
+    return f"https://image.tmdb.org/t/p/w92/{tmdb_id}.jpg"
+
+
+def make_downloader() -> MagicMock:
+    """Downloader whose downloads never finish."""
+    downloader = MagicMock()
+    downloader.submit.side_effect = lambda url, priority: Future()
+    return downloader
+
+
+class TestPosterPrefetch:
+    @pytest.mark.asyncio
+    async def test_new_results_cancel_stale_and_prefetch_top(self):
+        app = MainScreenApp()
+        app.poster_downloader = make_downloader()
+        async with app.run_test() as pilot:
+            screen = pilot.app.query_one(MainScreen)
+            items = [make_item(i) for i in range(1, 6)]
+
+            screen._update_results(SearchResult(available=[], other=items, error=None))
+
+            keep = app.poster_downloader.cancel.call_args.kwargs["keep"]
+            assert keep == {poster_url(i) for i in range(1, 6)}
+            app.poster_downloader.prioritize.assert_called_with(
+                {poster_url(1): 1, poster_url(2): 2}
+            )
+            await pilot.pause()
+            submitted = [c.args for c in app.poster_downloader.submit.call_args_list]
+            assert submitted[:2] == [(poster_url(1), 1), (poster_url(2), 2)]
+
+    @pytest.mark.asyncio
+    async def test_highlight_prefetches_neighbours_nearest_first(self):
+        app = MainScreenApp()
+        app.poster_downloader = make_downloader()
+        async with app.run_test() as pilot:
+            screen = pilot.app.query_one(MainScreen)
+            items = [make_item(i) for i in range(1, 8)]
+            screen._update_results(SearchResult(available=[], other=items, error=None))
+
+            screen.on_results_list_item_selected(ResultsList.ItemSelected(items[3]))
+
+            app.poster_downloader.prioritize.assert_called_with(
+                {
+                    poster_url(2): 2,
+                    poster_url(3): 1,
+                    poster_url(4): 0,
+                    poster_url(5): 1,
+                    poster_url(6): 2,
+                }
+            )
+            assert set(screen._prefetch_jobs) == {poster_url(i) for i in range(2, 7)}
+
+
+class RememberingApp(App):
+    """Test app with a MainScreen that saves and restores its session."""
+
+    def __init__(self):
+        super().__init__()
+        self.poster_downloader = make_downloader()
+
+    def compose(self) -> ComposeResult:
+        yield MainScreen(remember_session=True)
+
+
+class TestSessionRestore:
+    @pytest.fixture
+    def session_store(self):
+        """Keep the saved session in memory, and stub out TMDB."""
+        saved = {}
+        items = {i: make_item(i) for i in range(1, 6)}
+
+        def save_session(query, results, selected):
+            saved["session"] = SavedSession(query, results, selected)
+
+        def restore_results(keys, subscribed_services):
+            return SearchResult(
+                available=[],
+                other=[items[tmdb_id] for _, tmdb_id in keys],
+                error=None,
+            )
+
+        search = AsyncMock(
+            return_value=SearchResult(
+                available=[], other=list(items.values()), error=None
+            )
+        )
+        module = "streaming_overview_tui.tui_layer.main_screen"
+        with (
+            patch(f"{module}.save_session", save_session),
+            patch(f"{module}.load_session", lambda: saved.get("session")),
+            patch(f"{module}.restore_results", restore_results),
+            patch(f"{module}.refresh_availability", AsyncMock()) as refresh,
+            patch(f"{module}.search", search),
+        ):
+            yield saved, items, refresh, search
+
+    @pytest.mark.asyncio
+    async def test_restores_query_results_and_selection(self, session_store):
+        saved, items, refresh, search = session_store
+        saved["session"] = SavedSession(
+            "title", [("movie", 3), ("movie", 1), ("movie", 2)], ("movie", 1)
+        )
+        revalidated = asyncio.Event()
+
+        async def revalidate(query, subscribed_services):
+            await revalidated.wait()
+            return SearchResult(available=[], other=list(items.values()), error=None)
+
+        search.side_effect = revalidate
+
+        async with RememberingApp().run_test() as pilot:
+            screen = pilot.app.query_one(MainScreen)
+            await pilot.pause()
+            results_list = pilot.app.query_one(ResultsList)
+
+            assert pilot.app.query_one("#search-input", Input).value == "title"
+            assert [item.tmdb_id for item in results_list.items] == [3, 1, 2]
+            assert results_list.highlighted == 1
+            assert screen._debouncer.searches == 0  # No search from typing
+
+            # Revalidated in the background, keeping the highlight
+            revalidated.set()
+            await pilot.app.workers.wait_for_complete()
+            await pilot.pause()
+
+            refresh.assert_awaited_once()
+            assert search.await_args.args[0] == "title"
+            assert len(results_list.items) == 5
+            assert results_list.items[results_list.highlighted].tmdb_id == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_revalidation_keeps_restored_results(self, session_store):
+        saved, _, _, search = session_store
+        saved["session"] = SavedSession(
+            "title", [("movie", 3), ("movie", 1)], ("movie", 1)
+        )
+        search.return_value = SearchResult(
+            available=[],
+            other=[],
+            error="TMDB API unavailable - please try again later",
+        )
+
+        async with RememberingApp().run_test() as pilot:
+            await pilot.pause()
+            await pilot.app.workers.wait_for_complete()
+            await pilot.pause()
+
+            results_list = pilot.app.query_one(ResultsList)
+            assert [item.tmdb_id for item in results_list.items] == [3, 1]
+            assert results_list.items[results_list.highlighted].tmdb_id == 1
+            status = str(pilot.app.query_one("#status-bar", Static).render())
+            assert "could not update" in status
+
+        # The restored session is saved again rather than cleared
+        session = saved["session"]
+        assert session.results == [("movie", 3), ("movie", 1)]
+        assert session.selected == ("movie", 1)
+
+    @pytest.mark.asyncio
+    async def test_saves_session_on_exit(self, session_store):
+        saved, items, _, _ = session_store
+
+        async with RememberingApp().run_test() as pilot:
+            screen = pilot.app.query_one(MainScreen)
+            screen._current_query = "title"
+            screen._update_results(
+                SearchResult(available=[], other=[items[4], items[5]], error=None)
+            )
+            screen.on_results_list_item_selected(ResultsList.ItemSelected(items[5]))
+
+        session = saved["session"]
+        assert session.query == "title"
+        assert session.results == [("movie", 4), ("movie", 5)]
+        assert session.selected == ("movie", 5)
+
+    @pytest.mark.asyncio
+    async def test_nothing_restored_without_saved_session(self, session_store):
+        _, _, _, search = session_store
+
+        async with RememberingApp().run_test() as pilot:
+            await pilot.app.workers.wait_for_complete()
+
+            assert pilot.app.query_one(ResultsList).results is None
+            search.assert_not_awaited()
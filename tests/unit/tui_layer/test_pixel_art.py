@@ -1,6 +1,13 @@
+import io
+
+import numpy as np
 from PIL import Image
 from rich.text import Text
 
+from streaming_overview_tui.tui_layer.widgets.pixel_art import color_grid_to_strips
+from streaming_overview_tui.tui_layer.widgets.pixel_art import color_grid_to_text
+from streaming_overview_tui.tui_layer.widgets.pixel_art import decode_image
+from streaming_overview_tui.tui_layer.widgets.pixel_art import image_to_color_grid
 from streaming_overview_tui.tui_layer.widgets.pixel_art import image_to_half_blocks
 
 
@@ -46,3 +53,130 @@ class TestImageToHalfBlocks:
 
         assert len(lines) == 18
         assert all(len(line) == 12 for line in lines)
+
+
+class TestColorGrid:
+    def test_grid_shape_and_colors(self):
+        img = Image.new("RGB", (2, 4), color=(255, 0, 0))
+        pixels = img.load()
+        pixels[0, 1] = (0, 0, 255)
+
+        grid = image_to_color_grid(img, width=2, height=2)
+
+        assert grid.shape == (2, 2, 2, 3)
+        assert grid.dtype == np.uint8
+        assert tuple(grid[0, 0, 0]) == (255, 0, 0)  # top pixel
+        assert tuple(grid[0, 0, 1]) == (0, 0, 255)  # bottom pixel
+        assert tuple(grid[0, 1, 1]) == (255, 0, 0)
+
+    def test_converts_non_rgb_images(self):
+        img = Image.new("L", (4, 4), color=128)
+        grid = image_to_color_grid(img, width=4, height=2)
+        assert tuple(grid[1, 3, 1]) == (128, 128, 128)
+
+
+class TestRunLengthMerging:
+    def test_solid_image_has_one_span_per_row(self):
+        img = Image.new("RGB", (8, 6), color=(10, 20, 30))
+        result = image_to_half_blocks(img, width=8, height=3)
+
+        assert len(result.spans) == 3
+        assert [(span.start, span.end) for span in result.spans] == [
+            (0, 8),
+            (9, 17),
+            (18, 26),
+        ]
+
+    def test_spans_carry_top_as_background_and_bottom_as_foreground(self):
+        img = Image.new("RGB", (2, 2), color=(255, 0, 0))
+        pixels = img.load()
+        pixels[1, 1] = (0, 0, 255)
+
+        result = image_to_half_blocks(img, width=2, height=1)
+
+        first, second = result.spans
+        assert (first.start, first.end) == (0, 1)
+        assert first.style.bgcolor.triplet == (255, 0, 0)
+        assert first.style.color.triplet == (255, 0, 0)
+        assert (second.start, second.end) == (1, 2)
+        assert second.style.bgcolor.triplet == (255, 0, 0)
+        assert second.style.color.triplet == (0, 0, 255)
+
+    def test_matches_per_cell_styles(self):
+        rng = np.random.default_rng(1)
+        array = rng.integers(0, 3, size=(8, 5, 3), dtype=np.uint8) * 100
+        img = Image.fromarray(array)
+
+        result = image_to_half_blocks(img, width=5, height=4)
+
+        for y in range(4):
+            for x in range(5):
+                offset = y * 6 + x
+                (style,) = [
+                    span.style
+                    for span in result.spans
+                    if span.start <= offset < span.end
+                ]
+                assert style.bgcolor.triplet == tuple(array[y * 2, x])
+                assert style.color.triplet == tuple(array[y * 2 + 1, x])
+
+    def test_empty_grid_returns_empty_text(self):
+        grid = np.zeros((0, 0, 2, 3), dtype=np.uint8)
+        assert str(color_grid_to_text(grid)) == ""
+
+
+class TestColorGridToStrips:
+    def test_one_strip_per_row_with_merged_runs(self):
+        img = Image.new("RGB", (3, 4), color=(255, 0, 0))
+        pixels = img.load()
+        pixels[2, 3] = (0, 0, 255)
+        grid = image_to_color_grid(img, width=3, height=2)
+
+        strips = color_grid_to_strips(grid)
+
+        assert len(strips) == 2
+        assert all(strip.cell_length == 3 for strip in strips)
+        assert [strip.text for strip in strips] == ["▄▄▄", "▄▄▄"]
+        assert len(list(strips[0])) == 1
+        first, second = strips[1]
+        assert first.text == "▄▄"
+        assert second.style.color.triplet == (0, 0, 255)
+        assert second.style.bgcolor.triplet == (255, 0, 0)
+
+    def test_matches_text_styles(self):
+        rng = np.random.default_rng(2)
+        grid = rng.integers(0, 2, size=(6, 7, 2, 3), dtype=np.uint8) * 255
+
+        strips = color_grid_to_strips(grid)
+        text = color_grid_to_text(grid)
+
+        strip_styles = [
+            (segment.style, len(segment.text)) for strip in strips for segment in strip
+        ]
+        span_styles = [(span.style, span.end - span.start) for span in text.spans]
+        assert strip_styles == span_styles
+
+
+class TestDecodeImage:
+    def encode(self, image: Image.Image, format: str) -> bytes:
+        buffer = io.BytesIO()
+        image.save(buffer, format=format)
+        return buffer.getvalue()
+
+    def test_jpeg_is_decoded_at_reduced_resolution(self):
+        data = self.encode(Image.new("RGB", (500, 750), color=(0, 128, 0)), "JPEG")
+
+        image = decode_image(data, width=12, height=18)
+
+        # Scaled down while decoding, but still covers 12x36 pixels
+        assert image.size[0] < 500
+        assert image.size[0] >= 12
+        assert image.size[1] >= 36
+
+    def test_png_is_decoded_in_full(self):
+        data = self.encode(Image.new("RGB", (92, 138), color=(255, 0, 0)), "PNG")
+
+        image = decode_image(data, width=12, height=18)
+
+        assert image.size == (92, 138)
+        assert image.getpixel((0, 0)) == (255, 0, 0)
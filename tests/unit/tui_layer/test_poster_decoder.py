@@ -0,0 +1,40 @@
+import io
+
+import numpy as np
+from PIL import Image
+
+from streaming_overview_tui.tui_layer.widgets.pixel_art import image_to_color_grid
+from streaming_overview_tui.tui_layer.widgets.poster_decoder import PosterDecoder
+
+
+def make_poster_bytes() -> bytes:
+    image = Image.new("RGB", (92, 138), color=(200, 40, 10))
+    image.paste((10, 40, 200), (0, 69, 92, 138))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestPosterDecoder:
+    def test_decodes_in_thread_by_default(self):
+        decoder = PosterDecoder()
+
+        thumbnail, grid = decoder.decode(make_poster_bytes(), 12, 18)
+
+        assert thumbnail.mode == "RGB"
+        assert thumbnail.size == (92, 138)
+        assert grid.shape == (18, 12, 2, 3)
+        assert tuple(grid[0, 0, 0]) == (200, 40, 10)
+        assert tuple(grid[-1, 0, 1]) == (10, 40, 200)
+
+    def test_process_pool_matches_thread_decode(self):
+        data = make_poster_bytes()
+        decoder = PosterDecoder(processes=1)
+        try:
+            thumbnail, grid = decoder.decode(data, 12, 18)
+        finally:
+            decoder.shutdown()
+
+        expected = image_to_color_grid(Image.open(io.BytesIO(data)), 12, 18)
+        assert np.array_equal(grid, expected)
+        assert thumbnail.size == (92, 138)
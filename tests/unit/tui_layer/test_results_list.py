@@ -102,3 +102,205 @@ class TestResultsList:
             widget = pilot.app.query_one(ResultsList)
             rendered = widget.render_str()
             assert "Start typing" in rendered or "search" in rendered.lower()
+
+
+def make_numbered_items(count: int) -> list[ContentItem]:
+    return [
+        ContentItem(
+            tmdb_id=i,
+            title=f"Movie {i}",
+            year=2000,
+            content_type="movie",
+            poster_url=None,
+            services=[],
+        )
+        for i in range(count)
+    ]
+
+
+class SelectionRecorder(ResultsListApp):
+    """Test app that records selected items."""
+
+    def __init__(self, results: SearchResult | None = None):
+        super().__init__(results)
+        self.selected: list[ContentItem] = []
+
+    def on_results_list_item_selected(self, event: ResultsList.ItemSelected) -> None:
+        self.selected.append(event.item)
+
+
+class TestResultsListNavigation:
+    @pytest.mark.asyncio
+    async def test_arrow_keys_move_highlight_across_sections(self):
+        available = [make_item("Available Movie", [StreamingService.NETFLIX])]
+        other = make_numbered_items(2)
+        results = SearchResult(available=available, other=other, error=None)
+        async with SelectionRecorder(results).run_test() as pilot:
+            widget = pilot.app.query_one(ResultsList)
+            widget.focus()
+            await pilot.pause()
+            assert widget.highlighted == 0
+
+            await pilot.press("down", "down")
+            assert widget.highlighted == 2
+            await pilot.press("down")  # Stops at the last item
+            assert widget.highlighted == 2
+            await pilot.press("up")
+            await pilot.pause()
+
+            assert [item.title for item in pilot.app.selected] == [
+                "Available Movie",
+                "Movie 0",
+                "Movie 1",
+                "Movie 0",
+            ]
+
+    @pytest.mark.asyncio
+    async def test_enter_selects_highlighted_item(self):
+        results = SearchResult(available=[], other=make_numbered_items(3), error=None)
+        async with SelectionRecorder(results).run_test() as pilot:
+            widget = pilot.app.query_one(ResultsList)
+            widget.focus()
+            await pilot.press("down")
+            pilot.app.selected.clear()
+
+            await pilot.press("enter")
+            await pilot.pause()
+
+            assert [item.title for item in pilot.app.selected] == ["Movie 1"]
+
+
+class TestResultsListVirtualisation:
+    @pytest.mark.asyncio
+    async def test_only_visible_rows_are_rendered(self):
+        results = SearchResult(
+            available=[], other=make_numbered_items(10_000), error=None
+        )
+        async with ResultsListApp(results).run_test(size=(80, 24)) as pilot:
+            widget = pilot.app.query_one(ResultsList)
+            await pilot.pause()
+
+            assert widget.virtual_size.height == 10_002
+            assert len(widget._line_cache) <= widget.size.height
+
+    @pytest.mark.asyncio
+    async def test_end_key_scrolls_to_last_item(self):
+        results = SearchResult(
+            available=[], other=make_numbered_items(10_000), error=None
+        )
+        async with ResultsListApp(results).run_test(size=(80, 24)) as pilot:
+            widget = pilot.app.query_one(ResultsList)
+            widget.focus()
+
+            await pilot.press("end")
+            await pilot.pause()
+
+            assert widget.highlighted == 9_999
+            assert widget.scroll_offset.y == widget.max_scroll_y
+            last_line = widget.render_line(widget.size.height - 1).text
+            assert "Movie 9999" in last_line
+
+    @pytest.mark.asyncio
+    async def test_click_selects_item(self):
+        results = SearchResult(available=[], other=make_numbered_items(5), error=None)
+        async with SelectionRecorder(results).run_test() as pilot:
+            await pilot.pause()
+            pilot.app.selected.clear()
+
+            # Rows: blank, header, then items
+            await pilot.click(ResultsList, offset=(2, 4))
+            await pilot.pause()
+
+            assert pilot.app.query_one(ResultsList).highlighted == 2
+            assert pilot.app.selected[-1].title == "Movie 2"
+
+
+def make_results(ids: list[int], available_ids: tuple[int, ...] = ()) -> SearchResult:
+    items = {item.tmdb_id: item for item in make_numbered_items(max(ids) + 1)}
+    for tmdb_id in available_ids:
+        items[tmdb_id].services = [StreamingService.NETFLIX]
+    return SearchResult(
+        available=[items[i] for i in ids if i in available_ids],
+        other=[items[i] for i in ids if i not in available_ids],
+        error=None,
+    )
+
+
+class TestResultsListReconciliation:
+    @pytest.mark.asyncio
+    async def test_highlighted_item_stays_in_place_on_screen(self):
+        async with SelectionRecorder(make_results(list(range(100)))).run_test(
+            size=(80, 24)
+        ) as pilot:
+            widget = pilot.app.query_one(ResultsList)
+            widget.highlighted = 50
+            await pilot.pause()
+            screen_row = widget._item_rows[50] - widget.scroll_offset.y
+
+            # Two items drop out above it, so it moves up two places
+            widget.results = make_results([i for i in range(100) if i not in (3, 4)])
+            await pilot.pause()
+
+            assert widget.items[widget.highlighted].tmdb_id == 50
+            assert widget._item_rows[widget.highlighted] - widget.scroll_offset.y == (
+                screen_row
+            )
+            assert pilot.app.selected[-1].tmdb_id == 50
+
+    @pytest.mark.asyncio
+    async def test_item_moves_between_sections(self):
+        async with SelectionRecorder(make_results([0, 1, 2])).run_test() as pilot:
+            widget = pilot.app.query_one(ResultsList)
+            widget.highlighted = 2
+            await pilot.pause()
+
+            widget.results = make_results([0, 1, 2], available_ids=(2,))
+            await pilot.pause()
+
+            assert widget.highlighted == 0
+            assert widget.index_of(pilot.app.selected[-1]) == 0
+            assert pilot.app.selected[-1].services == [StreamingService.NETFLIX]
+            assert "Netflix" in widget.render_line(2).text
+
+    @pytest.mark.asyncio
+    async def test_unchanged_rows_are_not_rendered_again(self):
+        async with ResultsListApp(make_results([0, 1, 2])).run_test() as pilot:
+            widget = pilot.app.query_one(ResultsList)
+            await pilot.pause()
+            before = widget.render_line(4)
+
+            widget.results = make_results([0, 1, 2, 3])
+            await pilot.pause()
+
+            assert widget.render_line(4) is before
+
+    @pytest.mark.asyncio
+    async def test_highlight_resets_when_item_is_gone(self):
+        async with ResultsListApp(make_results(list(range(50)))).run_test(
+            size=(80, 24)
+        ) as pilot:
+            widget = pilot.app.query_one(ResultsList)
+            widget.highlighted = 40
+            await pilot.pause()
+
+            widget.results = make_results([0, 1, 2])
+            await pilot.pause()
+
+            assert widget.highlighted == 0
+            assert widget.scroll_offset.y == 0
+
+
+class TestResultsListHighlightCoalescing:
+    @pytest.mark.asyncio
+    async def test_highlight_changes_in_one_frame_announce_once(self):
+        results = SearchResult(available=[], other=make_numbered_items(50), error=None)
+        async with SelectionRecorder(results).run_test() as pilot:
+            widget = pilot.app.query_one(ResultsList)
+            await pilot.pause()
+            pilot.app.selected.clear()
+
+            for _ in range(10):
+                widget.action_cursor_down()
+            await pilot.pause()
+
+            assert [item.title for item in pilot.app.selected] == ["Movie 10"]
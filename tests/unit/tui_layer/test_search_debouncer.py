@@ -0,0 +1,79 @@
+from streaming_overview_tui.tui_layer.search_debouncer import AdaptiveDebouncer
+from streaming_overview_tui.tui_layer.search_debouncer import (
+    DEFAULT_DEBOUNCE_SECONDS,
+)
+from streaming_overview_tui.tui_layer.search_debouncer import MAX_DEBOUNCE_SECONDS
+from streaming_overview_tui.tui_layer.search_debouncer import MIN_DEBOUNCE_SECONDS
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def type_keys(debouncer: AdaptiveDebouncer, clock: FakeClock, gap: float, count: int):
+    delay = debouncer.keystroke()
+    for _ in range(count - 1):
+        clock.now += gap
+        delay = debouncer.keystroke()
+    return delay
+
+
+class TestAdaptiveDebouncer:
+    def test_first_keystroke_uses_default(self):
+        assert AdaptiveDebouncer(clock=FakeClock()).keystroke() == (
+            DEFAULT_DEBOUNCE_SECONDS
+        )
+
+    def test_bursts_wait_longer(self):
+        clock = FakeClock()
+        delay = type_keys(AdaptiveDebouncer(clock=clock), clock, 0.08, 6)
+        assert delay > DEFAULT_DEBOUNCE_SECONDS
+
+    def test_slow_typing_fires_sooner(self):
+        clock = FakeClock()
+        delay = type_keys(AdaptiveDebouncer(clock=clock), clock, 0.5, 6)
+        assert delay < DEFAULT_DEBOUNCE_SECONDS
+
+    def test_pauses_do_not_count_as_cadence(self):
+        clock = FakeClock()
+        debouncer = AdaptiveDebouncer(clock=clock)
+        type_keys(debouncer, clock, 5.0, 3)
+        assert debouncer.delay == DEFAULT_DEBOUNCE_SECONDS
+
+    def test_fast_backend_fires_sooner_slow_backend_later(self):
+        clock = FakeClock()
+        fast = AdaptiveDebouncer(clock=clock)
+        fast.search_started()
+        clock.now += 0.05
+        fast.search_finished()
+
+        slow = AdaptiveDebouncer(clock=clock)
+        slow.search_started()
+        clock.now += 2.0
+        slow.search_finished()
+
+        assert fast.delay < DEFAULT_DEBOUNCE_SECONDS < slow.delay
+
+    def test_delay_is_bounded(self):
+        clock = FakeClock()
+        debouncer = AdaptiveDebouncer(clock=clock)
+        assert type_keys(debouncer, clock, 0.001, 10) == MAX_DEBOUNCE_SECONDS
+        assert type_keys(debouncer, clock, 0.99, 30) >= MIN_DEBOUNCE_SECONDS
+
+    def test_counts_searches_superseded_by_typing(self):
+        clock = FakeClock()
+        debouncer = AdaptiveDebouncer(clock=clock)
+        debouncer.search_started()
+        debouncer.keystroke()
+        debouncer.keystroke()
+        debouncer.search_finished()
+        debouncer.search_started()
+        debouncer.search_finished()
+        debouncer.keystroke()
+
+        assert debouncer.searches == 2
+        assert debouncer.wasted_searches == 1
@@ -0,0 +1,68 @@
+import base64
+import re
+
+from PIL import Image
+
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import (
+    cell_pixel_size,
+)
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import (
+    DEFAULT_CELL_PIXELS,
+)
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import (
+    detect_graphics_protocol,
+)
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import encode_kitty
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import (
+    GraphicsProtocol,
+)
+from streaming_overview_tui.tui_layer.widgets.terminal_graphics import (
+    resolve_graphics_protocol,
+)
+
+
+class TestDetectGraphicsProtocol:
+    def test_kitty(self):
+        assert detect_graphics_protocol({"KITTY_WINDOW_ID": "1"}) == "kitty"
+        assert detect_graphics_protocol({"TERM": "xterm-kitty"}) == "kitty"
+        assert detect_graphics_protocol({"TERM_PROGRAM": "ghostty"}) == "kitty"
+
+    def test_falls_back_to_half_blocks(self):
+        assert detect_graphics_protocol({}) == GraphicsProtocol.HALF_BLOCKS
+        assert detect_graphics_protocol({"TERM": "xterm-256color"}) == "half-blocks"
+
+    def test_repainting_protocols_use_half_blocks(self):
+        assert detect_graphics_protocol({"TERM_PROGRAM": "iTerm.app"}) == "half-blocks"
+        assert detect_graphics_protocol({"TERM": "foot"}) == "half-blocks"
+
+    def test_multiplexers_use_half_blocks(self):
+        environ = {"KITTY_WINDOW_ID": "1", "TMUX": "/tmp/tmux-0/default"}
+        assert detect_graphics_protocol(environ) == GraphicsProtocol.HALF_BLOCKS
+
+    def test_resolve_setting(self):
+        assert resolve_graphics_protocol("kitty") == GraphicsProtocol.KITTY
+        assert resolve_graphics_protocol("sixel") == GraphicsProtocol.HALF_BLOCKS
+        assert resolve_graphics_protocol("bogus") == GraphicsProtocol.HALF_BLOCKS
+
+
+class TestCellPixelSize:
+    def test_not_a_terminal_uses_default(self, tmp_path):
+        with open(tmp_path / "out", "w") as file:
+            assert cell_pixel_size(file.fileno()) == DEFAULT_CELL_PIXELS
+
+
+class TestEncoders:
+    def test_kitty_sends_png_in_chunks(self):
+        image = Image.effect_noise((200, 300), 100).convert("RGB")
+
+        payload = encode_kitty(image, 12, 18, image_id=7)
+
+        chunks = re.findall(r"\x1b_G([^;]*);([^\x1b]*)\x1b\\", payload)
+        assert len(chunks) > 1
+        assert chunks[0][0].startswith("a=T,f=100,i=7,")
+        assert "c=12,r=18" in chunks[0][0]
+        assert all(control.endswith("m=1") for control, _ in chunks[:-1])
+        assert chunks[-1][0] == "m=0"
+        assert all(len(data) <= 4096 for _, data in chunks)
+        png = base64.b64decode("".join(data for _, data in chunks))
+        assert png.startswith(b"\x89PNG")